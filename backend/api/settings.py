@@ -122,14 +122,6 @@ DATABASES = {
 }
 
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
-    }
-}
-
-
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -235,6 +227,121 @@ CELERY_ENABLE_UTC = True
 CELERY_REDBEAT_REDIS_URL = config("CELERY_REDBEAT_REDIS_URL")
 CELERY_BROKER_POOL_LIMIT = 0
 
+# Redis used by the app itself (scrape dedup, caches, ...). Defaults to the
+# RedBeat instance so no extra infrastructure is needed.
+REDIS_URL = config("REDIS_URL", default=CELERY_REDBEAT_REDIS_URL)
+REDIS_SOCKET_TIMEOUT = config("REDIS_SOCKET_TIMEOUT", default=2.0, cast=float)
+
+# Cache shared by all gunicorn/celery processes in Redis, with a per-process
+# local memory fallback while Redis is unreachable. Bump CACHE_VERSION to
+# invalidate every cached entry at once.
+CACHE_VERSION = config("CACHE_VERSION", default=1, cast=int)
+# Pickled values at least this large are stored zlib-compressed
+CACHE_COMPRESS_MIN_BYTES = config("CACHE_COMPRESS_MIN_BYTES", default=1024, cast=int)
+# Seconds to serve from the local fallback before trying Redis again
+CACHE_REDIS_RETRY_INTERVAL = config("CACHE_REDIS_RETRY_INTERVAL", default=30, cast=int)
+CACHES = {
+    "default": {
+        "BACKEND": "core.cache_backends.FallbackRedisCache",
+        "LOCATION": config("CACHE_REDIS_URL", default=REDIS_URL),
+        "KEY_PREFIX": "cache",
+        "VERSION": CACHE_VERSION,
+        "OPTIONS": {
+            "serializer": "core.cache_backends.CompressedRedisSerializer",
+            "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+            "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        },
+    }
+}
+# Cached API responses are invalidated by model signals as soon as their data
+# changes, so the timeouts only bound how long unused entries linger
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int)
+PRESS_RELEASE_LIST_CACHE_TIMEOUT = config(
+    "PRESS_RELEASE_LIST_CACHE_TIMEOUT", default=60 * 60, cast=int
+)
+# Unfiltered press release counts use the Postgres planner estimate of the
+# listed (active) rows once it is at least this many rows, 0 = always count
+# exactly. Filtered counts are cached per filter signature.
+PAGINATION_ESTIMATE_COUNT_MIN = config(
+    "PAGINATION_ESTIMATE_COUNT_MIN", default=50000, cast=int
+)
+
+# Scraper
+# How initial_pib_scrape_task fans out per-release work:
+#   "thread" - bounded thread pool inside the scrape task
+#   "celery" - one process_single_press_release task per release
+#   "sync"   - one by one (old behaviour, handy for debugging)
+SCRAPE_FANOUT_MODE = config("SCRAPE_FANOUT_MODE", default="thread")
+SCRAPE_CONCURRENCY = config("SCRAPE_CONCURRENCY", default=8, cast=int)
+# BeautifulSoup backend ("lxml" or "html.parser") and whether to only build
+# the subtrees the scraper reads
+SCRAPER_HTML_PARSER = config("SCRAPER_HTML_PARSER", default="lxml")
+SCRAPER_PARSE_ONLY = config("SCRAPER_PARSE_ONLY", default="True") == "True"
+# Async fetch engine used to pull press release pages concurrently
+HTTP_TIMEOUT = config("HTTP_TIMEOUT", default=10.0, cast=float)
+HTTP_MAX_CONNECTIONS = config("HTTP_MAX_CONNECTIONS", default=20, cast=int)
+HTTP_PER_HOST_CONCURRENCY = config("HTTP_PER_HOST_CONCURRENCY", default=8, cast=int)
+# How long a stored URL stays in the Redis seen-URL index (seconds)
+SEEN_URL_TTL = config("SEEN_URL_TTL", default=60 * 60 * 24 * 7, cast=int)
+
+# Translation memo in Redis, keyed by (normalized text hash, language). Entries
+# expire after the TTL; configure Redis with an LRU maxmemory-policy to bound it.
+TRANSLATION_CACHE_TTL = config(
+    "TRANSLATION_CACHE_TTL", default=60 * 60 * 24 * 30, cast=int
+)
+
+# Parsed LLM responses, keyed by (prompt id/version, model, text hash)
+LLM_CACHE_TTL = config("LLM_CACHE_TTL", default=60 * 60 * 24 * 30, cast=int)
+
+# "separate": one LLM call per English section, "combined": one call returning
+# all four sections (sections that fail validation are regenerated separately)
+LLM_GENERATION_MODE = config("LLM_GENERATION_MODE", default="separate")
+# Stream the list sections (simplified, oversimplified, keypoints) and dispatch
+# each point to translation/persistence as soon as it is complete. Applies to
+# the "separate" generation mode.
+LLM_STREAMING = config("LLM_STREAMING", default="False") == "True"
+# Streamed points are translated in batches of this many points per section
+# (one chord of per-language tasks per batch)
+LLM_STREAMING_TRANSLATION_BATCH_SIZE = config(
+    "LLM_STREAMING_TRANSLATION_BATCH_SIZE", default=3, cast=int
+)
+
+# Translation task granularity: "section" = one task per (text type, language),
+# started as soon as each section is ready; "language" = one task per language
+# translating every text type in one batched call once all sections are ready
+TRANSLATION_TASK_GRANULARITY = config("TRANSLATION_TASK_GRANULARITY", default="section")
+
+# Cluster-wide LLM rate limits, shared by all workers through Redis. Keyed by
+# provider or "provider:model"; rpm = requests/minute, tpm = tokens/minute,
+# 0 = unlimited.
+LLM_RATE_LIMITS = {
+    "gemini": {
+        "rpm": config("GEMINI_RPM", default=950, cast=int),
+        "tpm": config("GEMINI_TPM", default=0, cast=int),
+    },
+    "groq": {
+        "rpm": config("GROQ_RPM", default=0, cast=int),
+        "tpm": config("GROQ_TPM", default=0, cast=int),
+    },
+}
+# Completion tokens reserved per call before the real usage is known
+LLM_COMPLETION_TOKENS_ESTIMATE = config(
+    "LLM_COMPLETION_TOKENS_ESTIMATE", default=1000, cast=int
+)
+# Keep-alive connection pool size of each process's LLM SDK client
+LLM_HTTP_MAX_CONNECTIONS = config("LLM_HTTP_MAX_CONNECTIONS", default=10, cast=int)
+
+# LLM providers tried in order for every request, e.g. "groq,gemini" (Groq with
+# Gemini as fallback) or "stub" (offline placeholder replies for tests and
+# benchmarks). Empty = every provider that has an API key, Groq first.
+LLM_PROVIDERS = [
+    name.strip() for name in config("LLM_PROVIDERS", default="").split(",") if name.strip()
+]
+# Requests in flight per provider and process (per thread pool / event loop)
+LLM_MAX_CONCURRENCY = config("LLM_MAX_CONCURRENCY", default=8, cast=int)
+# Simulated reply latency of the stub provider (seconds)
+LLM_STUB_LATENCY = config("LLM_STUB_LATENCY", default=0.0, cast=float)
+
 GEMINI_API_KEY = config("GEMINI_API_KEY", default="")
 GROQ_API_KEY = config("GROQ_API_KEY", default="")
 
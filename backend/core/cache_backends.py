@@ -0,0 +1,98 @@
+import logging
+import time
+import zlib
+import redis
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache, RedisSerializer
+
+logger = logging.getLogger(__name__)
+
+# Marks zlib-compressed values, pickles always start with b"\x80"
+COMPRESSED_PREFIX = b"Z"
+
+
+class CompressedRedisSerializer(RedisSerializer):
+    """Pickles values and zlib-compresses those larger than CACHE_COMPRESS_MIN_BYTES."""
+
+    def dumps(self, obj):
+        data = super().dumps(obj)
+        if isinstance(data, bytes) and len(data) >= settings.CACHE_COMPRESS_MIN_BYTES:
+            return COMPRESSED_PREFIX + zlib.compress(data)
+        return data
+
+    def loads(self, data):
+        if data[:1] == COMPRESSED_PREFIX:
+            data = zlib.decompress(data[1:])
+        return super().loads(data)
+
+
+class FallbackRedisCache(RedisCache):
+    """
+    Redis cache shared by every worker process, backed by a per-process
+    LocMemCache while Redis is unreachable.
+
+    After a Redis error the local cache serves all calls for
+    CACHE_REDIS_RETRY_INTERVAL seconds before Redis is tried again, so an
+    outage costs one connection timeout per interval instead of one per call.
+    """
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._local = LocMemCache(f"fallback-{server}", params)
+        self._retry_at = 0.0
+
+    def _call(self, method, *args, **kwargs):
+        if time.monotonic() >= self._retry_at:
+            try:
+                return getattr(super(), method)(*args, **kwargs)
+            except redis.RedisError as e:
+                self._retry_at = time.monotonic() + settings.CACHE_REDIS_RETRY_INTERVAL
+                logger.warning(f"Redis cache unavailable, using local memory cache: {e}")
+        return getattr(self._local, method)(*args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        return self._call("add", *args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        return self._call("get", *args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        return self._call("set", *args, **kwargs)
+
+    def touch(self, *args, **kwargs):
+        return self._call("touch", *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._call("delete", *args, **kwargs)
+
+    def get_many(self, *args, **kwargs):
+        return self._call("get_many", *args, **kwargs)
+
+    def has_key(self, *args, **kwargs):
+        return self._call("has_key", *args, **kwargs)
+
+    def incr(self, *args, **kwargs):
+        return self._call("incr", *args, **kwargs)
+
+    def set_many(self, *args, **kwargs):
+        return self._call("set_many", *args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        return self._call("delete_many", *args, **kwargs)
+
+    def clear(self):
+        """
+        Deletes this cache's keys only. RedisCache.clear() would FLUSHDB,
+        which also wipes app data kept in the same Redis database.
+        """
+        self._local.clear()
+        if not self.key_prefix:
+            return self._call("clear")
+        try:
+            client = self._cache.get_client(write=True)
+            keys = list(client.scan_iter(match=f"{self.key_prefix}:*", count=1000))
+            for start in range(0, len(keys), 1000):
+                client.delete(*keys[start : start + 1000])
+        except redis.RedisError as e:
+            logger.warning(f"Could not clear Redis cache: {e}")
@@ -5,6 +5,7 @@ from .prompt import (
     OVERSIMPLIFIED_PROMPT,
     SUMMARY_PROMPT,
     KEYPOINTS_PROMPT,
+    COMBINED_PROMPT,
 )
 
 __all__ = [
@@ -12,6 +13,7 @@ __all__ = [
     "OVERSIMPLIFIED_PROMPT",
     "SUMMARY_PROMPT",
     "KEYPOINTS_PROMPT",
+    "COMBINED_PROMPT",
     "LANGUAGE_CHOICES",
     "TEXT_TYPE_CHOICES",
     "MINISTRY_MAP_CONSOLIDATED",
@@ -248,3 +248,40 @@ Output:
 }
 ```
 """
+
+
+# Prompt 6:
+# Runs prompts 1-4 in a single call, built from them so any edit to one of
+# them also changes this prompt (and its LLM cache version).
+COMBINED_PROMPT = f"""
+You are an AI 'Press Release Processor'. Your mission is to analyze a government press release ONCE and complete the four tasks described below, returning all of their outputs together.
+
+Overall Output Structure (JSON):
+The final output MUST be a single valid JSON object with exactly these four keys, each holding the JSON object its task asks for:
+
+```json
+{{
+  "summary": {{ ...output of TASK 1... }},
+  "simplified": {{ ...output of TASK 2... }},
+  "oversimplified": {{ ...output of TASK 3... }},
+  "keypoints": {{ ...output of TASK 4... }}
+}}
+```
+
+Each task below describes its own output as "a single JSON object", place that object under the task's key instead of returning it on its own.
+
+=== TASK 1 (key: "summary") ===
+{SUMMARY_PROMPT}
+
+=== TASK 2 (key: "simplified") ===
+{SIMPLIFIED_PROMPT}
+
+=== TASK 3 (key: "oversimplified") ===
+{OVERSIMPLIFIED_PROMPT}
+
+=== TASK 4 (key: "keypoints") ===
+{KEYPOINTS_PROMPT}
+
+Input: Raw text from a government press release.
+Your Output: A single JSON object with the keys "summary", "simplified", "oversimplified" and "keypoints" as specified above - nothing else.
+"""
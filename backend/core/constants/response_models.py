@@ -1,6 +1,6 @@
 import re
 from pydantic import BaseModel, HttpUrl, field_validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -64,6 +64,15 @@ class KeyPointsResponse(BaseModel):
     key_summary_points: List[KeyPoint]
 
 
+class CombinedResponse(BaseModel):
+    """Model for the combined (all sections in one call) response"""
+
+    summary: SummaryResponse
+    simplified: SimplifiedResponse
+    oversimplified: OversimplifiedResponse
+    keypoints: KeyPointsResponse
+
+
 class PressReleaseMetadata(BaseModel):
     """Model for each press release metadata entry"""
 
@@ -75,7 +84,12 @@ class PressReleaseMetadata(BaseModel):
 class PressReleaseMetadataList(BaseModel):
     """Model for the list of press release metadata"""
 
-    press_releases: List[PressReleaseMetadata]
+    press_releases: List[PressReleaseMetadata] = []
+    # True when the listing did not change since the previous poll
+    unchanged: bool = False
+    # Validators of this poll, saved with save_listing_state once every
+    # listed release has been processed
+    listing_state: Dict[str, str] = {}
 
 
 class PressReleaseContent(BaseModel):
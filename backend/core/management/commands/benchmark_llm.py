@@ -0,0 +1,47 @@
+import asyncio
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from core.utils.ai_processor import SECTIONS, generate_sections
+from core.utils.http_client import run_sync
+from core.utils.llm_providers import get_llm_provider
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark English section generation for many releases: one release at a "
+        "time (threads per section) vs all at once on an asyncio event loop. "
+        "Run with LLM_PROVIDERS=stub (and LLM_STUB_LATENCY) to benchmark offline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--releases", type=int, default=10, help="Releases to generate")
+
+    def handle(self, *args, **options):
+        # Unique texts per run so the LLM cache doesn't serve them
+        run_id = uuid.uuid4().hex
+        texts = [f"Benchmark release {run_id} {i}" for i in range(options["releases"])]
+
+        start = time.perf_counter()
+        for text in texts:
+            generate_sections(f"threads {text}")
+        threads_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        run_sync(self._agenerate_all([f"asyncio {text}" for text in texts]))
+        asyncio_s = time.perf_counter() - start
+
+        self.stdout.write(f"Releases: {len(texts)}")
+        self.stdout.write(f"  Threads, one release at a time: {threads_s:.2f} s")
+        self.stdout.write(f"  Asyncio, all releases at once: {asyncio_s:.2f} s")
+
+    async def _agenerate_all(self, texts):
+        # Straight to the provider, the asyncio path has no LLM cache
+        provider = get_llm_provider()
+        await asyncio.gather(
+            *(
+                provider.agenerate(prompt, text, response_model)
+                for text in texts
+                for prompt, response_model in SECTIONS.values()
+            )
+        )
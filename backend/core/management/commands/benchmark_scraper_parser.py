@@ -0,0 +1,91 @@
+import time
+import tracemalloc
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from core.utils.scraper import parse_press_release_listing, parse_press_release_content
+
+# Small hand-written pages shaped like an Allrel.aspx listing and a press
+# release page. They only smoke-test the command, real pages are much larger,
+# so benchmark numbers need saved PIB pages passed as paths.
+SAMPLE_PAGES = Path(__file__).resolve().parents[2] / "tests" / "pages"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark scraper HTML parsing (parse time and peak memory) on saved PIB pages. "
+        "Pass Allrel.aspx listing pages and/or press release pages, files or directories, "
+        "without any, the small hand-written pages in core/tests/pages are used as "
+        "a smoke test, their timings don't reflect real pages."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            default=[str(SAMPLE_PAGES)],
+            help=(
+                "Saved .html pages or directories of them "
+                "(default: the hand-written sample pages, for a smoke test only)"
+            ),
+        )
+        parser.add_argument(
+            "--parsers",
+            nargs="+",
+            default=["html.parser", "lxml"],
+            help="BeautifulSoup parsers to compare",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per page and mode")
+
+    def handle(self, *args, **options):
+        if options["paths"] == [str(SAMPLE_PAGES)]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "No pages given, timing the hand-written sample pages. "
+                    "Pass saved PIB pages for representative numbers."
+                )
+            )
+        pages = self._load_pages(options["paths"])
+        if not pages:
+            raise CommandError("No .html pages found")
+
+        self.stdout.write(f"Loaded {len(pages)} pages, {options['repeat']} runs each\n")
+        self.stdout.write(f"{'parser':<12} {'mode':<9} {'avg ms/page':>12} {'peak KiB':>10}")
+
+        for parser in options["parsers"]:
+            for strained in (False, True):
+                avg_ms, peak_kib = self._run(pages, parser, strained, options["repeat"])
+                mode = "strained" if strained else "full"
+                self.stdout.write(f"{parser:<12} {mode:<9} {avg_ms:>12.2f} {peak_kib:>10.0f}")
+
+    def _load_pages(self, paths):
+        pages = []
+        for path in map(Path, paths):
+            files = sorted(path.glob("*.htm*")) if path.is_dir() else [path]
+            for file in files:
+                html = file.read_text(encoding="utf-8", errors="replace")
+                # Press release pages have the content div, anything else is a listing
+                if "innner-page-main-about-us-content-right-part" in html:
+                    pages.append((parse_press_release_content, html))
+                else:
+                    pages.append((parse_press_release_listing, html))
+        return pages
+
+    def _run(self, pages, parser, strained, repeat):
+        # Warm up (imports, parser setup) outside of the measurements
+        for parse, html in pages:
+            parse(html, parser=parser, strained=strained)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for parse, html in pages:
+                parse(html, parser=parser, strained=strained)
+        avg_ms = (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+
+        peak = 0
+        for parse, html in pages:
+            tracemalloc.start()
+            parse(html, parser=parser, strained=strained)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        return avg_ms, peak / 1024
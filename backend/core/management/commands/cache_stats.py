@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from core.utils import get_translation_cache_stats, get_llm_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show hit-rate metrics for the Redis-backed processing caches"
+
+    def handle(self, *args, **options):
+        try:
+            translation = get_translation_cache_stats()
+            llm = get_llm_cache_stats()
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Error reading cache stats from Redis: {e}"))
+            return
+
+        for name, stats in (("Translation cache", translation), ("LLM cache", llm)):
+            self.stdout.write(self.style.SUCCESS(name))
+            self.stdout.write(f"  Hits: {stats['hits']}")
+            self.stdout.write(f"  Misses: {stats['misses']}")
+            self.stdout.write(f"  Hit rate: {stats['hit_rate']:.1%}")
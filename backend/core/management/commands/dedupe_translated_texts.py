@@ -0,0 +1,108 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from core.models import TranslatedText
+
+# Text types stored as a single segment, any extra row is a duplicate
+SINGLE_SEGMENT_TEXT_TYPES = ("original", "summary")
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove TranslatedText rows left by earlier (retried or regenerated) runs and "
+        "renumber the newest run's segments of each (press release, language, text "
+        "type) 0..n-1. Rows of one run are created together, a gap of more than "
+        "--batch-gap seconds between created_at values starts a new run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be changed without actually making changes',
+        )
+        parser.add_argument(
+            '--batch-gap',
+            type=int,
+            default=60,
+            help='Seconds between two rows that start a new generation (default: 60)',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        batch_gap = timedelta(seconds=options['batch_gap'])
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING('DRY RUN MODE - No changes will be made')
+            )
+
+        groups = (
+            TranslatedText.objects.values('press_release_id', 'language', 'text_type')
+            .annotate(rows=Count('id'))
+            .filter(rows__gt=1)
+            .order_by()
+        )
+
+        total_deleted = 0
+        total_renumbered = 0
+        for group in groups.iterator():
+            rows = list(
+                TranslatedText.objects.filter(
+                    press_release_id=group['press_release_id'],
+                    language=group['language'],
+                    text_type=group['text_type'],
+                )
+                .order_by('created_at', 'id')
+                .values_list('id', 'ordinal', 'created_at')
+            )
+            keep, delete = self._split_generations(group['text_type'], rows, batch_gap)
+            if not delete:
+                continue
+
+            # New ordinals never exceed the old ones, updating in ascending
+            # order never collides with the unique constraint
+            renumber = [
+                (pk, ordinal) for ordinal, (pk, old_ordinal) in enumerate(keep)
+                if ordinal != old_ordinal
+            ]
+            total_deleted += len(delete)
+            total_renumbered += len(renumber)
+
+            if dry_run:
+                self.stdout.write(
+                    f"Press release {group['press_release_id']} "
+                    f"{group['language']}/{group['text_type']}: "
+                    f"would delete {len(delete)} of {len(rows)} rows"
+                )
+                continue
+
+            with transaction.atomic():
+                TranslatedText.objects.filter(id__in=delete).delete()
+                for pk, ordinal in renumber:
+                    TranslatedText.objects.filter(id=pk).update(ordinal=ordinal)
+
+        action = 'Would delete' if dry_run else 'Deleted'
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {total_deleted} duplicate rows, "
+                f"{total_renumbered} rows renumbered"
+            )
+        )
+
+    def _split_generations(self, text_type, rows, batch_gap):
+        """
+        Returns ([(id, ordinal)] to keep in ordinal order, [id] to delete) from
+        rows ordered by created_at: the newest generation is kept, whatever
+        the content of the rows.
+        """
+        if text_type in SINGLE_SEGMENT_TEXT_TYPES:
+            newest = rows[-1]
+            return [newest[:2]], [row[0] for row in rows[:-1]]
+
+        start = len(rows) - 1
+        while start > 0 and rows[start][2] - rows[start - 1][2] <= batch_gap:
+            start -= 1
+        keep = sorted((row[:2] for row in rows[start:]), key=lambda row: (row[1], row[0]))
+        return keep, [row[0] for row in rows[:start]]
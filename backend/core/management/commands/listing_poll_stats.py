@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from core.utils import get_listing_poll_stats
+
+
+class Command(BaseCommand):
+    help = "Show how many Allrel.aspx polls were skipped because the listing was unchanged"
+
+    def handle(self, *args, **options):
+        try:
+            stats = get_listing_poll_stats()
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Error reading poll stats from Redis: {e}"))
+            return
+
+        polls = int(stats.get("polls", 0))
+        skipped = int(stats.get("skipped", 0))
+        if not polls:
+            self.stdout.write(self.style.WARNING("No polls recorded yet."))
+            return
+
+        self.stdout.write(f"Total polls: {polls}")
+        self.stdout.write(f"Skipped (unchanged): {skipped} ({skipped / polls:.1%})")
+        self.stdout.write(f"  - 304 Not Modified: {stats.get('skipped_not_modified', 0)}")
+        self.stdout.write(f"  - same body hash: {stats.get('skipped_same_hash', 0)}")
+        self.stdout.write(f"Last skipped at: {stats.get('last_skipped_at', '-')}")
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from core.utils import get_llm_client_stats
+
+
+class Command(BaseCommand):
+    help = "Show LLM SDK client creation and per-call overhead, per provider"
+
+    def handle(self, *args, **options):
+        try:
+            stats = get_llm_client_stats()
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Error reading LLM client stats from Redis: {e}"))
+            return
+
+        if not stats:
+            self.stdout.write("No LLM client stats recorded yet")
+            return
+
+        for provider, values in sorted(stats.items()):
+            self.stdout.write(self.style.SUCCESS(provider))
+            self.stdout.write(f"  Clients created: {values.get('clients_created', 0):.0f}")
+            self.stdout.write(f"  Avg client startup: {values['avg_init_ms']:.1f} ms")
+            self.stdout.write(f"  Calls: {values.get('calls', 0):.0f}")
+            self.stdout.write(f"  Avg call time: {values['avg_call_ms']:.1f} ms")
@@ -0,0 +1,70 @@
+from collections import Counter
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from core.models import PressRelease
+from core.tasks import get_translation_coverage, get_missing_translations
+
+# Releases per coverage query
+CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Report which (text type, language) pairs are missing per press release, "
+        "e.g. to plan backfills"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, help='Only releases published in the last N days'
+        )
+        parser.add_argument(
+            '--ids', nargs='+', type=int, help='Only these press release IDs'
+        )
+        parser.add_argument(
+            '--summary-only',
+            action='store_true',
+            help='Only print the totals, not every incomplete release',
+        )
+
+    def handle(self, *args, **options):
+        releases = PressRelease.objects.order_by('-date_published')
+        if options['days']:
+            releases = releases.filter(
+                date_published__gte=timezone.now() - timedelta(days=options['days'])
+            )
+        if options['ids']:
+            releases = releases.filter(id__in=options['ids'])
+        releases = list(releases.values_list('id', 'source_url'))
+
+        incomplete = 0
+        missing_pairs = Counter()
+        for start in range(0, len(releases), CHUNK_SIZE):
+            chunk = releases[start : start + CHUNK_SIZE]
+            coverage = get_translation_coverage([pr_id for pr_id, _ in chunk])
+            for pr_id, source_url in chunk:
+                missing = {
+                    text_type: languages
+                    for text_type, languages in get_missing_translations(coverage[pr_id]).items()
+                    if languages
+                }
+                if not missing:
+                    continue
+                incomplete += 1
+                for text_type, languages in missing.items():
+                    missing_pairs.update((text_type, language) for language in languages)
+                if not options['summary_only']:
+                    details = '; '.join(
+                        f"{text_type}: {', '.join(languages)}"
+                        for text_type, languages in missing.items()
+                    )
+                    self.stdout.write(f"{pr_id} {source_url} - missing {details}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(releases) - incomplete} of {len(releases)} press releases fully covered"
+            )
+        )
+        for (text_type, language), count in sorted(missing_pairs.items()):
+            self.stdout.write(f"  {text_type}/{language}: missing in {count} releases")
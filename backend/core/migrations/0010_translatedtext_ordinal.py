@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+
+def number_segments(apps, schema_editor):
+    """
+    Gives existing rows ordinals 0..n-1 per (press release, language, text type)
+    in insertion order, so the unique constraint can be added. Duplicates left
+    by retries end up with their own ordinals, dedupe_translated_texts removes them.
+    """
+    TranslatedText = apps.get_model('core', 'TranslatedText')
+    rows = TranslatedText.objects.annotate(
+        position=Window(
+            RowNumber(),
+            partition_by=[F('press_release_id'), F('language'), F('text_type')],
+            order_by=F('id').asc(),
+        )
+    ).values_list('id', 'position')
+
+    batch = []
+    for pk, position in rows.iterator(chunk_size=2000):
+        if position > 1:
+            batch.append(TranslatedText(id=pk, ordinal=position - 1))
+        if len(batch) >= 1000:
+            TranslatedText.objects.bulk_update(batch, ['ordinal'])
+            batch = []
+    TranslatedText.objects.bulk_update(batch, ['ordinal'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_pressrelease_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translatedtext',
+            name='ordinal',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(number_segments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_translatedtext_ordinal'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='translatedtext',
+            constraint=models.UniqueConstraint(fields=('press_release', 'language', 'text_type', 'ordinal'), name='unique_translated_text_segment'),
+        ),
+    ]
@@ -97,6 +97,8 @@ class TranslatedText(models.Model):
         choices=[choice["choice"] for choice in TEXT_TYPE_CHOICES],
         db_index=True
     )
+    # Position of the segment (point) within its text type, 0 for single texts
+    ordinal = models.PositiveIntegerField(default=0)
     content = models.TextField()
     title = models.CharField(max_length=500, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -106,7 +108,12 @@ class TranslatedText(models.Model):
         indexes = [
             models.Index(fields=['press_release', 'language', 'text_type']),
         ]
-        constraints = []
+        constraints = [
+            models.UniqueConstraint(
+                fields=['press_release', 'language', 'text_type', 'ordinal'],
+                name='unique_translated_text_segment',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.press_release.title} - {self.language.upper()} - {self.text_type.title()}"
@@ -1,4 +1,28 @@
-from rest_framework.pagination import PageNumberPagination
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from functools import cached_property, partial
+from typing import Optional
+import json
+import logging
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connection
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from .utils.response_cache import (
+    AUDIENCE_TYPES,
+    CATEGORIES,
+    MINISTRIES,
+    PRESS_RELEASES,
+    response_cache_key,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -9,3 +33,189 @@ class CustomPageNumberPagination(PageNumberPagination):
 
     page_size = 6  # Default page size
     page_size_query_param = "page_size"  # Allow client to override page size
+    max_page_size = 100
+
+
+def estimate_row_count(queryset) -> Optional[int]:
+    """
+    Planner row estimate of the queryset from EXPLAIN, so its filters (e.g.
+    active=True) are applied to the table statistics kept up to date by
+    (auto)ANALYZE. None on other databases.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.query.sql_with_params()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+    except DatabaseError as e:
+        logger.warning(f"Could not estimate row count of {queryset.model._meta.db_table}: {e}")
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def cached_count(queryset, tags) -> int:
+    """
+    COUNT(*) of the queryset, cached under its SQL until one of the tags is
+    invalidated, so every page of the same filters shares one count.
+    """
+    sql, params = queryset.query.sql_with_params()
+    cache_key = response_cache_key("count", f"{sql} {params!r}", tags)
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(cache_key, count, settings.RESPONSE_CACHE_TIMEOUT)
+    return count
+
+
+class CheapCountPaginator(Paginator):
+    """
+    Paginator counting count_queryset (the listed rows without annotations,
+    prefetches or ordering) instead of the page queryset. Counts without
+    request filters that the planner estimates at PAGINATION_ESTIMATE_COUNT_MIN
+    rows or more use that estimate, the others are cached per filter signature.
+    """
+
+    def __init__(self, object_list, per_page, count_queryset=None, filtered=True, count_tags=(), **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_queryset = count_queryset
+        self.filtered = filtered
+        self.count_tags = count_tags
+
+    @cached_property
+    def count(self):
+        if self.count_queryset is None:
+            return super().count
+
+        if not self.filtered and settings.PAGINATION_ESTIMATE_COUNT_MIN:
+            estimate = estimate_row_count(self.count_queryset)
+            if estimate is not None and estimate >= settings.PAGINATION_ESTIMATE_COUNT_MIN:
+                return estimate
+        return cached_count(self.count_queryset, self.count_tags)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Newest-first cursor pagination on (date_published, id).
+
+    Each page is a range scan on the date_published index starting after the
+    last row of the previous page, so deep pages cost the same as the first
+    one and no COUNT(*) is run. Only forward (next) links are returned.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = CustomPageNumberPagination.page_size
+    page_size_query_param = CustomPageNumberPagination.page_size_query_param
+    max_page_size = CustomPageNumberPagination.max_page_size
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by("-date_published", "-id")
+        if position is not None:
+            date_published, pk = position
+            queryset = queryset.filter(
+                Q(date_published__lt=date_published)
+                | Q(date_published=date_published, id__lt=pk)
+            )
+
+        # One extra row tells whether there is a next page
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        """Returns (date_published, id) from the cursor parameter, None for the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw_date, raw_pk = urlsafe_b64decode(encoded.encode("ascii")).decode("ascii").split("|")
+            date_published = parse_datetime(raw_date)
+            pk = int(raw_pk)
+        except (BinasciiError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if date_published is None:
+            raise NotFound(self.invalid_cursor_message)
+        return date_published, pk
+
+    def encode_cursor(self, instance):
+        raw = f"{instance.date_published.isoformat()}|{instance.pk}"
+        return urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "previous": None, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class PressReleasePagination(CustomPageNumberPagination):
+    """
+    Page numbers by default, keyset pages (KeysetPagination) when the request
+    has a cursor parameter. Infinite-scroll clients start with ?cursor= and
+    follow the next links.
+    """
+
+    cursor_query_param = KeysetPagination.cursor_query_param
+    count_tags = (PRESS_RELEASES, MINISTRIES, CATEGORIES, AUDIENCE_TYPES)
+    count_queryset = None
+    count_filtered = True
+
+    @property
+    def django_paginator_class(self):
+        return partial(
+            CheapCountPaginator,
+            count_queryset=self.count_queryset,
+            filtered=self.count_filtered,
+            count_tags=self.count_tags,
+        )
+
+    def set_count_queryset(self, queryset, filtered=True):
+        """Counts page-number results on queryset, see CheapCountPaginator."""
+        self.count_queryset = queryset
+        self.count_filtered = filtered
+
+    def uses_cursor(self, request):
+        return self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = KeysetPagination() if self.uses_cursor(request) else None
+        if self.keyset is not None:
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,63 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .models import AudienceType, Category, Ministry, PressRelease
+from .utils.response_cache import (
+    AUDIENCE_TYPES,
+    CATEGORIES,
+    MINISTRIES,
+    PRESS_RELEASES,
+    invalidate_tags,
+)
+
+# Cached API responses are invalidated here, on commit, so they can use long
+# TTLs. QuerySet.update() and bulk_create() bypass these signals.
+MODEL_TAGS = {
+    Ministry: MINISTRIES,
+    Category: CATEGORIES,
+    AudienceType: AUDIENCE_TYPES,
+}
+
+
+def _invalidate_on_commit(*tags):
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+@receiver(post_save, sender=Ministry)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=AudienceType)
+@receiver(post_delete, sender=Ministry)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=AudienceType)
+def metadata_changed(sender, **kwargs):
+    _invalidate_on_commit(MODEL_TAGS[sender])
+
+
+@receiver(pre_save, sender=PressRelease)
+def press_release_saving(sender, instance, **kwargs):
+    # Remember whether the release was listed before this save
+    instance._was_active = bool(
+        instance.pk
+        and PressRelease.objects.filter(pk=instance.pk, active=True).exists()
+    )
+
+
+@receiver(post_save, sender=PressRelease)
+def press_release_saved(sender, instance, **kwargs):
+    # Inactive releases are not listed, scraping and translating them leaves
+    # cached responses alone until set_press_release_active saves them.
+    # Deactivating a release has to drop it from the cached lists.
+    if instance.active or getattr(instance, "_was_active", False):
+        _invalidate_on_commit(PRESS_RELEASES)
+
+
+@receiver(post_delete, sender=PressRelease)
+def press_release_deleted(sender, instance, **kwargs):
+    _invalidate_on_commit(PRESS_RELEASES)
+
+
+@receiver(m2m_changed, sender=PressRelease.audience_type.through)
+@receiver(m2m_changed, sender=PressRelease.category.through)
+def press_release_tags_changed(sender, instance, action, **kwargs):
+    if action.startswith("post_") and getattr(instance, "active", True):
+        _invalidate_on_commit(PRESS_RELEASES)
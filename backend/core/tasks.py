@@ -1,21 +1,40 @@
 from celery import shared_task, group, chord
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from itertools import chain
+from typing import Optional, List, Dict, Any, Tuple
+from django import db
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.conf import settings
 from .models import PressRelease, TranslatedText, Ministry
 from .utils import (
     get_press_release_content,
+    get_press_release_contents,
     get_press_release_metadata,
-    generate_simplified_text,
-    generate_oversimplified_text,
-    generate_summary,
-    generate_keypoints,
-    translate_text_gemini,
+    iter_sections,
+    iter_section_events,
+    translate_texts_gemini,
+    filter_seen_urls,
+    mark_urls_seen,
+    save_listing_state,
+    get_redis,
 )
-from .constants import LANGUAGE_CHOICES
+from .constants import LANGUAGE_CHOICES, TEXT_TYPE_CHOICES
+from .constants.response_models import PressReleaseContent
 import logging
+import time
+import redis
 
 
 logger = logging.getLogger(__name__)
 
+# Max number of URLs per "source_url IN (...)" dedup query
+DEDUP_CHUNK_SIZE = 500
+# Safety expiry of the per-release activation latch
+ACTIVATION_LATCH_TTL = 60 * 60 * 24
+TEXT_TYPES = [choice["choice"][0] for choice in TEXT_TYPE_CHOICES]
+
 # --- Helper Functions (can remain in .utils or be moved to a dedicated .services file) ---
 
 
@@ -25,65 +44,244 @@ def _save_translated_text_data(
     text_type: str,
     content: str,
     title: Optional[str] = None,
+    ordinal: int = 0,
+) -> None:
+    """Helper function to save (or overwrite) one translated text segment."""
+    _bulk_save_translated_texts(
+        press_release.id, language, text_type, [(ordinal, content, title)]
+    )
+
+
+def _bulk_save_translated_texts(
+    pr_id: int,
+    language: str,
+    text_type: str,
+    rows: List[Tuple[int, str, Optional[str]]],
 ) -> None:
-    """Helper function to save translated text to database."""
-
-    TranslatedText.objects.create(
-        press_release=press_release,
-        language=language,
-        text_type=text_type,
-        content=content,
-        title=title,
+    """
+    Upserts (ordinal, content, title) rows of one (release, language, text_type)
+    with a single INSERT ... ON CONFLICT statement.
+
+    Segments are unique per (release, language, text_type, ordinal), so a
+    retried task overwrites what an earlier attempt saved instead of adding
+    duplicate rows.
+    """
+    _upsert_translated_texts(
+        [
+            TranslatedText(
+                press_release_id=pr_id,
+                language=language,
+                text_type=text_type,
+                ordinal=ordinal,
+                content=content,
+                title=title,
+            )
+            for ordinal, content, title in rows
+        ]
     )
 
 
+def _upsert_translated_texts(
+    texts: List[TranslatedText],
+    section_sizes: Optional[Dict[Tuple[int, str, str], int]] = None,
+) -> None:
+    """
+    Saves any mix of unsaved TranslatedText segments with one upsert statement.
+
+    section_sizes maps the (release, language, text_type) sections written in
+    full to their number of segments. Rows at or past that ordinal, left over
+    by a longer earlier run, are deleted in the same transaction.
+    """
+    if not section_sizes:
+        _bulk_upsert(texts)
+        return
+
+    stale = Q()
+    for (pr_id, language, text_type), size in section_sizes.items():
+        stale |= Q(
+            press_release_id=pr_id,
+            language=language,
+            text_type=text_type,
+            ordinal__gte=size,
+        )
+    with transaction.atomic():
+        _bulk_upsert(texts)
+        TranslatedText.objects.filter(stale).delete()
+
+
+def _bulk_upsert(texts: List[TranslatedText]) -> None:
+    TranslatedText.objects.bulk_create(
+        texts,
+        update_conflicts=True,
+        unique_fields=["press_release", "language", "text_type", "ordinal"],
+        update_fields=["content", "title", "updated_at"],
+    )
+
+
+def _section_sizes(texts: List[TranslatedText]) -> Dict[Tuple[int, str, str], int]:
+    """Number of segments per (release, language, text_type) of full-section texts."""
+    return Counter((text.press_release_id, text.language, text.text_type) for text in texts)
+
+
+def _filter_unseen_press_releases(press_releases: List[Any]) -> List[Any]:
+    """
+    Drop metadata entries whose URL is already stored. The Redis seen-URL
+    index is consulted first, the remaining URLs are resolved against the
+    database in a few chunked queries.
+    """
+    start = time.monotonic()
+    urls = list(dict.fromkeys(str(meta.url) for meta in press_releases))
+
+    indexed_urls = filter_seen_urls(urls)
+    db_urls = [u for u in urls if u not in indexed_urls]
+
+    stored_urls = set()
+    for i in range(0, len(db_urls), DEDUP_CHUNK_SIZE):
+        stored_urls.update(
+            PressRelease.objects.filter(
+                source_url__in=db_urls[i : i + DEDUP_CHUNK_SIZE]
+            ).values_list("source_url", flat=True)
+        )
+    mark_urls_seen(stored_urls)
+    existing_urls = indexed_urls | stored_urls
+
+    unseen = []
+    queued_urls = set()
+    for meta in press_releases:
+        meta_url = str(meta.url)
+        if meta_url in existing_urls or meta_url in queued_urls:
+            continue
+        queued_urls.add(meta_url)
+        unseen.append(meta)
+
+    elapsed_ms = (time.monotonic() - start) * 1000
+    logger.info(
+        f"Dedup: {len(press_releases)} scraped, {len(press_releases) - len(unseen)} "
+        f"skipped ({len(indexed_urls)} via Redis index), {len(unseen)} new "
+        f"({elapsed_ms:.1f} ms)"
+    )
+    return unseen
+
+
+def _process_release_in_thread(meta: Any, content_data: PressReleaseContent) -> bool:
+    """
+    Process a release whose page was already fetched, inside a pool thread.
+    Returns whether the release was stored.
+    """
+    url = str(meta.url)
+    try:
+        logger.info(f"Processing press release: {url}")
+        return process_press_release_content(url, meta.ministry, content_data) is not None
+    except Exception as exc:
+        logger.error(f"Failed to process press release {url}: {exc}", exc_info=True)
+        return False
+    finally:
+        # Every thread gets its own DB connection, don't leak them
+        db.connection.close()
+
+
+def _fan_out_press_releases(
+    press_releases: List[Any], listing_state: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    Dispatch per-release processing according to SCRAPE_FANOUT_MODE.
+
+    listing_state is saved (see save_listing_state) only once every release
+    has been stored, so releases that failed are retried by the next poll.
+
+    Returns the number of releases processed (or dispatched, in "celery" mode).
+    """
+    mode = settings.SCRAPE_FANOUT_MODE
+    if not press_releases:
+        save_listing_state(listing_state)
+        return 0
+
+    if mode == "celery":
+        # Let the worker pool do the fan-out, concurrency is bounded by
+        # the number of worker processes consuming the queue
+        tasks = group(
+            process_single_press_release.s(str(meta.url), meta.ministry)
+            for meta in press_releases
+        )
+        if listing_state:
+            chord(tasks)(save_listing_state_when_processed.s(listing_state))
+        else:
+            tasks.apply_async()
+        logger.info(f"Dispatched {len(press_releases)} press releases to workers")
+        return len(press_releases)
+
+    if mode == "thread":
+        max_workers = max(1, min(settings.SCRAPE_CONCURRENCY, len(press_releases)))
+        logger.info(
+            f"Processing {len(press_releases)} press releases with {max_workers} threads"
+        )
+        # Pull the whole batch of pages concurrently up front
+        contents = get_press_release_contents(str(meta.url) for meta in press_releases)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda meta: _process_release_in_thread(meta, contents[str(meta.url)]),
+                press_releases,
+            )
+            processed_count = sum(1 for ok in results if ok)
+    else:
+        processed_count = 0
+        for release_meta in press_releases:
+            logger.info(
+                f"Processing press release {processed_count + 1}: {release_meta.url}"
+            )
+            if process_single_press_release(str(release_meta.url), release_meta.ministry):
+                processed_count += 1
+                logger.info(f"Successfully processed press release: {release_meta.url}")
+
+    if processed_count == len(press_releases):
+        save_listing_state(listing_state)
+    else:
+        logger.info(
+            f"{len(press_releases) - processed_count} press releases failed, "
+            "the listing will be processed again on the next poll"
+        )
+    return processed_count
+
+
 # --- Celery Tasks ---
 
 @shared_task(bind=True)
-def initial_pib_scrape_task(self, limit=None, url=None):
+def initial_pib_scrape_task(self, limit=None, url=None, force=False):
     """
-    Step 1: Scrapes metadata for new press releases and processes
-    them one by one synchronously.
+    Step 1: Scrapes metadata for new press releases and fans them out for
+    processing (see SCRAPE_FANOUT_MODE). Polls where the listing did not
+    change are skipped unless force is set.
     """
     logger.info("Starting initial PIB scrape task...")
     try:
-        releases_metadata = get_press_release_metadata()
+        releases_metadata = get_press_release_metadata(
+            force=force or url is not None
+        )
     except Exception as exc:
         logger.error(f"Failed to get press release metadata: {exc}", exc_info=True)
         raise self.retry(
             exc=exc, countdown=self.request.retries * 60
         )  # Exponential backoff
 
+    if releases_metadata.unchanged:
+        logger.info("Press release listing unchanged, nothing to do.")
+        return
+
     if limit is not None:
         releases_metadata.press_releases = releases_metadata.press_releases[:limit]
 
-    processed_count = 0
-    for release_meta in releases_metadata.press_releases:
-        if url is not None and str(release_meta.url) != url:
-            continue
-
-        # Check if URL exists in DB before processing
-        if PressRelease.objects.filter(source_url=str(release_meta.url)).exists():
-            logger.info(
-                f"Press Release with URL {release_meta.url} already exists. Skipping."
-            )
-            continue
+    candidates = [
+        release_meta
+        for release_meta in releases_metadata.press_releases
+        if url is None or str(release_meta.url) == url
+    ]
+    pending = _filter_unseen_press_releases(candidates)
 
-        # Process each press release synchronously, one by one
-        try:
-            logger.info(
-                f"Processing press release {processed_count + 1}: {release_meta.url}"
-            )
-            process_single_press_release(str(release_meta.url), release_meta.ministry)
-            processed_count += 1
-            logger.info(f"Successfully processed press release: {release_meta.url}")
-        except Exception as exc:
-            logger.error(
-                f"Failed to process press release {release_meta.url}: {exc}",
-                exc_info=True,
-            )
-            # Continue with the next one instead of failing the entire task
-            continue
+    # A partial run must not mark the listing as processed
+    listing_state = None
+    if limit is None and url is None:
+        listing_state = releases_metadata.listing_state
+    processed_count = _fan_out_press_releases(pending, listing_state)
 
     logger.info(
         f"Completed initial PIB scrape task. Processed {processed_count} new press releases."
@@ -100,175 +298,331 @@ def process_single_press_release(
 ):
     """
     Step 2: Fetches content for a single press release, generates English variations,
-    and then dispatches translation tasks.
+    and then dispatches translation tasks. Returns whether the release was stored.
     """
     logger.info(f"Processing single press release: {url}")
     try:
         content_data = get_press_release_content(url)
+        pr = process_press_release_content(
+            url, ministry_name, content_data, date_published, pib_hq
+        )
+        return pr is not None
+    except Exception as exc:
+        logger.error(f"Error processing press release {url}: {exc}", exc_info=True)
+        return False
 
-        if not content_data or not content_data.content:
-            logger.warning(f"No content found for URL: {url}. Skipping.")
-            return
-
-        if content_data.date_published:
-            date_published = content_data.date_published
 
-        if content_data.pib_hq:
-            pib_hq = content_data.pib_hq
+@shared_task(bind=True)
+def save_listing_state_when_processed(self, results: List[bool], listing_state: Dict[str, str]):
+    """Chord callback of the "celery" fan-out, see _fan_out_press_releases."""
+    if all(results):
+        save_listing_state(listing_state)
+    else:
+        logger.info(
+            f"{results.count(False)} press releases failed, "
+            "the listing will be processed again on the next poll"
+        )
 
-        original_text = content_data.content
 
-        summary = generate_summary(original_text)
-        headline = summary.headline
+def process_press_release_content(
+    url: str,
+    ministry_name: str,
+    content_data: PressReleaseContent,
+    date_published: Optional[str] = None,
+    pib_hq: Optional[str] = None,
+):
+    """
+    Generates English variations for already fetched press release content,
+    saves the press release and dispatches translation tasks.
 
-        # Create Ministry object if it doesn't exist
-        ministry_obj, _ = Ministry.objects.get_or_create(name=ministry_name)
+    Returns the press release, or None when there was no content to process.
+    """
+    if not content_data or not content_data.content:
+        logger.warning(f"No content found for URL: {url}. Skipping.")
+        return
+
+    if content_data.date_published:
+        date_published = content_data.date_published
+
+    if content_data.pib_hq:
+        pib_hq = content_data.pib_hq
+
+    original_text = content_data.content
+
+    # Sections are generated concurrently and come back as soon as each is
+    # ready (point by point when streaming), the summary is needed first to
+    # create the press release. Per-language tasks need every section anyway,
+    # so they don't stream.
+    per_language = settings.TRANSLATION_TASK_GRANULARITY == "language"
+    if settings.LLM_STREAMING and not per_language:
+        events = iter_section_events(original_text)
+    else:
+        events = (
+            (name, "section", response) for name, response in iter_sections(original_text)
+        )
+    ready = []
+    for event in events:
+        if event[0] == "summary":
+            break
+        ready.append(event)
+    summary = event[2]
+    headline = summary.headline
+
+    # Create Ministry object if it doesn't exist
+    ministry_obj, _ = Ministry.objects.get_or_create(name=ministry_name)
+
+    # Create PressRelease object (if not already created by another parallel task)
+    # Use get_or_create for idempotence in case of retries/race conditions
+    pr, created = PressRelease.objects.get_or_create(
+        source_url=url,  # Use source_url as unique identifier for get_or_create
+        defaults={
+            "title": headline,
+            "original_text": original_text,
+            "ministry": ministry_obj,
+            "date_published": date_published,  # Pass direct here
+            "pib_hq": pib_hq,  # Pass direct here
+            # active defaults to False in the model
+        },
+    )
 
-        # Create PressRelease object (if not already created by another parallel task)
-        # Use get_or_create for idempotence in case of retries/race conditions
-        pr, created = PressRelease.objects.get_or_create(
-            source_url=url,  # Use source_url as unique identifier for get_or_create
-            defaults={
-                "title": headline,
-                "original_text": original_text,
-                "ministry": ministry_obj,
-                "date_published": date_published,  # Pass direct here
-                "pib_hq": pib_hq,  # Pass direct here
-                # active defaults to False in the model
-            },
+    if not created:
+        logger.info(
+            f"PressRelease for URL {url} already existed. Proceeding with translations."
         )
 
-        if not created:
-            logger.info(
-                f"PressRelease for URL {url} already existed. Proceeding with translations."
-            )
+    # Save original English content (first)
+    _save_translated_text_data(pr, "en", "original", original_text)
+    _save_translated_text_data(
+        pr, "en", "summary", summary.eye_catching_summary_sentence, title=headline
+    )
 
-        # Save original English content (first)
-        _save_translated_text_data(pr, "en", "original", original_text)
-        _save_translated_text_data(
-            pr, "en", "summary", summary.eye_catching_summary_sentence, title=headline
+    # Start each section's (or point's) translations as soon as it is ready,
+    # the release is set active once every dispatched batch has finished
+    latched = _open_activation_latch(pr.id)
+    deferred_tasks = []
+    # Work plan from one coverage query, taken before any point is saved
+    missing_languages = get_missing_translations(
+        get_translation_coverage([pr.id])[pr.id]
+    )
+    if per_language:
+        # One task per language covering every section
+        sections = {name: payload for name, _, payload in chain([event], ready, events)}
+        texts = [
+            text
+            for name, response in sections.items()
+            if name != "summary"  # already saved
+            for text in _english_texts(pr.id, name, _section_items(name, response))
+        ]
+        _upsert_translated_texts(texts, _section_sizes(texts))
+        _dispatch_translation_chord(
+            pr.id, _build_language_tasks(pr, missing_languages), latched, deferred_tasks
         )
+    else:
+        # Streamed points of each section waiting for a full batch
+        pending_points = {}
+        for name, kind, payload in chain([event], ready, events):
+            if kind == "point":
+                # Streamed points are saved and translated in batches, one
+                # chord per point would multiply the task overhead
+                pending_points.setdefault(name, []).append(payload)
+                if len(pending_points[name]) < settings.LLM_STREAMING_TRANSLATION_BATCH_SIZE:
+                    continue
+                batch = pending_points.pop(name)
+            elif kind == "end":
+                # Segments past the streamed section are left over from a
+                # longer earlier run, in every language
+                TranslatedText.objects.filter(
+                    press_release=pr, text_type=name, ordinal__gte=payload
+                ).delete()
+                batch = pending_points.pop(name, [])
+                if not batch:
+                    continue
+
+            if kind == "section":
+                items, ordinal, ordinals = _section_items(name, payload), 0, None
+            else:
+                ordinal = batch[0][0]
+                items = [_section_item(name, point) for _, point in batch]
+                ordinals = [point_ordinal for point_ordinal, _ in batch]
+            if name != "summary":  # already saved
+                texts = _english_texts(pr.id, name, items, ordinal)
+                _upsert_translated_texts(texts, None if ordinals else _section_sizes(texts))
+
+            _dispatch_translation_chord(
+                pr.id,
+                [
+                    process_and_save_translated_batch.s(pr.id, lang_code, name, ordinals)
+                    for lang_code in missing_languages[name]
+                    if lang_code != "en"
+                ],
+                latched,
+                deferred_tasks,
+            )
 
-        # Generate all text variations upfront to avoid scope issues
-        simplified_text = generate_simplified_text(original_text)
-        oversimplified_text = generate_oversimplified_text(original_text)
-        keypoints = generate_keypoints(original_text)
+    _finish_translation_dispatch(pr.id, latched, deferred_tasks)
+    return pr
 
-        # Build a group of tasks for processing and translating different text types
-        translation_tasks = []
 
-        # English-specific processing and saving
-        if not is_text_type_present(pr, "simplified", "en"):
-            translation_tasks.append(
-                process_and_save_translated_batch.s(
-                    pr.id,
-                    "en",
-                    "simplified",
-                    [
-                        {"content": text.description_html, "title": text.title}
-                        for text in simplified_text.summary_points
-                    ],
-                    translate_content=False,
-                    title_key="title",
-                )
-            )
+def _dispatch_translation_chord(
+    pr_id: int, translation_tasks: List[Any], latched: bool, deferred_tasks: List[Any]
+) -> None:
+    """
+    Starts translation_tasks as a chord that releases the activation latch
+    when done. When the latch can't be used they are added to deferred_tasks
+    instead, see _finish_translation_dispatch.
+    """
+    if not translation_tasks:
+        return
+    if latched and _hold_activation_latch(pr_id):
+        chord(translation_tasks)(release_activation_latch.si(pr_id))
+    else:
+        deferred_tasks.extend(translation_tasks)
+
+
+def _finish_translation_dispatch(pr_id: int, latched: bool, deferred_tasks: List[Any]) -> None:
+    """
+    Drops the dispatcher's hold on the activation latch once every section
+    has been dispatched. Tasks deferred while Redis was unavailable run as one
+    chord that sets the release active (or releases the latch) when done, so
+    the release never goes active before its translations finished.
+    """
+    if deferred_tasks:
+        # The dispatcher's own hold on the latch is handed to this chord
+        if latched:
+            callback = release_activation_latch.si(pr_id)
+        else:
+            callback = set_press_release_active.si(pr_id)
+        chord(deferred_tasks)(callback)
+    elif latched:
+        release_activation_latch.delay(pr_id)
+    else:
+        # Nothing was dispatched, there is nothing to wait for
+        set_press_release_active.delay(pr_id)
+
+
+def _section_item(text_type: str, point: Any) -> Dict[str, Any]:
+    """Returns the content/title of one point of a generated point-list section."""
+    if text_type == "simplified":
+        return {"content": point.description_html, "title": point.title}
+    if text_type == "oversimplified":
+        return {"content": point.story_html, "title": point.title}
+    return {"content": point.point, "title": None}
+
+
+def _section_items(text_type: str, response: Any) -> List[Dict[str, Any]]:
+    """Returns the content/title items of a generated section."""
+    if text_type == "summary":
+        return [
+            {"content": response.eye_catching_summary_sentence, "title": response.headline}
+        ]
+    if text_type == "simplified":
+        points = response.summary_points
+    elif text_type == "oversimplified":
+        points = response.story_points
+    else:
+        points = response.key_summary_points
+    return [_section_item(text_type, point) for point in points]
+
+
+def _english_texts(
+    pr_id: int, text_type: str, items: List[Dict[str, Any]], first_ordinal: int = 0
+) -> List[TranslatedText]:
+    return [
+        TranslatedText(
+            press_release_id=pr_id,
+            language="en",
+            text_type=text_type,
+            ordinal=ordinal,
+            content=item["content"],
+            title=item["title"],
+        )
+        for ordinal, item in enumerate(items, start=first_ordinal)
+    ]
 
-        if not is_text_type_present(pr, "oversimplified", "en"):
-            translation_tasks.append(
-                process_and_save_translated_batch.s(
-                    pr.id,
-                    "en",
-                    "oversimplified",
-                    [
-                        {"content": text.story_html, "title": text.title}
-                        for text in oversimplified_text.story_points
-                    ],
-                    translate_content=False,
-                    title_key="title",
-                )
-            )
 
-        if not is_text_type_present(pr, "keypoints", "en"):
+def _build_language_tasks(
+    pr: PressRelease, missing_languages: Dict[str, List[str]]
+) -> List[Any]:
+    """Builds one task per target language, translating every text type missing in it."""
+    translation_tasks = []
+    for lang_code, _ in LANGUAGE_CHOICES:
+        if lang_code == "en":
+            continue
+        text_types = [
+            text_type
+            for text_type, languages in missing_languages.items()
+            if lang_code in languages
+        ]
+        if text_types:
             translation_tasks.append(
-                process_and_save_translated_batch.s(
-                    pr.id,
-                    "en",
-                    "keypoints",
-                    [{"content": text.point} for text in keypoints.key_summary_points],
-                    translate_content=False,
-                )
+                translate_release_language.s(pr.id, lang_code, text_types)
             )
+    return translation_tasks
+
+
+# --- Activation latch ---
+# Counts the translation chords still running for a release (plus one held by
+# the dispatching task), whoever brings it to zero sets the release active.
+
+
+def _activation_latch_key(pr_id: int) -> str:
+    return f"press_release:{pr_id}:pending_sections"
+
+
+def _open_activation_latch(pr_id: int) -> bool:
+    """Returns False when Redis is unavailable and the latch can't be used."""
+    try:
+        get_redis().set(_activation_latch_key(pr_id), 1, ex=ACTIVATION_LATCH_TTL)
+        return True
+    except redis.RedisError as e:
+        logger.warning(f"Could not open activation latch for {pr_id}: {e}")
+        return False
 
-        # Translation for other languages
-        for lang_code, _ in LANGUAGE_CHOICES:
-            if lang_code == "en":
-                continue
-
-            # check if the summary exists
-            if not is_text_type_present(pr, "summary", lang_code):
-                translation_tasks.append(
-                    translate_and_save_text.s(
-                        pr.id,
-                        lang_code,
-                        "summary",
-                        summary.eye_catching_summary_sentence,
-                        title=headline,  # Pass headline for consistent saving
-                    )
-                )
-
-            # check if the simplified exists
-            if not is_text_type_present(pr, "simplified", lang_code):
-                translation_tasks.append(
-                    process_and_save_translated_batch.s(
-                        pr.id,
-                        lang_code,
-                        "simplified",
-                        [
-                            {"content": text.description_html, "title": text.title}
-                            for text in simplified_text.summary_points
-                        ],
-                        title_key="title",
-                    )
-                )
-
-            # check if the oversimplified exists
-            if not is_text_type_present(pr, "oversimplified", lang_code):
-                translation_tasks.append(
-                    process_and_save_translated_batch.s(
-                        pr.id,
-                        lang_code,
-                        "oversimplified",
-                        [
-                            {"content": text.story_html, "title": text.title}
-                            for text in oversimplified_text.story_points
-                        ],
-                        title_key="title",
-                    )
-                )
-
-            # check if the keypoints exists
-            if not is_text_type_present(pr, "keypoints", lang_code):
-                translation_tasks.append(
-                    process_and_save_translated_batch.s(
-                        pr.id,
-                        lang_code,
-                        "keypoints",
-                        [
-                            {"content": text.point}
-                            for text in keypoints.key_summary_points
-                        ],
-                    )
-                )
-
-        # Execute all translation and saving tasks in parallel, then set active
-        if translation_tasks:
-            # Use chord to run all tasks in parallel and then execute the final task
-            chord(translation_tasks)(set_press_release_active.si(pr.id))
-        else:
-            # If no translation tasks, just set active directly
-            set_press_release_active.delay(pr.id)
-    except Exception as exc:
-        logger.error(f"Error processing press release {url}: {exc}", exc_info=True)
+
+def _hold_activation_latch(pr_id: int) -> bool:
+    """Returns False when the latch could not be taken, the chord must not release it then."""
+    try:
+        get_redis().incr(_activation_latch_key(pr_id))
+        return True
+    except redis.RedisError as e:
+        logger.warning(f"Could not update activation latch for {pr_id}: {e}")
+        return False
+
+
+def _release_activation_latch(pr_id: int) -> bool:
+    """
+    Returns True when the caller was the last holder of the latch. Raises
+    redis.RedisError when that can't be told.
+    """
+    client = get_redis()
+    remaining = client.decr(_activation_latch_key(pr_id))
+    if remaining > 0:
+        return False
+    try:
+        client.delete(_activation_latch_key(pr_id))
+    except redis.RedisError as e:
+        # It expires after ACTIVATION_LATCH_TTL anyway
+        logger.warning(f"Could not delete activation latch for {pr_id}: {e}")
+    return True
+
+
+@shared_task(bind=True, max_retries=5)
+def release_activation_latch(self, pr_id: int):
+    """
+    Chord callback of one section's translations, the last one sets the
+    release active. Retried while Redis is unavailable, the release stays
+    inactive if it never comes back.
+    """
+    try:
+        last = _release_activation_latch(pr_id)
+    except redis.RedisError as exc:
+        logger.warning(f"Could not release activation latch for {pr_id}: {exc}")
+        raise self.retry(exc=exc, countdown=60)
+
+    if last:
+        set_press_release_active(pr_id)
+    else:
+        logger.info(f"Press release {pr_id} still has sections being translated")
 
 
 @shared_task(bind=True)
@@ -278,6 +632,7 @@ def set_press_release_active(self, pr_id: int):
         pr = PressRelease.objects.get(id=pr_id)
         if not pr.active:  # Only update if not already active
             pr.active = True
+            # Saving an active release invalidates cached API responses (core.signals)
             pr.save()
             logger.info(f"Press release {pr_id} set to active")
         else:
@@ -290,104 +645,156 @@ def set_press_release_active(self, pr_id: int):
         raise
 
 
+def _load_english_segments(
+    pr_id: int, text_types: List[str], ordinals: Optional[List[int]] = None
+) -> List[TranslatedText]:
+    """English segments the translation tasks work from, stored once per release."""
+    segments = TranslatedText.objects.filter(
+        press_release_id=pr_id, language="en", text_type__in=text_types
+    )
+    if ordinals is not None:
+        segments = segments.filter(ordinal__in=ordinals)
+    return list(
+        segments.order_by("text_type", "ordinal").only(
+            "text_type", "ordinal", "content", "title"
+        )
+    )
+
+
+def _translate_segments(
+    pr_id: int, language: str, segments: List[TranslatedText], complete: bool = True
+) -> None:
+    """
+    Translates English segments into language with one batched translation
+    call and upserts the results with one statement.
+
+    complete means segments hold every English segment of their text types,
+    translations past them are left over from a longer earlier run and deleted.
+    """
+    # Translate every content and title in one call
+    titles = [segment.title for segment in segments]
+    title_indexes = [i for i, title in enumerate(titles) if title]
+    translated = translate_texts_gemini(
+        [segment.content for segment in segments] + [titles[i] for i in title_indexes],
+        language,
+    )
+    contents = translated[: len(segments)]
+    for i, translated_title in zip(title_indexes, translated[len(segments) :]):
+        titles[i] = translated_title
+
+    translated_texts = []
+    for segment, content, title in zip(segments, contents, titles):
+        if not content:
+            logger.warning(
+                f"No content to save for {pr_id} ({segment.text_type} {language}) "
+                f"segment {segment.ordinal}. Translation might have failed."
+            )
+            continue
+        translated_texts.append(
+            TranslatedText(
+                press_release_id=pr_id,
+                language=language,
+                text_type=segment.text_type,
+                ordinal=segment.ordinal,
+                content=content,
+                title=title,
+            )
+        )
+
+    # Overwrites rows an earlier attempt saved
+    section_sizes = None
+    if complete:
+        section_sizes = {
+            (pr_id, language, text_type): size
+            for text_type, size in Counter(segment.text_type for segment in segments).items()
+        }
+    _upsert_translated_texts(translated_texts, section_sizes)
+
+
 @shared_task(bind=True, max_retries=3)
-def translate_and_save_text(
+def process_and_save_translated_batch(
     self,
     pr_id: int,
     language: str,
     text_type: str,
-    content: str,
-    title: Optional[str] = None,
+    ordinals: Optional[List[int]] = None,
 ):
     """
-    Task to translate a single piece of text and save it.
-    This handles simple text like summaries or individual points.
+    Task to translate the English segments of one text type (all of them, or
+    only the given ordinals for streamed points) and save them.
+
+    The segments are read from the database, so messages only carry ids.
     """
     try:
-        pr = PressRelease.objects.get(id=pr_id)
-
-        translated_content = translate_text_gemini(content, language)
-        translated_title = translate_text_gemini(title, language) if title else None
-
-        if translated_content:
-            _save_translated_text_data(
-                pr, language, text_type, translated_content, translated_title
-            )
-        else:
-            logger.warning(
-                f"Translation for {pr_id} ({text_type} {language}) failed to produce content."
-            )
+        segments = _load_english_segments(pr_id, [text_type], ordinals)
+        if not segments:
+            logger.warning(f"No English {text_type} found for {pr_id}, nothing to translate.")
+            return
+        _translate_segments(pr_id, language, segments, complete=ordinals is None)
 
-    except PressRelease.DoesNotExist:
+    except IntegrityError:
         logger.error(
-            f"PressRelease with ID {pr_id} not found for translation task.",
+            f"PressRelease with ID {pr_id} not found for batch processing task.",
             exc_info=True,
         )
     except Exception as exc:
+        # print the text that failed
         logger.error(
-            f"Error translating and saving text for {pr_id} ({text_type} {language}): {exc}",
+            f"Error processing batch for {pr_id} ({text_type} {language}): {exc}",
             exc_info=True,
         )
 
 
 @shared_task(bind=True, max_retries=3)
-def process_and_save_translated_batch(
-    self,
-    pr_id: int,
-    language: str,
-    text_type: str,
-    items: List[Dict[str, Any]],
-    content_key: str = "content",
-    title_key: Optional[str] = None,
-    translate_content: bool = True,
-):
+def translate_release_language(self, pr_id: int, language: str, text_types: List[str]):
     """
-    Task to handle a batch of structured text (like simplified/oversimplified points)
-    and translate/save them.
+    Task to translate several text types of a release into one language.
+
+    All English segments of text_types go out in one batched translation
+    call and every row is saved with one upsert statement.
     """
     try:
-        pr = PressRelease.objects.get(id=pr_id)
-
-        # It's better to create a new list for TranslatedText objects and bulk_create them
-        # However, for simplicity here, we're calling individual save functions,
-        # which have the idempotence check. If `items` can be very large, bulk_create is better.
-        for item in items:
-            content = item[content_key]
-            current_title = item.get(title_key) if title_key else None
-
-            final_content = content
-            final_title = current_title
-
-            if translate_content:
-                final_content = translate_text_gemini(content, language)
-                if current_title:
-                    final_title = translate_text_gemini(current_title, language)
-
-            if final_content:
-                # The _save_translated_text_data helper has the existence check,
-                # ensuring idempotence for individual items within the batch.
-                _save_translated_text_data(
-                    pr, language, text_type, final_content, final_title
-                )
-            else:
-                logger.warning(
-                    f"No content to save for {pr_id} ({text_type} {language}) item: {item}. Translation might have failed."
-                )
+        segments = _load_english_segments(pr_id, text_types)
+        if not segments:
+            logger.warning(f"No English texts found for {pr_id}, nothing to translate.")
+            return
+        _translate_segments(pr_id, language, segments)
 
-    except PressRelease.DoesNotExist:
+    except IntegrityError:
         logger.error(
-            f"PressRelease with ID {pr_id} not found for batch processing task.",
+            f"PressRelease with ID {pr_id} not found for language translation task.",
             exc_info=True,
         )
     except Exception as exc:
-        # print the text that failed
         logger.error(
-            f"Error processing batch for {pr_id} ({text_type} {language}): {exc}",
+            f"Error translating {pr_id} to {language}: {exc}",
             exc_info=True,
         )
 
 
-def is_text_type_present(pr: PressRelease, text_type: str, language: str) -> bool:
-    return TranslatedText.objects.filter(
-        press_release=pr, text_type=text_type, language=language
-    ).exists()
+def get_translation_coverage(pr_ids: List[int]) -> Dict[int, Dict[str, set]]:
+    """
+    Returns the (text_type -> languages) coverage matrix of every release in
+    pr_ids with a single query. Releases without any text map to {}.
+    """
+    coverage = {pr_id: {} for pr_id in pr_ids}
+    rows = (
+        TranslatedText.objects.filter(press_release_id__in=pr_ids)
+        .values_list("press_release_id", "text_type", "language")
+        .distinct()
+    )
+    for pr_id, text_type, language in rows:
+        coverage[pr_id].setdefault(text_type, set()).add(language)
+    return coverage
+
+
+def get_missing_translations(coverage: Dict[str, set]) -> Dict[str, List[str]]:
+    """Returns text_type -> languages without any text, for one release's coverage matrix."""
+    missing = {}
+    for text_type in TEXT_TYPES:
+        # The original text is only kept in English
+        expected = ["en"] if text_type == "original" else [lang for lang, _ in LANGUAGE_CHOICES]
+        missing[text_type] = [
+            lang_code for lang_code in expected if lang_code not in coverage.get(text_type, ())
+        ]
+    return missing
@@ -0,0 +1,74 @@
+import redis
+
+
+class MemoryRedis:
+    """In-memory stand-in for the Redis client of caches and latches, can be down."""
+
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.ConnectionError("down")
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self._check()
+        # Redis keeps every value as a string
+        if not isinstance(value, bytes):
+            value = str(value).encode("utf-8")
+        self.data[key] = value
+
+    def incr(self, key):
+        return self._add(key, 1)
+
+    def decr(self, key):
+        return self._add(key, -1)
+
+    def _add(self, key, amount):
+        self._check()
+        value = int(self.data.get(key, 0)) + amount
+        self.data[key] = str(value).encode()
+        return value
+
+    def delete(self, key):
+        self._check()
+        self.data.pop(key, None)
+
+    def hincrby(self, key, field, amount=1):
+        self._check()
+        fields = self.hashes.setdefault(key, {})
+        fields[field.encode()] = int(fields.get(field.encode(), 0)) + amount
+
+    def hgetall(self, key):
+        self._check()
+        fields = self.hashes.get(key, {})
+        return {field: str(value).encode() for field, value in fields.items()}
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+
+class MemoryPipeline:
+    """Queues calls and runs them on execute(), like a non-transactional pipeline."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args, **kwargs: self.calls.append((method, args, kwargs))
+
+    def execute(self):
+        self.client._check()
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
@@ -0,0 +1,44 @@
+from unittest import mock
+import redis
+from django.core.cache.backends.redis import RedisCache
+from django.test import SimpleTestCase, override_settings
+from core.cache_backends import COMPRESSED_PREFIX, CompressedRedisSerializer, FallbackRedisCache
+
+
+@override_settings(CACHE_COMPRESS_MIN_BYTES=100)
+class CompressedRedisSerializerTest(SimpleTestCase):
+    def test_large_values_are_compressed(self):
+        serializer = CompressedRedisSerializer()
+        value = {"results": ["press release text"] * 50}
+        data = serializer.dumps(value)
+        self.assertTrue(data.startswith(COMPRESSED_PREFIX))
+        self.assertEqual(serializer.loads(data), value)
+
+    def test_small_values_are_not_compressed(self):
+        serializer = CompressedRedisSerializer()
+        data = serializer.dumps({"count": 1})
+        self.assertFalse(data.startswith(COMPRESSED_PREFIX))
+        self.assertEqual(serializer.loads(data), {"count": 1})
+
+
+@override_settings(CACHE_REDIS_RETRY_INTERVAL=30)
+class FallbackRedisCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.cache = FallbackRedisCache("redis://localhost:6379/0", {"KEY_PREFIX": "test"})
+
+    def test_uses_local_cache_while_redis_is_down(self):
+        with mock.patch.object(
+            RedisCache, "set", side_effect=redis.ConnectionError("down")
+        ) as redis_set:
+            self.cache.set("key", "value")
+            self.cache.set("other", "value")
+        # Only the first call hits Redis, the rest wait for the retry interval
+        self.assertEqual(redis_set.call_count, 1)
+        self.assertEqual(self.cache._local.get("key"), "value")
+        self.assertEqual(self.cache.get("key"), "value")
+
+    def test_retries_redis_after_interval(self):
+        self.cache._retry_at = 0.0
+        with mock.patch.object(RedisCache, "get", return_value="shared") as redis_get:
+            self.assertEqual(self.cache.get("key"), "shared")
+        redis_get.assert_called_once()
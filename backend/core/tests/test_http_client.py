@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from unittest import mock
+import httpx
+from django.test import SimpleTestCase, override_settings
+from core.utils import http_client
+from core.utils.http_client import fetch, fetch_many, get_event_loop, run_sync
+
+
+class FetchTest(SimpleTestCase):
+    def setUp(self):
+        # Fresh per-thread state, so each test gets its own loop and client
+        patcher = mock.patch.object(http_client, "_local", threading.local())
+        self.local = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.close_loop)
+        patcher = mock.patch.object(http_client.asyncio, "sleep", mock.AsyncMock())
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.requests = []
+
+    def close_loop(self):
+        loop = getattr(self.local, "loop", None)
+        if loop is not None:
+            if self.local.async_client is not None:
+                loop.run_until_complete(self.local.async_client.aclose())
+            loop.close()
+
+    def use_handler(self, handler):
+        """Serves the shared client's requests with handler(request)."""
+        get_event_loop()
+        http_client._local.async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+    def reply(self, *statuses):
+        """Handler answering successive requests with statuses (an exception is raised)."""
+        statuses = iter(statuses)
+
+        def handler(request):
+            self.requests.append(str(request.url))
+            status = next(statuses)
+            if isinstance(status, Exception):
+                raise status
+            return httpx.Response(status, text=f"status {status}")
+
+        return handler
+
+    def test_retries_server_errors_with_backoff(self):
+        self.use_handler(self.reply(502, 500, 200))
+        response = run_sync(fetch("https://pib.gov.in/a", backoff_factor=0.3))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual([c.args[0] for c in self.sleep.call_args_list], [0, 0.6])
+
+    def test_last_response_returned_when_retries_run_out(self):
+        self.use_handler(self.reply(502, 502))
+        response = run_sync(fetch("https://pib.gov.in/a", retries=1))
+        self.assertEqual(response.status_code, 502)
+
+    def test_transport_error_raised_after_last_retry(self):
+        error = httpx.ConnectError("refused")
+        self.use_handler(self.reply(error, error))
+        with self.assertRaises(httpx.ConnectError):
+            run_sync(fetch("https://pib.gov.in/a", retries=1))
+
+    def test_fetch_many_maps_failures_to_none(self):
+        def handler(request):
+            status = 404 if request.url.path == "/missing" else 200
+            return httpx.Response(status, text=request.url.path)
+
+        self.use_handler(handler)
+        urls = [
+            "https://pib.gov.in/a",
+            "https://pib.gov.in/missing",
+            "https://pib.gov.in/a",
+        ]
+        self.assertEqual(
+            fetch_many(urls),
+            {"https://pib.gov.in/a": "/a", "https://pib.gov.in/missing": None},
+        )
+
+    @override_settings(HTTP_PER_HOST_CONCURRENCY=2)
+    def test_requests_in_flight_are_limited_per_host(self):
+        in_flight, peak = {}, {}
+        release = asyncio.Event()
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            if sum(in_flight.values()) == 4:
+                release.set()
+            await release.wait()
+            in_flight[host] -= 1
+            return httpx.Response(200)
+
+        self.use_handler(handler)
+        fetch_many(
+            [f"https://{host}/{i}" for host in ("a.example", "b.example") for i in range(5)]
+        )
+        self.assertEqual(peak, {"a.example": 2, "b.example": 2})
+
+    def test_event_loop_per_thread(self):
+        loop = get_event_loop()
+        self.assertIs(get_event_loop(), loop)
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_event_loop()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], loop)
+        other[0].close()
+
+    def test_new_event_loop_after_fork(self):
+        loop = get_event_loop()
+        with mock.patch.object(http_client.os, "getpid", return_value=-1):
+            self.assertIsNot(get_event_loop(), loop)
+        loop.close()  # replaced, close_loop only closes the current one
@@ -0,0 +1,36 @@
+import json
+from django.test import SimpleTestCase
+from core.utils.json_parser import JSONArrayItemParser
+
+
+class JSONArrayItemParserTest(SimpleTestCase):
+    reply = "```json\n" + json.dumps(
+        {
+            "headline": "Not [an] {item}",
+            "summary_points": [
+                {"title": 'Quote " and } brace', "description_html": "<p>[x]</p>"},
+                {"title": "Second", "description_html": "", "extra": {"list": [{}]}},
+            ],
+        },
+        indent=2,
+    ) + "\n```"
+
+    def feed_in_chunks(self, size):
+        parser = JSONArrayItemParser(["summary_points"])
+        items = []
+        for start in range(0, len(self.reply), size):
+            items.extend(parser.feed(self.reply[start : start + size]))
+        return parser, items
+
+    def test_items_are_emitted_in_order(self):
+        for size in (1, 5, len(self.reply)):
+            parser, items = self.feed_in_chunks(size)
+            self.assertEqual(
+                [item["title"] for key, item in items], ['Quote " and } brace', "Second"]
+            )
+            self.assertEqual(parser.text, self.reply)
+
+    def test_item_is_emitted_once_complete(self):
+        parser = JSONArrayItemParser(["summary_points"])
+        self.assertEqual(parser.feed('{"summary_points": [{"title": "a"'), [])
+        self.assertEqual(parser.feed("}, {"), [("summary_points", {"title": "a"})])
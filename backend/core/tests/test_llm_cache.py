@@ -0,0 +1,62 @@
+from unittest import mock
+from django.test import SimpleTestCase
+from core.constants.response_models import SummaryResponse
+from core.tests.fakes import MemoryRedis
+from core.utils import llm_cache
+from core.utils.ai_processor import generate_structured
+from core.utils.llm_cache import (
+    cache_llm_response,
+    get_cached_llm_response,
+    get_llm_cache_stats,
+    llm_cache_key,
+)
+from core.utils.llm_providers import StubProvider, stub_payload
+
+
+class LLMCacheKeyTest(SimpleTestCase):
+    def test_key_changes_with_every_part(self):
+        key = llm_cache_key("summary", "Summarize", "model", "text")
+        self.assertEqual(key, llm_cache_key("summary", "Summarize", "model", "text"))
+        for changed in (
+            llm_cache_key("keypoints", "Summarize", "model", "text"),
+            llm_cache_key("summary", "Summarize briefly", "model", "text"),
+            llm_cache_key("summary", "Summarize", "other-model", "text"),
+            llm_cache_key("summary", "Summarize", "model", "other text"),
+        ):
+            self.assertNotEqual(key, changed)
+
+
+class LLMCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = MemoryRedis()
+        patcher = mock.patch.object(llm_cache, "get_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.provider = StubProvider()
+        patcher = mock.patch(
+            "core.utils.ai_processor.get_llm_provider", return_value=self.provider
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.response = SummaryResponse(**stub_payload(SummaryResponse))
+
+    def test_round_trip_and_stats(self):
+        key = llm_cache_key("summary", "Summarize", "model", "text")
+        self.assertIsNone(get_cached_llm_response(key, SummaryResponse))
+        cache_llm_response(key, self.response)
+        self.assertEqual(get_cached_llm_response(key, SummaryResponse), self.response)
+        self.assertEqual(get_llm_cache_stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_stale_entry_is_a_miss(self):
+        key = llm_cache_key("summary", "Summarize", "model", "text")
+        self.redis.set(key, '{"unexpected": true}')
+        self.assertIsNone(get_cached_llm_response(key, SummaryResponse))
+
+    def test_cache_hit_skips_the_provider(self):
+        complete = mock.Mock(wraps=self.provider._complete)
+        with mock.patch.object(self.provider, "_complete", complete):
+            first = generate_structured("summary", "Summarize", "text", SummaryResponse)
+            second = generate_structured("summary", "Summarize", "text", SummaryResponse)
+            generate_structured("summary", "Summarize", "other text", SummaryResponse)
+        self.assertEqual(first, second)
+        self.assertEqual(complete.call_count, 2)
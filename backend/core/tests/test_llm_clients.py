@@ -0,0 +1,95 @@
+import asyncio
+from unittest import mock
+from django.test import SimpleTestCase, override_settings
+from core.utils import llm_clients
+from core.utils.llm_clients import (
+    LLM_CLIENT_STATS_KEY,
+    get_async_llm_sdk_client,
+    get_llm_client_stats,
+    get_llm_sdk_client,
+    track_llm_call,
+)
+
+
+class LLMClientRegistryTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = mock.MagicMock()
+        self.pipe = self.redis.pipeline.return_value
+        for target, value in (
+            ("core.utils.llm_clients.get_redis", mock.Mock(return_value=self.redis)),
+            ("core.utils.llm_clients._clients", {}),
+            ("core.utils.llm_clients._clients_pid", None),
+            ("core.utils.llm_clients._local", llm_clients.threading.local()),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # A new object per call stands in for each SDK client
+        for factories in (llm_clients._FACTORIES, llm_clients._ASYNC_FACTORIES):
+            patcher = mock.patch.dict(factories, {"groq": object})
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def recorded(self):
+        return {
+            call.args[1]: call.args[2] for call in self.pipe.hincrbyfloat.call_args_list
+        }
+
+    def test_client_is_shared_within_process(self):
+        self.assertIs(get_llm_sdk_client("groq"), get_llm_sdk_client("groq"))
+
+    def test_clients_are_rebuilt_after_fork(self):
+        with mock.patch("core.utils.llm_clients.os.getpid", return_value=1):
+            parent = get_llm_sdk_client("groq")
+        with mock.patch("core.utils.llm_clients.os.getpid", return_value=2):
+            child = get_llm_sdk_client("groq")
+            self.assertIs(get_llm_sdk_client("groq"), child)
+        self.assertIsNot(parent, child)
+
+    def test_async_client_per_event_loop(self):
+        async def get_twice():
+            return get_async_llm_sdk_client("groq"), get_async_llm_sdk_client("groq")
+
+        first, same = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+        self.assertIs(first, same)
+        self.assertIsNot(first, second)
+
+    def test_client_creation_is_recorded(self):
+        get_llm_sdk_client("groq")
+        get_llm_sdk_client("groq")
+        self.assertEqual(self.recorded()["groq:clients_created"], 1)
+        self.assertIn("groq:init_ms", self.recorded())
+        self.pipe.execute.assert_called_once()
+
+    def test_calls_are_recorded(self):
+        with track_llm_call("gemini"):
+            pass
+        self.assertEqual(self.recorded()["gemini:calls"], 1)
+        self.assertGreaterEqual(self.recorded()["gemini:call_ms"], 0)
+
+    def test_stats_failures_are_ignored(self):
+        self.pipe.execute.side_effect = llm_clients.redis.RedisError("down")
+        self.assertIsNotNone(get_llm_sdk_client("groq"))
+
+    def test_stats_averages(self):
+        self.redis.hgetall.return_value = {
+            b"groq:clients_created": b"2",
+            b"groq:init_ms": b"30",
+            b"groq:calls": b"4",
+            b"groq:call_ms": b"1000",
+        }
+        stats = get_llm_client_stats()["groq"]
+        self.redis.hgetall.assert_called_once_with(LLM_CLIENT_STATS_KEY)
+        self.assertEqual(stats["avg_init_ms"], 15.0)
+        self.assertEqual(stats["avg_call_ms"], 250.0)
+
+    @override_settings(GEMINI_API_KEY="key", LLM_HTTP_MAX_CONNECTIONS=7)
+    def test_async_gemini_client_gets_connection_limits(self):
+        with mock.patch("core.utils.llm_clients.genai.Client") as client:
+            llm_clients._make_async_gemini_client()
+        http_options = client.call_args.kwargs["http_options"]
+        self.assertIsNone(http_options.client_args)
+        self.assertEqual(
+            http_options.async_client_args["limits"].max_connections, 7
+        )
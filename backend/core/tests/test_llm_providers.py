@@ -0,0 +1,211 @@
+import json
+from unittest import mock
+from django.test import SimpleTestCase, override_settings
+from core.constants.response_models import (
+    CombinedResponse,
+    KeyPoint,
+    KeyPointsResponse,
+    SummaryResponse,
+)
+from core.utils import llm_providers
+from core.constants.prompt import COMBINED_PROMPT
+from core.utils.ai_processor import (
+    SECTIONS,
+    generate_combined_sections,
+    generate_structured,
+    stream_structured,
+)
+from core.utils.llm_cache import llm_cache_key
+from core.utils.llm_providers import (
+    FailoverProvider,
+    StubProvider,
+    get_answering_model,
+    get_llm_provider,
+    stub_payload,
+)
+
+
+def failing_primary(**attrs):
+    """A StubProvider under another model name whose methods are replaced by attrs."""
+    provider = StubProvider()
+    provider.model = "primary"
+    for name, value in attrs.items():
+        setattr(provider, name, value)
+    return provider
+
+
+class LLMProviderTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(llm_providers._providers, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stub_replies_with_schema_shaped_json(self):
+        response = StubProvider().generate("system", "text", CombinedResponse)
+        self.assertIsInstance(response, CombinedResponse)
+        self.assertEqual(len(response.keypoints.key_summary_points), 1)
+
+    def test_failover_uses_next_provider(self):
+        failing = StubProvider()
+        failing._complete = mock.Mock(side_effect=RuntimeError("429"))
+        provider = FailoverProvider([failing, StubProvider()])
+        response = provider.generate("system", "text", SummaryResponse)
+        self.assertIsInstance(response, SummaryResponse)
+        failing._complete.assert_called_once()
+
+    def test_failover_on_unparsable_reply(self):
+        failing = StubProvider()
+        failing._complete = mock.Mock(return_value="not json")
+        provider = FailoverProvider([failing, StubProvider()])
+        with mock.patch("core.utils.json_parser.Path"):  # no json_errors.log
+            response = provider.generate("s", "t", SummaryResponse)
+        self.assertIsInstance(response, SummaryResponse)
+
+    def test_failover_reports_answering_model(self):
+        failing = failing_primary(_complete=mock.Mock(side_effect=RuntimeError("429")))
+        provider = FailoverProvider([failing, StubProvider()])
+        self.assertEqual(provider.model, "primary")
+        provider.generate("system", "text", SummaryResponse)
+        self.assertEqual(get_answering_model(), "stub")
+
+    def test_answering_model_is_primary_when_it_answers(self):
+        provider = FailoverProvider([failing_primary(), StubProvider()])
+        "".join(provider.stream_text("system", "text", SummaryResponse))
+        self.assertEqual(get_answering_model(), "primary")
+
+    @override_settings(LLM_PROVIDERS=[], GROQ_API_KEY="groq", GEMINI_API_KEY="gemini")
+    def test_default_chain_is_groq_then_gemini(self):
+        provider = get_llm_provider()
+        self.assertEqual([p.name for p in provider.providers], ["groq", "gemini"])
+        self.assertEqual(provider.model, llm_providers.GROQ_MODEL)
+
+    @override_settings(LLM_PROVIDERS=[], GROQ_API_KEY="", GEMINI_API_KEY="")
+    def test_no_provider_without_keys(self):
+        self.assertIsNone(get_llm_provider())
+
+
+@override_settings(LLM_PROVIDERS=["stub"])
+class StreamStructuredTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch(
+            "core.utils.ai_processor.get_cached_llm_response", return_value=None
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("core.utils.ai_processor.cache_llm_response")
+        self.cache_llm_response = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def use_failover(self, **primary_attrs):
+        provider = FailoverProvider([failing_primary(**primary_attrs), StubProvider()])
+        patcher = mock.patch(
+            "core.utils.ai_processor.get_llm_provider", return_value=provider
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_cached_under(self, model, prompt_id):
+        key = self.cache_llm_response.call_args.args[0]
+        self.assertEqual(key, llm_cache_key(prompt_id, "system", model, "text"))
+
+    def test_points_then_full_response(self):
+        events = list(
+            stream_structured("keypoints", "system", "text", KeyPointsResponse)
+        )
+        self.assertEqual(events[0], ("key_summary_points", KeyPoint(point="Stub point")))
+        self.assertEqual(events[-1][0], None)
+        self.assertIsInstance(events[-1][1], KeyPointsResponse)
+
+    def test_stream_fails_over_before_first_chunk(self):
+        failing = StubProvider()
+        failing._stream = mock.Mock(side_effect=RuntimeError("503"))
+        provider = FailoverProvider([failing, StubProvider()])
+        reply = "".join(provider.stream_text("system", "text", SummaryResponse))
+        self.assertIn("headline", reply)
+
+    def test_fallback_reply_is_cached_under_fallback_model(self):
+        self.use_failover(_complete=mock.Mock(side_effect=RuntimeError("429")))
+        generate_structured("summary", "system", "text", SummaryResponse)
+        self.assert_cached_under("stub", "summary")
+
+    def test_fallback_stream_is_cached_under_fallback_model(self):
+        self.use_failover(_stream=mock.Mock(side_effect=RuntimeError("503")))
+        list(stream_structured("keypoints", "system", "text", KeyPointsResponse))
+        self.assert_cached_under("stub", "keypoints")
+
+    def test_primary_reply_is_cached_under_primary_model(self):
+        self.use_failover()
+        generate_structured("summary", "system", "text", SummaryResponse)
+        self.assert_cached_under("primary", "summary")
+
+
+class CombinedSectionsTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch(
+            "core.utils.ai_processor.get_cached_llm_response", return_value=None
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("core.utils.ai_processor.cache_llm_response")
+        self.cache_llm_response = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("core.utils.json_parser.Path")  # no json_errors.log
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.provider = StubProvider()
+        self.combined_reply = "{}"
+        self.prompts = []
+        stub_complete = self.provider._complete
+
+        def complete(system_prompt, user_prompt, schema=None):
+            self.prompts.append(system_prompt)
+            if system_prompt == COMBINED_PROMPT:
+                return self.combined_reply
+            return stub_complete(system_prompt, user_prompt, schema)
+
+        self.provider._complete = complete
+        patcher = mock.patch(
+            "core.utils.ai_processor.get_llm_provider", return_value=self.provider
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def separate_calls(self):
+        return [prompt for prompt in self.prompts if prompt != COMBINED_PROMPT]
+
+    def assert_complete(self, sections):
+        self.assertEqual(set(sections), set(SECTIONS))
+        for name, (prompt, response_model) in SECTIONS.items():
+            self.assertIsInstance(sections[name], response_model)
+
+    def test_valid_sections_are_used(self):
+        self.combined_reply = json.dumps(
+            {
+                name: stub_payload(response_model)
+                for name, (prompt, response_model) in SECTIONS.items()
+            }
+        )
+        self.assert_complete(generate_combined_sections("text"))
+        self.assertEqual(self.separate_calls(), [])
+        self.cache_llm_response.assert_called_once()
+
+    def test_missing_and_invalid_sections_are_generated_separately(self):
+        self.combined_reply = json.dumps(
+            {
+                "summary": stub_payload(SummaryResponse),
+                "keypoints": {"key_summary_points": "oops"},
+            }
+        )
+        self.assert_complete(generate_combined_sections("text"))
+        regenerated = ("simplified", "oversimplified", "keypoints")
+        self.assertCountEqual(
+            self.separate_calls(), [SECTIONS[name][0] for name in regenerated]
+        )
+
+    def test_unparsable_reply_falls_back_to_every_section(self):
+        self.combined_reply = "not json"
+        self.assert_complete(generate_combined_sections("text"))
+        self.assertCountEqual(
+            self.separate_calls(), [prompt for prompt, _ in SECTIONS.values()]
+        )
@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest import mock
+from django.utils import timezone
+from django.test import TestCase, override_settings
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.models import PressRelease
+from core.pagination import (
+    CheapCountPaginator,
+    KeysetPagination,
+    PressReleasePagination,
+    estimate_row_count,
+)
+
+
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        # Two releases share each timestamp so pages have to break ties on id
+        self.releases = [
+            PressRelease.objects.create(
+                title=f"Release {i}",
+                original_text="Text",
+                source_url=f"https://example.com/{i}",
+                date_published=now - timedelta(days=i // 2),
+            )
+            for i in range(7)
+        ]
+        self.factory = APIRequestFactory()
+
+    def paginate(self, params, paginator_class=KeysetPagination):
+        request = Request(self.factory.get("/v1/press-releases/", params))
+        paginator = paginator_class()
+        page = paginator.paginate_queryset(PressRelease.objects.all(), request)
+        return paginator, page
+
+    def test_follows_cursors_through_all_rows(self):
+        seen = []
+        params = {"cursor": "", "page_size": 3}
+        while True:
+            paginator, page = self.paginate(params)
+            seen.extend(page)
+            next_link = paginator.get_paginated_response([]).data["next"]
+            if next_link is None:
+                break
+            params["cursor"] = paginator.encode_cursor(page[-1])
+
+        expected = sorted(self.releases, key=lambda pr: (pr.date_published, pr.id), reverse=True)
+        self.assertEqual(seen, expected)
+
+    def test_page_size_is_capped(self):
+        paginator, _ = self.paginate({"cursor": "", "page_size": 10_000})
+        self.assertEqual(paginator.page_size, KeysetPagination.max_page_size)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate({"cursor": "not-a-cursor"})
+
+    def test_press_release_pagination_modes(self):
+        paginator, page = self.paginate({"cursor": ""}, PressReleasePagination)
+        self.assertNotIn("count", paginator.get_paginated_response([]).data)
+
+        paginator, page = self.paginate({"page": 1}, PressReleasePagination)
+        self.assertEqual(paginator.get_paginated_response([]).data["count"], 7)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    PAGINATION_ESTIMATE_COUNT_MIN=100,
+)
+class CheapCountPaginatorTest(TestCase):
+    def setUp(self):
+        for i in range(3):
+            PressRelease.objects.create(
+                title=f"Release {i}",
+                original_text="Text",
+                source_url=f"https://example.com/{i}",
+                date_published=timezone.now(),
+                active=True,
+            )
+
+    def paginator(self, **kwargs):
+        return CheapCountPaginator(PressRelease.objects.all(), 2, **kwargs)
+
+    def test_counts_are_cached_per_filter(self):
+        queryset = PressRelease.objects.filter(title__startswith="Release")
+        self.assertEqual(self.paginator(count_queryset=queryset).count, 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.paginator(count_queryset=queryset).count, 3)
+        other = PressRelease.objects.filter(title="Release 1")
+        self.assertEqual(self.paginator(count_queryset=other).count, 1)
+
+    @mock.patch("core.pagination.estimate_row_count", return_value=250)
+    def test_unfiltered_large_table_uses_estimate(self, estimate):
+        queryset = PressRelease.objects.filter(active=True)
+        self.assertEqual(self.paginator(count_queryset=queryset, filtered=False).count, 250)
+        # The estimate is of the listed rows, not the whole table
+        estimate.assert_called_once_with(queryset)
+        self.assertEqual(self.paginator(count_queryset=queryset, filtered=True).count, 3)
+
+    @mock.patch("core.pagination.estimate_row_count", return_value=50)
+    def test_small_table_is_counted(self, estimate):
+        queryset = PressRelease.objects.all()
+        self.assertEqual(self.paginator(count_queryset=queryset, filtered=False).count, 3)
+
+    def test_estimate_reads_explain_plan_rows(self):
+        queryset = PressRelease.objects.filter(active=True)
+        connection = mock.MagicMock(vendor="postgresql")
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = ([{"Plan": {"Plan Rows": 1234}}],)
+        with mock.patch("core.pagination.connection", connection):
+            self.assertEqual(estimate_row_count(queryset), 1234)
+        explained = cursor.execute.call_args.args[0]
+        self.assertTrue(explained.startswith("EXPLAIN (FORMAT JSON) SELECT"))
+        self.assertIn("active", explained)
+
+    def test_no_estimate_on_other_databases(self):
+        self.assertIsNone(estimate_row_count(PressRelease.objects.all()))
@@ -0,0 +1,60 @@
+from unittest import mock
+import redis
+from django.test import SimpleTestCase, override_settings
+from core.utils import rate_limiter
+from core.utils.rate_limiter import (
+    ACQUIRE_SCRIPT,
+    DistributedRateLimiter,
+    get_rate_limiter,
+)
+
+
+class DistributedRateLimiterTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(rate_limiter._limiters, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(
+        LLM_RATE_LIMITS={
+            "gemini": {"rpm": 950, "tpm": 0},
+            "gemini:big-model": {"rpm": 10, "tpm": 1000},
+        }
+    )
+    def test_model_limits_override_provider_limits(self):
+        self.assertEqual(get_rate_limiter("gemini", "small-model").max_requests, 950)
+        limiter = get_rate_limiter("gemini", "big-model")
+        self.assertEqual((limiter.max_requests, limiter.max_tokens), (10, 1000))
+        self.assertIs(get_rate_limiter("gemini", "big-model"), limiter)
+
+    def test_script_wait_time_is_returned(self):
+        limiter = DistributedRateLimiter("test", max_requests=10)
+        limiter._script = mock.Mock(side_effect=["0", "1.5"])
+        self.assertIs(limiter.acquire(), True)
+        self.assertEqual(limiter.acquire(), 1.5)
+
+    def test_falls_back_to_local_limiter_without_redis(self):
+        limiter = DistributedRateLimiter("test", max_requests=1)
+        limiter._script = mock.Mock(side_effect=redis.ConnectionError("down"))
+        self.assertIs(limiter.acquire(), True)
+        self.assertGreater(limiter.acquire(), 0)
+
+    def test_unlimited_without_redis(self):
+        limiter = DistributedRateLimiter("test", max_requests=0)
+        limiter._script = mock.Mock(side_effect=redis.ConnectionError("down"))
+        self.assertIs(limiter.acquire(), True)
+
+    def test_script_uses_redis_time(self):
+        limiter = DistributedRateLimiter("test", max_requests=10, max_tokens=100)
+        limiter._script = mock.Mock(return_value="0")
+        limiter.acquire(tokens=5)
+        # No worker clock is sent, the script reads the server's TIME
+        self.assertEqual(limiter._script.call_args.kwargs["args"], [60, 10, 100, 5])
+        self.assertIn("redis.call('TIME')", ACQUIRE_SCRIPT)
+
+    def test_pause_is_timed_by_redis(self):
+        limiter = DistributedRateLimiter("test", max_requests=10)
+        with mock.patch.object(rate_limiter, "get_redis") as get_redis:
+            limiter.pause(60)
+        get_redis.return_value.set.assert_called_once_with(limiter.pause_key, 60, px=60000)
+        self.assertIn("redis.call('PTTL', KEYS[3])", ACQUIRE_SCRIPT)
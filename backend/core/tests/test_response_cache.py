@@ -0,0 +1,145 @@
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.models import Ministry, PressRelease
+from core.utils.response_cache import (
+    MINISTRIES,
+    PRESS_RELEASES,
+    canonical_query_params,
+    get_tag_versions,
+    invalidate_tags,
+    response_cache_key,
+    restore_links,
+    strip_links,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class CanonicalQueryParamsTest(SimpleTestCase):
+    allowed = ["ministry", "search", "language", "page"]
+    defaults = {"language": "en", "page": 1}
+
+    def canonical(self, query_string):
+        return canonical_query_params(QueryDict(query_string), self.allowed, self.defaults)
+
+    def test_equivalent_queries_match(self):
+        self.assertEqual(
+            self.canonical("page=1&ministry=3&language=en"),
+            self.canonical("ministry=3&_=1718000000&search="),
+        )
+
+    def test_repeated_values_are_sorted(self):
+        self.assertEqual(self.canonical("ministry=3&ministry=1"), self.canonical("ministry=1&ministry=3"))
+
+    def test_different_filters_differ(self):
+        self.assertNotEqual(self.canonical("ministry=1"), self.canonical("ministry=2"))
+        self.assertNotEqual(self.canonical("page=1"), self.canonical("page=2"))
+
+    def test_all_params_kept_without_allowed(self):
+        self.assertEqual(canonical_query_params(QueryDict("name=a&b=2")), "b=2&name=a")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResponseCacheKeyTest(SimpleTestCase):
+    def test_invalidating_a_tag_changes_dependent_keys(self):
+        key = response_cache_key("test", "page=1", [PRESS_RELEASES, MINISTRIES])
+        self.assertEqual(response_cache_key("test", "page=1", [PRESS_RELEASES, MINISTRIES]), key)
+        invalidate_tags(MINISTRIES)
+        self.assertNotEqual(response_cache_key("test", "page=1", [PRESS_RELEASES, MINISTRIES]), key)
+
+    def test_other_tags_are_independent(self):
+        key = response_cache_key("test", "page=1", [PRESS_RELEASES])
+        invalidate_tags(MINISTRIES)
+        self.assertEqual(response_cache_key("test", "page=1", [PRESS_RELEASES]), key)
+
+
+class PaginationLinksTest(SimpleTestCase):
+    def request(self, host, params):
+        return Request(APIRequestFactory().get("/v1/ministry/", params, HTTP_HOST=host))
+
+    @override_settings(ALLOWED_HOSTS=["*"])
+    def test_links_are_rebuilt_on_the_serving_request(self):
+        filling = self.request("a.example", {"page": 2, "utm_source": "mail"})
+        data = {
+            "count": 60,
+            "next": "http://a.example/v1/ministry/?page=3&utm_source=mail",
+            "previous": "http://a.example/v1/ministry/?utm_source=mail",
+            "results": [],
+        }
+        cached = strip_links(data, filling)
+        self.assertNotIn("a.example", str(cached))
+        self.assertNotIn("utm_source", str(cached))
+
+        serving = self.request("b.example", {"page": 2, "ref": "feed"})
+        restored = restore_links(cached, serving)
+        self.assertEqual(restored["next"], "http://b.example/v1/ministry/?page=3&ref=feed")
+        self.assertEqual(restored["previous"], "http://b.example/v1/ministry/?ref=feed")
+        self.assertEqual((restored["count"], restored["results"]), (60, []))
+
+    def test_missing_links_stay_none(self):
+        request = self.request("testserver", {})
+        data = {"count": 0, "next": None, "previous": None, "results": []}
+        self.assertEqual(restore_links(strip_links(data, request), request), data)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, ALLOWED_HOSTS=["*"])
+class CachedListLinksTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        Ministry.objects.bulk_create(Ministry(name=f"Ministry {i:02}") for i in range(45))
+
+    def test_cached_page_links_follow_each_request(self):
+        url = reverse("ministry-list")
+        first = self.client.get(url, {"page": 2}, HTTP_HOST="a.example")
+        self.assertEqual(first.data["next"], "http://a.example/v1/ministry/?page=3")
+        with self.assertNumQueries(0):
+            second = self.client.get(url, {"page": 2}, HTTP_HOST="b.example")
+        self.assertEqual(second.data["next"], "http://b.example/v1/ministry/?page=3")
+        self.assertEqual(second.data["previous"], "http://b.example/v1/ministry/")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class InvalidationSignalsTest(TestCase):
+    def setUp(self):
+        self.ministry = Ministry.objects.create(name="Test Ministry")
+        self.press_release = PressRelease.objects.create(
+            title="Test", original_text="Text", date_published="2025-01-01",
+            ministry=self.ministry,
+        )
+
+    def test_inactive_release_keeps_cache(self):
+        versions = get_tag_versions([PRESS_RELEASES])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.press_release.title = "Edited"
+            self.press_release.save()
+        self.assertEqual(get_tag_versions([PRESS_RELEASES]), versions)
+
+    def test_activation_invalidates_press_releases(self):
+        versions = get_tag_versions([PRESS_RELEASES, MINISTRIES])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.press_release.active = True
+            self.press_release.save()
+        new_versions = get_tag_versions([PRESS_RELEASES, MINISTRIES])
+        self.assertNotEqual(new_versions[0], versions[0])
+        self.assertEqual(new_versions[1], versions[1])
+
+    def test_deactivation_invalidates_press_releases(self):
+        self.press_release.active = True
+        self.press_release.save()
+        versions = get_tag_versions([PRESS_RELEASES])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.press_release.active = False
+            self.press_release.save()
+        self.assertNotEqual(get_tag_versions([PRESS_RELEASES]), versions)
+
+    def test_ministry_write_invalidates_ministries(self):
+        versions = get_tag_versions([MINISTRIES])
+        with self.captureOnCommitCallbacks(execute=True):
+            Ministry.objects.create(name="Other Ministry")
+        self.assertNotEqual(get_tag_versions([MINISTRIES]), versions)
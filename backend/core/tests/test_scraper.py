@@ -0,0 +1,114 @@
+from pathlib import Path
+from unittest import mock
+from django.test import SimpleTestCase
+from core.utils import scraper
+from core.utils.scraper import (
+    get_press_release_metadata,
+    parse_press_release_content,
+    parse_press_release_listing,
+    save_listing_state,
+)
+
+PAGES = Path(__file__).resolve().parent / "pages"
+
+LISTING_HTML = """
+<div class="content-area">
+  <ul><li><h3>Ministry of Tests</h3>
+    <ul><li><a title="First release" href="/PressReleasePage.aspx?PRID=1">First</a></li></ul>
+  </li></ul>
+</div>
+"""
+
+
+class GetPressReleaseMetadataTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(scraper, "get_pib_secrets", return_value=({}, {}, {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(scraper, "get_redis")
+        self.redis = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.redis.hgetall.return_value = {
+            b"etag": b'"v1"',
+            b"last_modified": b"Mon, 01 Jan 2025 00:00:00 GMT",
+            b"body_hash": scraper.hashlib.sha256(LISTING_HTML.encode()).hexdigest().encode(),
+        }
+        patcher = mock.patch.object(scraper.session, "get")
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def respond(self, status_code=200, body=LISTING_HTML, headers=None):
+        self.get.return_value = mock.Mock(
+            status_code=status_code,
+            content=body.encode(),
+            text=body,
+            headers=headers or {},
+        )
+
+    def test_sends_conditional_headers(self):
+        self.respond(304, "")
+        get_press_release_metadata()
+        headers = self.get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Mon, 01 Jan 2025 00:00:00 GMT")
+
+    def test_not_modified_is_unchanged(self):
+        self.respond(304, "")
+        result = get_press_release_metadata()
+        self.assertTrue(result.unchanged)
+        self.assertEqual(result.press_releases, [])
+
+    def test_same_body_is_unchanged(self):
+        self.respond(200)
+        self.assertTrue(get_press_release_metadata().unchanged)
+
+    def test_changed_listing_is_parsed_but_state_not_saved(self):
+        self.respond(200, LISTING_HTML + "<!-- new -->", {"ETag": '"v2"'})
+        result = get_press_release_metadata()
+
+        self.assertFalse(result.unchanged)
+        self.assertEqual([meta.title for meta in result.press_releases], ["First release"])
+        self.assertEqual(result.listing_state["etag"], '"v2"')
+        # Saved by the caller once the releases are processed
+        self.redis.pipeline.return_value.hset.assert_not_called()
+
+    def test_force_skips_conditional_request(self):
+        self.respond(200)
+        result = get_press_release_metadata(force=True)
+        self.assertFalse(result.unchanged)
+        self.assertNotIn("If-None-Match", self.get.call_args.kwargs["headers"])
+
+    def test_save_listing_state(self):
+        save_listing_state({"etag": '"v2"', "body_hash": "abc"})
+        self.redis.pipeline.return_value.hset.assert_called_once_with(
+            scraper.LISTING_STATE_KEY, mapping={"etag": '"v2"', "body_hash": "abc"}
+        )
+
+
+class ParseSamplePagesTest(SimpleTestCase):
+    """benchmark_scraper_parser's sample pages parse the same strained or not."""
+
+    def read(self, name):
+        return (PAGES / name).read_text(encoding="utf-8")
+
+    def test_listing(self):
+        html = self.read("allrel.html")
+        releases = parse_press_release_listing(html, parser="html.parser", strained=False)
+        self.assertEqual(len(releases), 20)
+        self.assertEqual(releases[0].ministry, "Ministry of Finance")
+        self.assertEqual(
+            str(releases[0].url), "https://www.pib.gov.in/PressReleasePage.aspx?PRID=2100001"
+        )
+        self.assertEqual(
+            parse_press_release_listing(html, parser="html.parser", strained=True),
+            releases,
+        )
+
+    def test_press_release(self):
+        html = self.read("press_release.html")
+        content = parse_press_release_content(html, parser="html.parser", strained=False)
+        self.assertIn("Paragraph 8", content.content)
+        self.assertEqual(content.pib_hq, "Delhi")
+        self.assertEqual(content.date_published.year, 2025)
+        strained = parse_press_release_content(html, parser="html.parser", strained=True)
+        self.assertEqual(strained.content, content.content)
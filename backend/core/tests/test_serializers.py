@@ -162,15 +162,22 @@ class TranslatedTextSerializerTest(TestCase):
     def test_contains_expected_fields(self):
         serializer = TranslatedTextSerializer(instance=self.translated_text)
         expected_fields = {
-            'id', 'press_release', 'language', 'text_type', 'content',
+            'id', 'press_release', 'language', 'text_type', 'ordinal', 'content',
             'title', 'created_at', 'updated_at', 'press_release_title', 'language_display'
         }
         self.assertEqual(set(serializer.data.keys()), expected_fields)
 
     def test_valid_serializer_data(self):
-        serializer = TranslatedTextSerializer(data=self.translated_text_data)
+        # Next segment of the same text, the stored row already has ordinal 0
+        serializer = TranslatedTextSerializer(
+            data={**self.translated_text_data, 'ordinal': 1}
+        )
         self.assertTrue(serializer.is_valid())
 
+    def test_duplicate_segment_is_invalid(self):
+        serializer = TranslatedTextSerializer(data=self.translated_text_data)
+        self.assertFalse(serializer.is_valid())
+
     def test_invalid_language_choice(self):
         invalid_data = self.translated_text_data.copy()
         invalid_data['language'] = 'invalid_language'
@@ -0,0 +1,552 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+import redis
+from api.celery import app
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from core.models import Ministry, PressRelease, TranslatedText
+from core.constants.response_models import (
+    KeyPoint,
+    KeyPointsResponse,
+    OversimplifiedResponse,
+    PressReleaseContent,
+    PressReleaseMetadata,
+    PressReleaseMetadataList,
+    SimplifiedResponse,
+    SummaryResponse,
+)
+from core.tests.fakes import MemoryRedis
+from core.utils.llm_providers import stub_payload
+from core.tasks import (
+    initial_pib_scrape_task,
+    process_press_release_content,
+    release_activation_latch,
+    _filter_unseen_press_releases,
+    _bulk_save_translated_texts,
+    get_translation_coverage,
+    get_missing_translations,
+    translate_release_language,
+    process_and_save_translated_batch,
+    save_listing_state_when_processed,
+    _fan_out_press_releases,
+    TEXT_TYPES,
+)
+
+
+class FilterUnseenPressReleasesTest(TestCase):
+    def setUp(self):
+        self.ministry = Ministry.objects.create(name="Test Ministry")
+        PressRelease.objects.create(
+            title="Stored Press Release",
+            original_text="Already scraped",
+            source_url="https://www.pib.gov.in/stored",
+            date_published=timezone.now(),
+            ministry=self.ministry,
+        )
+        # Keep the Redis seen-URL index out of the way unless a test opts in
+        patcher = mock.patch("core.tasks.filter_seen_urls", return_value=set())
+        self.filter_seen_urls = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("core.tasks.mark_urls_seen")
+        self.mark_urls_seen = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_meta(self, url):
+        return PressReleaseMetadata(ministry="Test Ministry", title="Title", url=url)
+
+    def test_skips_stored_urls(self):
+        metas = [
+            self.make_meta("https://www.pib.gov.in/stored"),
+            self.make_meta("https://www.pib.gov.in/new"),
+        ]
+        unseen = _filter_unseen_press_releases(metas)
+        self.assertEqual([str(meta.url) for meta in unseen], ["https://www.pib.gov.in/new"])
+
+    def test_drops_duplicate_urls_in_listing(self):
+        metas = [
+            self.make_meta("https://www.pib.gov.in/new"),
+            self.make_meta("https://www.pib.gov.in/new"),
+        ]
+        self.assertEqual(len(_filter_unseen_press_releases(metas)), 1)
+
+    def test_single_query(self):
+        metas = [self.make_meta(f"https://www.pib.gov.in/new{i}") for i in range(50)]
+        with self.assertNumQueries(1):
+            unseen = _filter_unseen_press_releases(metas)
+        self.assertEqual(len(unseen), 50)
+
+    def test_index_hits_skip_database(self):
+        self.filter_seen_urls.return_value = {"https://www.pib.gov.in/indexed"}
+        metas = [self.make_meta("https://www.pib.gov.in/indexed")]
+        with self.assertNumQueries(0):
+            unseen = _filter_unseen_press_releases(metas)
+        self.assertEqual(unseen, [])
+
+    def test_marks_stored_urls_seen(self):
+        _filter_unseen_press_releases([self.make_meta("https://www.pib.gov.in/stored")])
+        self.mark_urls_seen.assert_called_once_with({"https://www.pib.gov.in/stored"})
+
+
+class BulkSaveTranslatedTextsTest(TestCase):
+    def setUp(self):
+        self.pr = PressRelease.objects.create(
+            title="Press Release",
+            original_text="Text",
+            source_url="https://www.pib.gov.in/release",
+            date_published=timezone.now(),
+            ministry=Ministry.objects.create(name="Test Ministry"),
+        )
+        self.rows = [(0, "Point one", "Title one"), (1, "Point two", "Title two")]
+
+    def get_rows(self):
+        return list(
+            self.pr.translations.order_by("ordinal").values_list("ordinal", "content", "title")
+        )
+
+    def test_saves_all_rows_in_one_statement(self):
+        with self.assertNumQueries(1):
+            _bulk_save_translated_texts(self.pr.id, "hi", "simplified", self.rows)
+        self.assertEqual(self.get_rows(), self.rows)
+
+    def test_saving_again_overwrites_rows(self):
+        _bulk_save_translated_texts(self.pr.id, "hi", "simplified", self.rows)
+        _bulk_save_translated_texts(
+            self.pr.id, "hi", "simplified", [(1, "Point two again", "Title two")]
+        )
+        self.assertEqual(
+            self.get_rows(), [self.rows[0], (1, "Point two again", "Title two")]
+        )
+        self.assertEqual(TranslatedText.objects.filter(press_release=self.pr).count(), 2)
+
+
+class DedupeTranslatedTextsTest(TestCase):
+    def setUp(self):
+        self.pr = PressRelease.objects.create(
+            title="Press Release",
+            original_text="Text",
+            source_url="https://www.pib.gov.in/release",
+            date_published=timezone.now(),
+            ministry=Ministry.objects.create(name="Test Ministry"),
+        )
+
+    def create_rows(self, text_type, contents, created_at, first_ordinal=0):
+        for ordinal, content in enumerate(contents, start=first_ordinal):
+            text = TranslatedText.objects.create(
+                press_release=self.pr, language="en", text_type=text_type,
+                ordinal=ordinal, content=content,
+            )
+            # auto_now_add can't be set on create
+            TranslatedText.objects.filter(id=text.id).update(created_at=created_at)
+
+    def get_rows(self, text_type):
+        return list(
+            self.pr.translations.filter(text_type=text_type)
+            .order_by("ordinal")
+            .values_list("ordinal", "content")
+        )
+
+    def test_keeps_newest_generation_and_renumbers(self):
+        now = timezone.now()
+        self.create_rows("keypoints", ["a", "b", "c"], now - timedelta(hours=1))
+        # Regenerated with different wording and one point less
+        self.create_rows("keypoints", ["A", "B"], now, first_ordinal=3)
+        self.create_rows("summary", ["Summary"], now - timedelta(hours=1))
+        self.create_rows("summary", ["Retried summary"], now, first_ordinal=1)
+
+        call_command("dedupe_translated_texts", stdout=StringIO())
+
+        self.assertEqual(self.get_rows("keypoints"), [(0, "A"), (1, "B")])
+        self.assertEqual(self.get_rows("summary"), [(0, "Retried summary")])
+
+    def test_identical_points_of_one_generation_are_kept(self):
+        self.create_rows("keypoints", ["Same", "Same", "Other"], timezone.now())
+        call_command("dedupe_translated_texts", stdout=StringIO())
+        self.assertEqual(
+            self.get_rows("keypoints"), [(0, "Same"), (1, "Same"), (2, "Other")]
+        )
+
+
+class TranslationCoverageTest(TestCase):
+    def setUp(self):
+        ministry = Ministry.objects.create(name="Test Ministry")
+        self.prs = [
+            PressRelease.objects.create(
+                title="Press Release",
+                original_text="Text",
+                source_url=f"https://www.pib.gov.in/release{i}",
+                date_published=timezone.now(),
+                ministry=ministry,
+            )
+            for i in range(2)
+        ]
+        _bulk_save_translated_texts(self.prs[0].id, "en", "original", [(0, "Text", None)])
+        _bulk_save_translated_texts(
+            self.prs[0].id, "hi", "keypoints", [(0, "One", None), (1, "Two", None)]
+        )
+
+    def test_single_query_for_many_releases(self):
+        with self.assertNumQueries(1):
+            coverage = get_translation_coverage([pr.id for pr in self.prs])
+        self.assertEqual(
+            coverage,
+            {self.prs[0].id: {"original": {"en"}, "keypoints": {"hi"}}, self.prs[1].id: {}},
+        )
+
+    def test_missing_translations(self):
+        missing = get_missing_translations({"original": {"en"}, "keypoints": {"hi"}})
+        self.assertEqual(missing["original"], [])
+        self.assertIn("en", missing["keypoints"])
+        self.assertNotIn("hi", missing["keypoints"])
+        self.assertIn("hi", missing["summary"])
+
+
+class TranslateReleaseLanguageTest(TestCase):
+    def setUp(self):
+        self.pr = PressRelease.objects.create(
+            title="Press Release",
+            original_text="Text",
+            source_url="https://www.pib.gov.in/release",
+            date_published=timezone.now(),
+            ministry=Ministry.objects.create(name="Test Ministry"),
+        )
+        _bulk_save_translated_texts(self.pr.id, "en", "summary", [(0, "Summary", "Headline")])
+        _bulk_save_translated_texts(
+            self.pr.id, "en", "keypoints", [(0, "One", None), (1, "Two", None)]
+        )
+
+    def get_rows(self, language):
+        return list(
+            self.pr.translations.filter(language=language)
+            .order_by("text_type", "ordinal")
+            .values_list("text_type", "ordinal", "content", "title")
+        )
+
+    @mock.patch("core.tasks.translate_texts_gemini")
+    def test_one_translation_call_for_all_text_types(self, translate):
+        translate.side_effect = lambda texts, language: [f"{language}:{text}" for text in texts]
+        translate_release_language(self.pr.id, "hi", ["summary", "keypoints"])
+
+        translate.assert_called_once_with(["One", "Two", "Summary", "Headline"], "hi")
+        self.assertEqual(
+            self.get_rows("hi"),
+            [
+                ("keypoints", 0, "hi:One", None),
+                ("keypoints", 1, "hi:Two", None),
+                ("summary", 0, "hi:Summary", "hi:Headline"),
+            ],
+        )
+
+    @mock.patch("core.tasks.translate_texts_gemini")
+    def test_full_section_rerun_deletes_leftover_segments(self, translate):
+        translate.side_effect = lambda texts, language: [f"{language}:{text}" for text in texts]
+        _bulk_save_translated_texts(
+            self.pr.id, "hi", "keypoints", [(i, f"Old {i}", None) for i in range(3)]
+        )
+        process_and_save_translated_batch(self.pr.id, "hi", "keypoints")
+        self.assertEqual(
+            self.get_rows("hi"),
+            [("keypoints", 0, "hi:One", None), ("keypoints", 1, "hi:Two", None)],
+        )
+
+    @mock.patch("core.tasks.translate_texts_gemini")
+    def test_point_batch_keeps_other_segments(self, translate):
+        translate.side_effect = lambda texts, language: [f"{language}:{text}" for text in texts]
+        _bulk_save_translated_texts(
+            self.pr.id, "hi", "keypoints", [(i, f"Old {i}", None) for i in range(3)]
+        )
+        process_and_save_translated_batch(self.pr.id, "hi", "keypoints", [0])
+        self.assertEqual(len(self.get_rows("hi")), 3)
+
+    @mock.patch("core.tasks.translate_texts_gemini")
+    def test_batch_translates_only_given_ordinals(self, translate):
+        translate.side_effect = lambda texts, language: [f"{language}:{text}" for text in texts]
+        process_and_save_translated_batch(self.pr.id, "ta", "keypoints", [1])
+
+        translate.assert_called_once_with(["Two"], "ta")
+        self.assertEqual(self.get_rows("ta"), [("keypoints", 1, "ta:Two", None)])
+
+
+class ChordRecorder:
+    """Stands in for celery.chord, keeps (tasks, callback) instead of running them."""
+
+    def __init__(self):
+        self.chords = []
+
+    def __call__(self, tasks):
+        # A group's signatures are in .tasks, iterating it yields its dict keys
+        tasks = list(getattr(tasks, "tasks", tasks))
+        return lambda callback: self.chords.append((tasks, callback))
+
+
+class ProcessPressReleaseContentTest(TestCase):
+    url = "https://www.pib.gov.in/release"
+
+    def setUp(self):
+        app.conf.task_always_eager = True
+        self.addCleanup(setattr, app.conf, "task_always_eager", False)
+
+        self.redis = MemoryRedis()
+        self.chord = ChordRecorder()
+        sections = [
+            (name, model(**stub_payload(model)))
+            for name, model in (
+                ("simplified", SimplifiedResponse),
+                ("summary", SummaryResponse),
+                ("oversimplified", OversimplifiedResponse),
+                ("keypoints", KeyPointsResponse),
+            )
+        ]
+        for target, value in (
+            ("core.tasks.get_redis", mock.Mock(return_value=self.redis)),
+            ("core.tasks.chord", self.chord),
+            ("core.tasks.iter_sections", mock.Mock(return_value=iter(sections))),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def process(self):
+        process_press_release_content(
+            self.url,
+            "Test Ministry",
+            PressReleaseContent(content="Text", date_published="2025-01-01T00:00:00Z"),
+        )
+        return PressRelease.objects.get(source_url=self.url)
+
+    def test_active_after_last_section_chord(self):
+        pr = self.process()
+        # One chord per section, none finished yet
+        self.assertEqual(len(self.chord.chords), 4)
+        self.assertFalse(pr.active)
+
+        for _, callback in self.chord.chords[:-1]:
+            callback.apply()
+            pr.refresh_from_db()
+            self.assertFalse(pr.active)
+        self.chord.chords[-1][1].apply()
+        pr.refresh_from_db()
+        self.assertTrue(pr.active)
+
+    def test_redis_down_runs_one_chord_then_activates(self):
+        self.redis.down = True
+        pr = self.process()
+        self.assertFalse(pr.active)
+        self.assertEqual(len(self.chord.chords), 1)
+
+        tasks, callback = self.chord.chords[0]
+        self.assertEqual({task.args[2] for task in tasks}, set(TEXT_TYPES) - {"original"})
+        callback.apply()
+        pr.refresh_from_db()
+        self.assertTrue(pr.active)
+
+    def test_hold_failure_defers_to_final_chord(self):
+        incr = self.redis.incr
+        calls = []
+
+        def flaky_incr(key):
+            calls.append(key)
+            if len(calls) > 2:
+                raise redis.ConnectionError("down")
+            return incr(key)
+
+        self.redis.incr = flaky_incr
+        pr = self.process()
+        # Two sections got their own chord, the others run in one final chord
+        self.assertEqual(len(self.chord.chords), 3)
+        for _, callback in self.chord.chords:
+            self.assertFalse(pr.active)
+            callback.apply()
+            pr.refresh_from_db()
+        self.assertTrue(pr.active)
+
+    @override_settings(LLM_STREAMING=True, LLM_STREAMING_TRANSLATION_BATCH_SIZE=3)
+    @mock.patch("core.tasks.iter_section_events")
+    def test_streamed_points_are_translated_in_batches(self, iter_section_events):
+        summary = SummaryResponse(**stub_payload(SummaryResponse))
+        points = [("keypoints", "point", (i, KeyPoint(point=f"Point {i}"))) for i in range(5)]
+        iter_section_events.return_value = iter(
+            [("summary", "section", summary), *points, ("keypoints", "end", 5)]
+        )
+        pr = PressRelease.objects.create(
+            title="Old", original_text="Text", source_url=self.url,
+            date_published="2025-01-01T00:00:00Z",
+        )
+        # Left over from an earlier run with more points
+        _bulk_save_translated_texts(pr.id, "hi", "keypoints", [(i, "Old", None) for i in range(7)])
+
+        self.process()
+        keypoint_chords = [
+            [task.args[3] for task in tasks]
+            for tasks, _ in self.chord.chords
+            if tasks[0].args[2] == "keypoints"
+        ]
+        self.assertEqual([ordinals[0] for ordinals in keypoint_chords], [[0, 1, 2], [3, 4]])
+        self.assertEqual(
+            list(pr.translations.filter(language="en", text_type="keypoints")
+                 .order_by("ordinal").values_list("content", flat=True)),
+            [f"Point {i}" for i in range(5)],
+        )
+        self.assertFalse(pr.translations.filter(ordinal__gte=5).exists())
+
+    def test_release_stays_inactive_while_redis_is_down(self):
+        pr = self.process()
+        self.redis.down = True
+        for _, callback in self.chord.chords:
+            callback.apply()
+        pr.refresh_from_db()
+        self.assertFalse(pr.active)
+
+        # Each callback retries and releases its hold once Redis is back
+        self.redis.down = False
+        for _, callback in self.chord.chords:
+            release_activation_latch.apply(args=(pr.id,))
+        pr.refresh_from_db()
+        self.assertTrue(pr.active)
+
+
+class InitialPibScrapeTaskTest(TestCase):
+    state = {"etag": '"v2"', "body_hash": "abc"}
+
+    def setUp(self):
+        metas = [
+            PressReleaseMetadata(ministry="Test Ministry", title="Title", url=f"https://www.pib.gov.in/{i}")
+            for i in range(2)
+        ]
+        for target, value in (
+            (
+                "core.tasks.get_press_release_metadata",
+                mock.Mock(
+                    return_value=PressReleaseMetadataList(
+                        press_releases=metas, listing_state=self.state
+                    )
+                ),
+            ),
+            ("core.tasks.filter_seen_urls", mock.Mock(return_value=set())),
+            ("core.tasks.mark_urls_seen", mock.Mock()),
+            ("core.tasks.get_press_release_content", mock.Mock()),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch("core.tasks.save_listing_state")
+        self.save_listing_state = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(SCRAPE_FANOUT_MODE="sync")
+    @mock.patch("core.tasks.process_press_release_content")
+    def test_saves_listing_state_after_every_release_is_stored(self, process):
+        initial_pib_scrape_task()
+        self.save_listing_state.assert_called_once_with(self.state)
+
+    @override_settings(SCRAPE_FANOUT_MODE="sync")
+    @mock.patch("core.tasks.process_press_release_content")
+    def test_failed_release_keeps_listing_pending(self, process):
+        process.side_effect = [mock.Mock(), RuntimeError("LLM down")]
+        initial_pib_scrape_task()
+        self.save_listing_state.assert_not_called()
+
+    @override_settings(SCRAPE_FANOUT_MODE="sync")
+    @mock.patch("core.tasks.process_press_release_content", return_value=None)
+    def test_release_without_content_keeps_listing_pending(self, process):
+        initial_pib_scrape_task()
+        self.save_listing_state.assert_not_called()
+
+    @override_settings(SCRAPE_FANOUT_MODE="sync")
+    @mock.patch("core.tasks.process_press_release_content")
+    def test_partial_run_keeps_listing_pending(self, process):
+        initial_pib_scrape_task(limit=1)
+        self.assertNotIn(mock.call(self.state), self.save_listing_state.mock_calls)
+
+
+class FanOutPressReleasesTest(TestCase):
+    state = {"etag": '"v2"', "body_hash": "abc"}
+
+    def setUp(self):
+        self.metas = [
+            PressReleaseMetadata(ministry="Test Ministry", title="Title", url=f"https://www.pib.gov.in/{i}")
+            for i in range(3)
+        ]
+        self.urls = [str(meta.url) for meta in self.metas]
+        self.pages = {url: PressReleaseContent(content=f"Text of {url}") for url in self.urls}
+        self.mocks = {}
+        for name, value in (
+            ("save_listing_state", None),
+            ("get_press_release_content", None),
+            ("get_press_release_contents", self.pages),
+            ("process_press_release_content", mock.sentinel.press_release),
+        ):
+            patcher = mock.patch(f"core.tasks.{name}", return_value=value)
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mocks["get_press_release_content"].side_effect = lambda url: self.pages[url]
+
+    def processed(self):
+        """(url, ministry, content) of every process_press_release_content call, sorted."""
+        calls = self.mocks["process_press_release_content"].call_args_list
+        return sorted(call.args[:3] for call in calls)
+
+    def expected(self):
+        return [(url, "Test Ministry", self.pages[url]) for url in self.urls]
+
+    @override_settings(SCRAPE_FANOUT_MODE="thread", SCRAPE_CONCURRENCY=2)
+    def test_thread_mode_processes_prefetched_pages(self):
+        self.assertEqual(_fan_out_press_releases(self.metas, self.state), 3)
+        self.assertEqual(
+            list(self.mocks["get_press_release_contents"].call_args.args[0]), self.urls
+        )
+        self.mocks["get_press_release_content"].assert_not_called()
+        self.assertEqual(self.processed(), self.expected())
+        self.mocks["save_listing_state"].assert_called_once_with(self.state)
+
+    @override_settings(SCRAPE_FANOUT_MODE="thread", SCRAPE_CONCURRENCY=2)
+    def test_thread_mode_failure_keeps_listing_pending(self):
+        self.mocks["process_press_release_content"].side_effect = (
+            lambda url, *args: None if url == self.urls[1] else mock.sentinel.press_release
+        )
+        self.assertEqual(_fan_out_press_releases(self.metas, self.state), 2)
+        self.mocks["save_listing_state"].assert_not_called()
+
+    @override_settings(SCRAPE_FANOUT_MODE="sync")
+    def test_sync_mode_fetches_and_processes_in_order(self):
+        self.assertEqual(_fan_out_press_releases(self.metas, self.state), 3)
+        fetched = self.mocks["get_press_release_content"].call_args_list
+        self.assertEqual([call.args[0] for call in fetched], self.urls)
+        self.mocks["get_press_release_contents"].assert_not_called()
+        self.assertEqual(self.processed(), self.expected())
+        self.mocks["save_listing_state"].assert_called_once_with(self.state)
+
+    @override_settings(SCRAPE_FANOUT_MODE="celery")
+    def test_celery_mode_saves_state_in_chord_callback(self):
+        recorder = ChordRecorder()
+        with mock.patch("core.tasks.chord", recorder):
+            self.assertEqual(_fan_out_press_releases(self.metas, self.state), 3)
+        [(tasks, callback)] = recorder.chords
+        self.assertEqual(
+            [(task.task, task.args) for task in tasks],
+            [
+                ("core.tasks.process_single_press_release", (url, "Test Ministry"))
+                for url in self.urls
+            ],
+        )
+        self.assertEqual(callback.task, "core.tasks.save_listing_state_when_processed")
+        self.assertEqual(callback.args, (self.state,))
+        self.mocks["save_listing_state"].assert_not_called()
+
+    @override_settings(SCRAPE_FANOUT_MODE="celery")
+    def test_celery_mode_without_state_dispatches_group(self):
+        with mock.patch("core.tasks.group") as group, mock.patch("core.tasks.chord") as chord:
+            _fan_out_press_releases(self.metas)
+        group.return_value.apply_async.assert_called_once()
+        chord.assert_not_called()
+
+    def test_chord_callback_saves_state_only_when_all_succeeded(self):
+        save_listing_state_when_processed([True, False], self.state)
+        self.mocks["save_listing_state"].assert_not_called()
+        save_listing_state_when_processed([True, True], self.state)
+        self.mocks["save_listing_state"].assert_called_once_with(self.state)
+
+    def test_no_releases_saves_state(self):
+        self.assertEqual(_fan_out_press_releases([], self.state), 0)
+        self.mocks["save_listing_state"].assert_called_once_with(self.state)
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+from unittest import mock
+from django.test import SimpleTestCase
+from core.utils.translate_client import (
+    MAX_PACKED_CHARS,
+    SEGMENT_SEPARATOR,
+    translate_many,
+)
+
+
+class FakeTranslator:
+    """Upper-cases every text, optionally dropping the separator like a bad reply."""
+
+    def __init__(self, mangle=False):
+        self.mangle = mangle
+        self.requests = []
+
+    async def translate(self, texts, dest):
+        self.requests.append(list(texts))
+        replies = [text.upper() for text in texts]
+        if self.mangle:
+            replies = [reply.replace("||||", "|") for reply in replies]
+        return [SimpleNamespace(text=reply) for reply in replies]
+
+
+class TranslateManyTest(SimpleTestCase):
+    def translate(self, texts, translator):
+        with mock.patch(
+            "core.utils.translate_client.get_translator", return_value=translator
+        ):
+            return translate_many(texts, target_language="hi")
+
+    def test_segments_are_packed_into_one_request(self):
+        translator = FakeTranslator()
+        translated = self.translate(["one", "two", "three"], translator)
+        self.assertEqual(translated, ["ONE", "TWO", "THREE"])
+        self.assertEqual(
+            translator.requests, [[SEGMENT_SEPARATOR.join(["one", "two", "three"])]]
+        )
+
+    def test_empty_and_duplicate_texts_are_not_sent(self):
+        translator = FakeTranslator()
+        translated = self.translate(["one", "", "one", "  "], translator)
+        self.assertEqual(translated, ["ONE", "", "ONE", "  "])
+        self.assertEqual(translator.requests, [["one"]])
+
+    def test_packs_stay_under_the_char_limit(self):
+        texts = [f"{i}" + "x" * 1000 for i in range(10)]
+        translator = FakeTranslator()
+        translated = self.translate(texts, translator)
+        self.assertEqual(translated, [text.upper() for text in texts])
+        packed = translator.requests[0]
+        self.assertGreater(len(packed), 1)
+        for request in packed:
+            self.assertLessEqual(len(request), MAX_PACKED_CHARS)
+
+    def test_mangled_separator_falls_back_to_single_segments(self):
+        translator = FakeTranslator(mangle=True)
+        translated = self.translate(["one", "two"], translator)
+        self.assertEqual(translated, ["ONE", "TWO"])
+        self.assertEqual(
+            translator.requests,
+            [[SEGMENT_SEPARATOR.join(["one", "two"])], ["one", "two"]],
+        )
@@ -0,0 +1,56 @@
+from unittest import mock
+from django.test import SimpleTestCase
+from core.tests.fakes import MemoryRedis
+from core.utils.translation_cache import (
+    cache_translations,
+    get_cached_translations,
+    get_translation_cache_stats,
+    translation_cache_key,
+)
+
+
+class TranslationCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = MemoryRedis()
+        patcher = mock.patch(
+            "core.utils.translation_cache.get_redis", return_value=self.redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hits_and_misses_in_one_lookup(self):
+        cache_translations({"hello": "नमस्ते", "empty": ""}, "hi")
+        with mock.patch.object(self.redis, "mget", wraps=self.redis.mget) as mget:
+            cached = get_cached_translations(["hello", "world", "hello", "empty"], "hi")
+        self.assertEqual(cached, {"hello": "नमस्ते"})
+        mget.assert_called_once()
+        self.assertEqual(len(mget.call_args.args[0]), 3)
+
+    def test_key_ignores_whitespace_differences(self):
+        self.assertEqual(
+            translation_cache_key("Hello   world\n", "hi"),
+            translation_cache_key(" Hello world", "hi"),
+        )
+        self.assertNotEqual(
+            translation_cache_key("Hello world", "hi"),
+            translation_cache_key("Hello world", "ta"),
+        )
+        cache_translations({"Hello  world": "नमस्ते दुनिया"}, "hi")
+        self.assertEqual(
+            get_cached_translations(["Hello world"], "hi"),
+            {"Hello world": "नमस्ते दुनिया"},
+        )
+
+    def test_stats(self):
+        cache_translations({"hello": "नमस्ते"}, "hi")
+        get_cached_translations(["hello", "world"], "hi")
+        get_cached_translations(["hello"], "hi")
+        self.assertEqual(
+            get_translation_cache_stats(),
+            {"hits": 2, "misses": 1, "hit_rate": 2 / 3},
+        )
+
+    def test_redis_down_is_a_miss(self):
+        self.redis.down = True
+        self.assertEqual(get_cached_translations(["hello"], "hi"), {})
+        cache_translations({"hello": "नमस्ते"}, "hi")
@@ -1,10 +1,20 @@
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 from core.models import PressRelease, Ministry, AudienceType, Category, TranslatedText
 from datetime import datetime, timedelta
 from core.constants import LANGUAGE_CHOICES, TEXT_TYPE_CHOICES
+from core.views import PressReleaseList
+
+# Cached responses are invalidated on commit, which never happens inside a
+# TestCase, so every test starts from an empty local cache
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
 
 class HealthCheckTests(APITestCase):
     def test_health_check(self):
@@ -13,8 +23,10 @@ class HealthCheckTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, {'status': 'ok'})
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class PressReleaseAPITests(APITestCase):
     def setUp(self):
+        cache.clear()
         # Create test data
         self.ministry = Ministry.objects.create(name="Test Ministry")
         self.audience = AudienceType.objects.create(name="Test Audience")
@@ -74,6 +86,35 @@ class PressReleaseAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Test Press Release 1')
 
+@override_settings(CACHES=LOCMEM_CACHES)
+class PressReleaseCountTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        release = PressRelease.objects.create(
+            title="Test Press Release",
+            original_text="Text",
+            source_url="https://example.com/test",
+            date_published=timezone.now(),
+            active=True,
+        )
+        # Both audiences match the filter below
+        for name in ("Farmers", "Students"):
+            release.audience_type.add(AudienceType.objects.create(name=name))
+
+    def count(self, params):
+        view = PressReleaseList()
+        view.request = Request(APIRequestFactory().get("/v1/press-releases/", params))
+        view.format_kwarg = None
+        view.paginate_queryset(PressRelease.objects.none())
+        return view.paginator.page.paginator.count
+
+    def test_m2m_filter_counts_each_release_once(self):
+        self.assertEqual(self.count({"audience_type_name": "s"}), 1)
+
+    def test_unfiltered_count(self):
+        self.assertEqual(self.count({}), 1)
+
+
 class TranslatedTextAPITests(APITestCase):
     def setUp(self):
         self.ministry = Ministry.objects.create(name="Test Ministry")
@@ -99,14 +140,55 @@ class TranslatedTextAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
+    def test_translated_texts_in_segment_order(self):
+        # Streamed points are saved as their tasks finish, in any order
+        for ordinal in (2, 0, 1):
+            TranslatedText.objects.create(
+                press_release=self.press_release,
+                language="hi",
+                text_type="keypoints",
+                ordinal=ordinal,
+                content=f"Point {ordinal}",
+            )
+        url = reverse('translated-text-list')
+        response = self.client.get(
+            url, {'press_release': self.press_release.id, 'language': 'hi', 'text_type': 'keypoints'}
+        )
+        self.assertEqual(
+            [text['ordinal'] for text in response.data['results']], [0, 1, 2]
+        )
+
+    def test_unfiltered_list_groups_segments_by_release(self):
+        other = PressRelease.objects.create(
+            title="Other Press Release",
+            original_text="Other text",
+            source_url="https://example.com/other",
+            date_published=timezone.now(),
+        )
+        for press_release, ordinal in ((other, 1), (self.press_release, 1), (other, 0)):
+            TranslatedText.objects.create(
+                press_release=press_release,
+                language="hi",
+                text_type="keypoints",
+                ordinal=ordinal,
+                content=f"Point {ordinal}",
+            )
+        response = self.client.get(reverse('translated-text-list'), {'text_type': 'keypoints'})
+        self.assertEqual(
+            [(text['press_release'], text['ordinal']) for text in response.data['results']],
+            [(self.press_release.id, 1), (other.id, 0), (other.id, 1)],
+        )
+
     def test_filter_translated_texts_by_press_release(self):
         url = reverse('translated-text-list')
         response = self.client.get(url, {'press_release': self.press_release.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class MetadataAPITests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.ministry = Ministry.objects.create(name="Test Ministry")
         self.audience = AudienceType.objects.create(name="Test Audience")
         self.category = Category.objects.create(name="Test Category")
@@ -138,8 +220,10 @@ class MetadataAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class UniquePIBHQTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.ministry = Ministry.objects.create(name="Test Ministry")
         PressRelease.objects.create(
             title="Test Press Release 1",
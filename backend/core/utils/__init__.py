@@ -3,10 +3,23 @@ from .ai_processor import (
     generate_oversimplified_text,
     generate_summary,
     generate_keypoints,
+    generate_sections,
+    iter_sections,
+    iter_section_events,
     translate_text_gemini,
+    translate_texts_gemini,
 )
 from .scraper import (
     get_press_release_metadata,
     get_press_release_content,
+    get_press_release_contents,
+    get_listing_poll_stats,
+    save_listing_state,
 )
-from .secrets import get_pib_secrets, get_payload
\ No newline at end of file
+from .secrets import get_pib_secrets, get_payload
+from .seen_urls import filter_seen_urls, mark_urls_seen
+from .translation_cache import get_translation_cache_stats
+from .llm_cache import get_llm_cache_stats
+from .llm_clients import get_llm_client_stats
+from .redis_client import get_redis
+from .response_cache import invalidate_tags
@@ -3,197 +3,271 @@
 
 
 import json
+import queue
 import re
-import time
-import threading
 import logging
-from google import genai
-from google.genai import types
-from groq import Groq
+from typing import List, get_args, get_origin
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.conf import settings
+from pydantic import ValidationError
 from ..constants.prompt import (
     SIMPLIFIED_PROMPT,
     OVERSIMPLIFIED_PROMPT,
     SUMMARY_PROMPT,
     KEYPOINTS_PROMPT,
     TRANSLATE_PROMPT,
+    COMBINED_PROMPT,
 )
 from ..constants.response_models import (
     SimplifiedResponse,
     OversimplifiedResponse,
     SummaryResponse,
     KeyPointsResponse,
+    CombinedResponse,
     TranslatedText,
 )
-from .json_parser import json_load
-from .translate_client import translate_text
+from .json_parser import json_load, JSONArrayItemParser
+from .llm_cache import llm_cache_key, get_cached_llm_response, cache_llm_response
+from .llm_providers import get_llm_provider, get_answering_model, parse_response
+from .translate_client import translate_many
+from .translation_cache import get_cached_translations, cache_translations
 
 logger = logging.getLogger(__name__)
 
 
-class RateLimiter:
-    """Rate limiter using token bucket algorithm for Gemini API (1000 requests/minute)"""
-
-    def __init__(self, max_requests=1000, time_window=60):
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.tokens = max_requests
-        self.last_refill = time.time()
-        self.lock = threading.Lock()
-
-    def acquire(self):
-        """Acquire a token, blocking if necessary"""
-        with self.lock:
-            now = time.time()
-            # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            tokens_to_add = elapsed * (self.max_requests / self.time_window)
-            self.tokens = min(self.max_requests, self.tokens + tokens_to_add)
-            self.last_refill = now
-
-            if self.tokens >= 1:
-                self.tokens -= 1
-                return True
-            else:
-                # Calculate wait time for next token
-                wait_time = (1 - self.tokens) * (self.time_window / self.max_requests)
-                return wait_time
+def get_llm_client():
+    """Returns a generate(system_prompt, user_prompt) -> str function, or None."""
+    provider = get_llm_provider()
+    return provider.generate_text if provider else None
 
 
-# Global rate limiter instance
-gemini_rate_limiter = RateLimiter(
-    max_requests=950, time_window=60
-)  # Slightly under limit for safety
+def get_llm_model_name():
+    """Name of the model get_llm_client() tries first, part of the LLM cache key."""
+    provider = get_llm_provider()
+    return provider.model if provider else None
 
 
-def generate_gemini(system_prompt, user_prompt):
-    """Generate content with Gemini API with rate limiting - waits indefinitely until successful"""
+def _answered_cache_key(prompt_id, system_prompt, original_text):
+    """
+    LLM cache key for the reply just received, under the model that actually
+    answered so a failover fallback's output isn't filed under the primary.
+    """
+    return llm_cache_key(prompt_id, system_prompt, get_answering_model(), original_text)
 
-    while True:
-        try:
-            # Rate limiting - wait until we can proceed
-            result = gemini_rate_limiter.acquire()
-            if result is not True:
-                wait_time = result
-                logger.info(f"Rate limit reached, waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-                # Try to acquire again after waiting
-                gemini_rate_limiter.acquire()
-
-            client = genai.Client(
-                api_key=settings.GEMINI_API_KEY,
-            )
 
-            model = "gemini-2.5-flash-preview-05-20"
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[
-                        types.Part.from_text(text=user_prompt),
-                    ],
-                ),
-            ]
-            generate_content_config = types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                thinking_config=types.ThinkingConfig(
-                    thinking_budget=0,
-                ),
-                response_mime_type="application/json",
-            )
+def generate_structured(prompt_id, system_prompt, original_text, response_model):
+    """
+    Runs system_prompt on original_text and parses the JSON reply into response_model.
 
-            response = client.models.generate_content(
-                model=model,
-                contents=contents,
-                config=generate_content_config,
-            )
+    Parsed responses are cached on (prompt id/version, model, sha256(original_text)),
+    so retries and reprocessing of the same release don't call the LLM again,
+    while editing a prompt invalidates its entries.
+    """
+    cache_key = llm_cache_key(
+        prompt_id, system_prompt, get_llm_model_name(), original_text
+    )
+    cached = get_cached_llm_response(cache_key, response_model)
+    if cached is not None:
+        logger.info(f"LLM cache hit for {prompt_id}")
+        return cached
+
+    response = get_llm_provider().generate(system_prompt, original_text, response_model)
+    cache_llm_response(
+        _answered_cache_key(prompt_id, system_prompt, original_text), response
+    )
+    return response
 
-            return response.text
 
-        except Exception as e:
-            error_message = str(e).lower()
-            logger.error(f"Gemini API error: {e}")
-
-            # Check if it's a rate limit error
-            if any(
-                keyword in error_message
-                for keyword in ["rate limit", "quota", "too many requests", "429"]
-            ):
-                # For rate limit errors, wait and try again indefinitely
-                wait_time = 60  # Wait 1 minute before trying again
-                logger.warning(
-                    f"Rate limit error encountered, waiting {wait_time} seconds before retry..."
-                )
-                time.sleep(wait_time)
-                continue  # Keep trying indefinitely
-            else:
-                raise
-
-
-def generate_groq(system_prompt, user_prompt):
-    """Generate content with Groq API"""
-
-    try:
-        client = Groq(api_key=settings.GROQ_API_KEY)
-
-        completion = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.1,  # Lower temperature for more consistent JSON output
-            max_completion_tokens=8000,
-            top_p=1,
-            stream=False,  # Disable streaming for JSON response parsing
-            stop=None,
-        )
+def generate_simplified_text(original_text):
+    return generate_structured(
+        "simplified", SIMPLIFIED_PROMPT, original_text, SimplifiedResponse
+    )
 
-        return completion.choices[0].message.content
 
-    except Exception as e:
-        logger.error(f"Groq API error: {e}")
-        raise
+def generate_oversimplified_text(original_text):
+    return generate_structured(
+        "oversimplified", OVERSIMPLIFIED_PROMPT, original_text, OversimplifiedResponse
+    )
 
 
-def get_llm_client():
-    if settings.GROQ_API_KEY:
-        return generate_groq
-    elif settings.GEMINI_API_KEY:
-        return generate_gemini
-    else:
-        return None
+def generate_summary(original_text):
+    return generate_structured("summary", SUMMARY_PROMPT, original_text, SummaryResponse)
 
 
-def generate_simplified_text(original_text):
-    simplified_output = get_llm_client()(
-        system_prompt=SIMPLIFIED_PROMPT, user_prompt=original_text
+def generate_keypoints(original_text):
+    return generate_structured(
+        "keypoints", KEYPOINTS_PROMPT, original_text, KeyPointsResponse
     )
-    json_response = json_load(simplified_output)
-    return SimplifiedResponse(**json_response)
 
 
-def generate_oversimplified_text(original_text):
-    oversimplified_output = get_llm_client()(
-        system_prompt=OVERSIMPLIFIED_PROMPT, user_prompt=original_text
-    )
-    json_response = json_load(oversimplified_output)
-    return OversimplifiedResponse(**json_response)
+# Section name -> (prompt, response model) for the English generation steps
+SECTIONS = {
+    "summary": (SUMMARY_PROMPT, SummaryResponse),
+    "simplified": (SIMPLIFIED_PROMPT, SimplifiedResponse),
+    "oversimplified": (OVERSIMPLIFIED_PROMPT, OversimplifiedResponse),
+    "keypoints": (KEYPOINTS_PROMPT, KeyPointsResponse),
+}
 
 
-def generate_summary(original_text):
-    summary_output = get_llm_client()(
-        system_prompt=SUMMARY_PROMPT, user_prompt=original_text
+def generate_combined_sections(original_text):
+    """
+    Generates all sections with a single COMBINED_PROMPT call.
+
+    Each section of the reply is validated on its own, only the sections that
+    are missing or fail validation are regenerated with their own prompt.
+    Returns a dict of section name -> response model.
+    """
+    cache_key = llm_cache_key(
+        "combined", COMBINED_PROMPT, get_llm_model_name(), original_text
+    )
+    cached = get_cached_llm_response(cache_key, CombinedResponse)
+    if cached is not None:
+        logger.info("LLM cache hit for combined")
+        return {name: getattr(cached, name) for name in SECTIONS}
+
+    output = get_llm_client()(system_prompt=COMBINED_PROMPT, user_prompt=original_text)
+    # Taken before the per-section fallbacks below make requests of their own
+    answered_key = _answered_cache_key("combined", COMBINED_PROMPT, original_text)
+    json_response = json_load(output) or {}
+
+    sections = {}
+    for name, (prompt, response_model) in SECTIONS.items():
+        try:
+            sections[name] = response_model(**json_response[name])
+        except (KeyError, TypeError, ValidationError) as e:
+            logger.warning(
+                f"Combined response has no valid '{name}' section ({e}), "
+                "generating it separately"
+            )
+            sections[name] = generate_structured(name, prompt, original_text, response_model)
+
+    cache_llm_response(answered_key, CombinedResponse(**sections))
+    return sections
+
+
+def iter_sections(original_text):
+    """
+    Generates every English section (summary, simplified, oversimplified,
+    keypoints) according to LLM_GENERATION_MODE, yielding (name, response)
+    pairs as soon as each section is ready.
+
+    In "separate" mode the four independent calls run concurrently on a
+    thread pool, every call still goes through the shared rate limiter.
+    """
+    if settings.LLM_GENERATION_MODE == "combined":
+        yield from generate_combined_sections(original_text).items()
+        return
+
+    with ThreadPoolExecutor(max_workers=len(SECTIONS)) as executor:
+        futures = {
+            executor.submit(
+                generate_structured, name, prompt, original_text, response_model
+            ): name
+            for name, (prompt, response_model) in SECTIONS.items()
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def generate_sections(original_text):
+    """Returns a dict of section name -> response model, see iter_sections."""
+    return dict(iter_sections(original_text))
+
+
+def _array_item_models(response_model):
+    """Field name -> item model of every list field of response_model."""
+    return {
+        name: get_args(field.annotation)[0]
+        for name, field in response_model.model_fields.items()
+        if get_origin(field.annotation) in (list, List)
+    }
+
+
+def stream_structured(prompt_id, system_prompt, original_text, response_model):
+    """
+    Streaming generate_structured.
+
+    Yields (array key, item) as soon as each item of the response's arrays
+    (summary_points, story_points, key_summary_points) is complete, then
+    (None, response) with the validated full response, which is cached like
+    generate_structured does. Cache hits replay the cached items.
+    """
+    item_models = _array_item_models(response_model)
+    cache_key = llm_cache_key(
+        prompt_id, system_prompt, get_llm_model_name(), original_text
     )
-    json_response = json_load(summary_output)
-    return SummaryResponse(**json_response)
+    cached = get_cached_llm_response(cache_key, response_model)
+    if cached is not None:
+        logger.info(f"LLM cache hit for {prompt_id}")
+        for key in item_models:
+            for item in getattr(cached, key):
+                yield key, item
+        yield None, cached
+        return
+
+    parser = JSONArrayItemParser(item_models)
+    chunks = get_llm_provider().stream_text(system_prompt, original_text, response_model)
+    for chunk in chunks:
+        for key, item in parser.feed(chunk):
+            try:
+                yield key, item_models[key](**item)
+            except (TypeError, ValidationError) as e:
+                logger.warning(f"Skipping invalid streamed {prompt_id} item ({e})")
+
+    response = parse_response(parser.text, response_model)
+    cache_llm_response(
+        _answered_cache_key(prompt_id, system_prompt, original_text), response
+    )
+    yield None, response
 
 
-def generate_keypoints(original_text):
-    keypoints_output = get_llm_client()(
-        system_prompt=KEYPOINTS_PROMPT, user_prompt=original_text
-    )
-    json_response = json_load(keypoints_output)
-    return KeyPointsResponse(**json_response)
+def iter_section_events(original_text):
+    """
+    Streaming iter_sections.
+
+    Yields (name, "point", (ordinal, item)) for every point of the list
+    sections as soon as the model has written it, (name, "end", count) once
+    a streamed section is complete, and (name, "section", response) for
+    whole sections: the summary, or every section in "combined" mode, which
+    isn't streamed.
+    """
+    if settings.LLM_GENERATION_MODE == "combined":
+        for name, response in generate_combined_sections(original_text).items():
+            yield name, "section", response
+        return
+
+    events = queue.Queue()
+
+    def _produce(name, prompt, response_model):
+        try:
+            if name == "summary":
+                response = generate_structured(name, prompt, original_text, response_model)
+                events.put((name, "section", response))
+                return
+            ordinal = 0
+            for key, item in stream_structured(name, prompt, original_text, response_model):
+                if key is not None:
+                    events.put((name, "point", (ordinal, item)))
+                    ordinal += 1
+            events.put((name, "end", ordinal))
+        except Exception as e:
+            events.put((name, "error", e))
+        finally:
+            events.put(None)
+
+    with ThreadPoolExecutor(max_workers=len(SECTIONS)) as executor:
+        for name, (prompt, response_model) in SECTIONS.items():
+            executor.submit(_produce, name, prompt, response_model)
+
+        remaining = len(SECTIONS)
+        while remaining:
+            event = events.get()
+            if event is None:
+                remaining -= 1
+            elif event[1] == "error":
+                raise event[2]
+            else:
+                yield event
 
 
 def translate_text_gemini(text, target_language):
@@ -203,7 +277,26 @@ def translate_text_gemini(text, target_language):
     # )
     # json_response = json_load(translated_text)
     # return TranslatedText(**json_response).translated_text
+    return translate_texts_gemini([text], target_language)[0]
+
+
+def translate_texts_gemini(texts, target_language):
+    """
+    Batched translate_text_gemini, translates all texts with as few requests as possible.
+
+    Texts already translated to target_language before (by any worker, in any
+    run) are served from the translation cache.
+    """
     # remove image tags from text because google translate doesn't support them
-    text = re.sub(r"<img[^>]*>", "", text)
-    translated_text = translate_text(text, target_language=target_language)
-    return translated_text
+    texts = [re.sub(r"<img[^>]*>", "", text) for text in texts]
+
+    cached = get_cached_translations(texts, target_language)
+    missing = [text for text in dict.fromkeys(texts) if text not in cached]
+    if missing:
+        translated = dict(
+            zip(missing, translate_many(missing, target_language=target_language))
+        )
+        cache_translations(translated, target_language)
+        cached.update(translated)
+
+    return [cached[text] for text in texts]
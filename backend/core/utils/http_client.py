@@ -1,7 +1,15 @@
+import asyncio
+import logging
+import os
+import threading
+import httpx
 import requests
+from django.conf import settings
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+logger = logging.getLogger(__name__)
+
 
 def get_retry_session(retries=3, backoff_factor=0.3, status_forcelist=(500, 502, 504)):
     """
@@ -30,3 +38,116 @@ def get_retry_session(retries=3, backoff_factor=0.3, status_forcelist=(500, 502,
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
+
+
+# --- Async fetch engine ---
+
+_local = threading.local()
+
+
+def get_event_loop():
+    """
+    Returns a long-lived event loop for the current thread.
+
+    Keeping the loop around (instead of asyncio.run per call) lets async clients
+    and their keep-alive connections be reused across calls. A new loop is made
+    after a fork so Celery prefork children never share one with the parent.
+    """
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed() or _local.pid != os.getpid():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+        _local.pid = os.getpid()
+        _local.async_client = None
+        _local.host_semaphores = {}
+    return loop
+
+
+def run_sync(coro):
+    """Runs a coroutine to completion on the current thread's event loop."""
+    return get_event_loop().run_until_complete(coro)
+
+
+def get_async_client():
+    """Returns the shared httpx.AsyncClient bound to the current thread's event loop."""
+    get_event_loop()
+    if _local.async_client is None:
+        _local.async_client = httpx.AsyncClient(
+            timeout=settings.HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=30,
+            ),
+        )
+    return _local.async_client
+
+
+def _get_host_semaphore(host):
+    semaphores = _local.host_semaphores
+    if host not in semaphores:
+        semaphores[host] = asyncio.Semaphore(settings.HTTP_PER_HOST_CONCURRENCY)
+    return semaphores[host]
+
+
+def _get_backoff_time(retry_number, backoff_factor):
+    """Same schedule as urllib3's Retry: no wait before the first retry, then exponential."""
+    if retry_number <= 1:
+        return 0
+    return backoff_factor * (2 ** (retry_number - 1))
+
+
+async def fetch(url, retries=3, backoff_factor=0.3, status_forcelist=(500, 502, 504)):
+    """
+    Fetches url with the shared async client, retrying connection errors and
+    status_forcelist responses like get_retry_session does.
+
+    Like `raise_on_status=False`, the last response is returned once status
+    retries are exhausted; transport errors are raised after the last retry.
+    """
+    client = get_async_client()
+    async with _get_host_semaphore(httpx.URL(url).host):
+        for retry_number in range(retries + 1):
+            if retry_number:
+                await asyncio.sleep(_get_backoff_time(retry_number, backoff_factor))
+            try:
+                response = await client.get(url)
+            except httpx.TransportError:
+                if retry_number == retries:
+                    raise
+                continue
+            if response.status_code not in status_forcelist or retry_number == retries:
+                return response
+
+
+async def _fetch_many(urls, **kwargs):
+    responses = await asyncio.gather(
+        *(fetch(url, **kwargs) for url in urls), return_exceptions=True
+    )
+
+    results = {}
+    for url, response in zip(urls, responses):
+        if isinstance(response, Exception):
+            logger.error(f"Failed to fetch {url}: {response}")
+            results[url] = None
+        elif response.is_error:
+            logger.error(f"Failed to fetch {url}: HTTP {response.status_code}")
+            results[url] = None
+        else:
+            results[url] = response.text
+    return results
+
+
+def fetch_many(urls, **kwargs):
+    """
+    Fetches all urls concurrently over a shared keep-alive connection pool,
+    at most HTTP_PER_HOST_CONCURRENCY requests in flight per host.
+
+    Returns a dict of url -> response text, or None for urls that failed.
+    Accepts the same retry arguments as fetch().
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    return run_sync(_fetch_many(urls, **kwargs))
@@ -57,3 +57,92 @@ def json_load(json_str: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Invalid JSON format in string: {json_str[:100]}...")
         _log_json_error(json_str)
         return None
+
+
+class JSONArrayItemParser:
+    """
+    Incremental parser for streamed JSON replies.
+
+    feed() takes the reply chunk by chunk and returns the objects of the
+    arrays named in array_keys (e.g. "summary_points") that were completed by
+    that chunk, as (array key, dict) pairs in reply order. Text around the
+    JSON (markdown fences, prose) is ignored.
+    """
+
+    def __init__(self, array_keys):
+        self.array_keys = set(array_keys)
+        self._text = ""
+        self.position = 0
+        self.stack = []
+        self.in_string = False
+        self.escape = False
+        self.string_start = None
+        self.last_string = None
+        self.pending_key = None
+        # (array key, stack depth inside the array) of the array being read
+        self.active_array = None
+        self.item_start = None
+
+    def feed(self, chunk: str):
+        self._text += chunk
+        text = self._text
+        items = []
+
+        for i in range(self.position, len(text)):
+            char = text[i]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                    self.last_string = text[self.string_start : i]
+                continue
+
+            if char == '"':
+                self.in_string = True
+                self.string_start = i + 1
+            elif char == ":":
+                self.pending_key = self.last_string
+            elif char in "{[":
+                self.stack.append(char)
+                depth = len(self.stack)
+                if (
+                    char == "["
+                    and self.active_array is None
+                    and self.pending_key in self.array_keys
+                ):
+                    self.active_array = (self.pending_key, depth)
+                elif (
+                    char == "{"
+                    and self.active_array is not None
+                    and depth == self.active_array[1] + 1
+                ):
+                    self.item_start = i
+                self.pending_key = None
+            elif char in "}]":
+                if self.stack:
+                    self.stack.pop()
+                if self.active_array is None:
+                    continue
+                key, array_depth = self.active_array
+                if char == "}" and self.item_start is not None and len(self.stack) == array_depth:
+                    item = text[self.item_start : i + 1]
+                    self.item_start = None
+                    try:
+                        items.append((key, json.loads(item)))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping unparsable streamed item: {item[:100]}...")
+                elif char == "]" and len(self.stack) < array_depth:
+                    self.active_array = None
+            elif char == ",":
+                self.pending_key = None
+
+        self.position = len(text)
+        return items
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return self._text
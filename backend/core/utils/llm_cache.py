@@ -0,0 +1,65 @@
+from typing import Dict, Optional, Type
+import hashlib
+import logging
+import redis
+from django.conf import settings
+from pydantic import BaseModel, ValidationError
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+LLM_KEY_PREFIX = "llm"
+LLM_STATS_KEY = "llm:stats"
+
+
+def prompt_version(prompt: str) -> str:
+    """Short hash of the prompt text, any prompt edit yields a new version."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+
+def llm_cache_key(prompt_id: str, prompt: str, model: str, text: str) -> str:
+    """Cache key for (prompt id/version, model, sha256(text))."""
+    text_digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{LLM_KEY_PREFIX}:{prompt_id}:{prompt_version(prompt)}:{model}:{text_digest}"
+
+
+def get_cached_llm_response(key: str, response_model: Type[BaseModel]) -> Optional[BaseModel]:
+    """Returns the cached parsed response for key, or None on a miss."""
+    try:
+        client = get_redis()
+        value = client.get(key)
+        client.hincrby(LLM_STATS_KEY, "hits" if value is not None else "misses", 1)
+    except redis.RedisError as e:
+        logger.warning(f"LLM cache unavailable: {e}")
+        return None
+
+    if value is None:
+        return None
+
+    try:
+        return response_model.model_validate_json(value)
+    except ValidationError:
+        # Stored by an older version of the response model, treat as a miss
+        logger.warning(f"Discarding stale LLM cache entry {key}")
+        return None
+
+
+def cache_llm_response(key: str, response: BaseModel) -> None:
+    """Stores a parsed response for LLM_CACHE_TTL seconds."""
+    try:
+        get_redis().set(key, response.model_dump_json(), ex=settings.LLM_CACHE_TTL)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to store LLM response in cache: {e}")
+
+
+def get_llm_cache_stats() -> Dict[str, float]:
+    """Returns the cache hit/miss counters and hit rate."""
+    stats = get_redis().hgetall(LLM_STATS_KEY)
+    hits = int(stats.get(b"hits", 0))
+    misses = int(stats.get(b"misses", 0))
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
@@ -0,0 +1,159 @@
+from contextlib import contextmanager
+import asyncio
+from typing import Dict
+import logging
+import os
+import threading
+import time
+import httpx
+import redis
+from django.conf import settings
+from google import genai
+from google.genai import types
+from groq import Groq, AsyncGroq, DefaultHttpxClient, DefaultAsyncHttpxClient
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+LLM_CLIENT_STATS_KEY = "llm:client_stats"
+
+_clients = {}
+_clients_pid = None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _make_gemini_client():
+    return genai.Client(
+        api_key=settings.GEMINI_API_KEY,
+        http_options=types.HttpOptions(
+            client_args={"limits": _get_limits()},
+        ),
+    )
+
+
+def _make_async_gemini_client():
+    # client.aio runs on its own httpx.AsyncClient, configured separately
+    return genai.Client(
+        api_key=settings.GEMINI_API_KEY,
+        http_options=types.HttpOptions(
+            async_client_args={"limits": _get_limits()},
+        ),
+    )
+
+
+def _make_groq_client():
+    return Groq(
+        api_key=settings.GROQ_API_KEY,
+        http_client=DefaultHttpxClient(limits=_get_limits()),
+    )
+
+
+def _make_async_groq_client():
+    return AsyncGroq(
+        api_key=settings.GROQ_API_KEY,
+        http_client=DefaultAsyncHttpxClient(limits=_get_limits()),
+    )
+
+
+def _get_limits():
+    return httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+    )
+
+
+_FACTORIES = {
+    "gemini": _make_gemini_client,
+    "groq": _make_groq_client,
+}
+
+# genai.Client serves async calls through client.aio, one per event loop is enough
+_ASYNC_FACTORIES = {
+    "gemini": _make_async_gemini_client,
+    "groq": _make_async_groq_client,
+}
+
+
+def get_llm_sdk_client(provider):
+    """
+    Returns this process's SDK client for provider, creating it on first use.
+
+    Clients (and their keep-alive connection pools) are shared by every thread
+    of the process. They are created lazily and dropped after a fork, so Celery
+    prefork children each open their own connections.
+    """
+    global _clients_pid
+    with _lock:
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+        client = _clients.get(provider)
+        if client is None:
+            start = time.perf_counter()
+            client = _FACTORIES[provider]()
+            init_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"Created {provider} client in {init_ms:.1f} ms (pid {os.getpid()})")
+            _record_stats(provider, clients_created=1, init_ms=init_ms)
+            _clients[provider] = client
+    return client
+
+
+def get_async_llm_sdk_client(provider):
+    """
+    Returns the async SDK client for provider bound to the running event loop.
+
+    Async connection pools can't move between event loops, so clients are kept
+    per thread and rebuilt whenever the thread's loop changes (see
+    http_client.get_event_loop, which keeps one loop per thread).
+    """
+    loop = asyncio.get_running_loop()
+    if getattr(_local, "loop", None) is not loop:
+        _local.loop = loop
+        _local.clients = {}
+    client = _local.clients.get(provider)
+    if client is None:
+        start = time.perf_counter()
+        client = _ASYNC_FACTORIES[provider]()
+        init_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Created async {provider} client in {init_ms:.1f} ms (pid {os.getpid()})")
+        _record_stats(provider, clients_created=1, init_ms=init_ms)
+        _local.clients[provider] = client
+    return client
+
+
+@contextmanager
+def track_llm_call(provider):
+    """Records the wall time of one LLM API call."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        call_ms = (time.perf_counter() - start) * 1000
+        _record_stats(provider, calls=1, call_ms=call_ms)
+
+
+def _record_stats(provider, **values):
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for field, value in values.items():
+            pipe.hincrbyfloat(LLM_CLIENT_STATS_KEY, f"{provider}:{field}", value)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.debug(f"Could not record LLM client stats: {e}")
+
+
+def get_llm_client_stats() -> Dict[str, Dict[str, float]]:
+    """Returns client creation and call latency totals/averages per provider."""
+    raw = get_redis().hgetall(LLM_CLIENT_STATS_KEY)
+    stats = {}
+    for field, value in raw.items():
+        provider, name = field.decode().split(":", 1)
+        stats.setdefault(provider, {})[name] = float(value)
+
+    for values in stats.values():
+        clients_created = values.get("clients_created", 0)
+        calls = values.get("calls", 0)
+        values["avg_init_ms"] = values.get("init_ms", 0) / clients_created if clients_created else 0.0
+        values["avg_call_ms"] = values.get("call_ms", 0) / calls if calls else 0.0
+    return stats
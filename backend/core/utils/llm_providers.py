@@ -0,0 +1,468 @@
+import asyncio
+import contextvars
+import json
+import logging
+import threading
+import time
+import weakref
+from itertools import chain
+from typing import List, Optional, Type, get_args, get_origin
+from django.conf import settings
+from google.genai import types
+from pydantic import BaseModel
+from .json_parser import json_load
+from .llm_clients import get_llm_sdk_client, get_async_llm_sdk_client, track_llm_call
+from .rate_limiter import get_rate_limiter, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+GEMINI_MODEL = "gemini-2.5-flash-preview-05-20"
+GROQ_MODEL = "llama-3.1-8b-instant"
+
+RATE_LIMIT_KEYWORDS = ["rate limit", "quota", "too many requests", "429"]
+
+# Model of the provider that produced the last reply in this thread/task,
+# which differs from FailoverProvider.model when a fallback answered
+_answering_model = contextvars.ContextVar("llm_answering_model", default=None)
+
+
+def get_answering_model():
+    """Model that answered the last LLM request made from this thread/task."""
+    return _answering_model.get()
+
+
+def is_rate_limit_error(error):
+    error_message = str(error).lower()
+    return any(keyword in error_message for keyword in RATE_LIMIT_KEYWORDS)
+
+
+class LLMProvider:
+    """
+    A chat model that answers a system prompt + user prompt with JSON.
+
+    Subclasses implement _complete/_acomplete returning the raw reply text.
+    generate()/agenerate() add the concurrency limit (LLM_MAX_CONCURRENCY
+    in flight per provider and process) and parse the reply into a schema.
+    """
+
+    name = None
+    model = None
+
+    def __init__(self):
+        self._semaphore = threading.BoundedSemaphore(settings.LLM_MAX_CONCURRENCY)
+        self._async_semaphores = weakref.WeakKeyDictionary()
+
+    def _complete(self, system_prompt, user_prompt, schema=None):
+        raise NotImplementedError
+
+    async def _acomplete(self, system_prompt, user_prompt, schema=None):
+        raise NotImplementedError
+
+    def _stream(self, system_prompt, user_prompt, schema=None):
+        # Providers without streaming deliver the reply as a single chunk
+        yield self._complete(system_prompt, user_prompt, schema)
+
+    def _get_async_semaphore(self):
+        # asyncio primitives belong to one loop, keep a semaphore per loop
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+            self._async_semaphores[loop] = semaphore
+        return semaphore
+
+    def generate_text(self, system_prompt, user_prompt, schema=None):
+        """Returns the raw reply text."""
+        with self._semaphore:
+            output = self._complete(system_prompt, user_prompt, schema)
+        _answering_model.set(self.model)
+        return output
+
+    def stream_text(self, system_prompt, user_prompt, schema=None):
+        """Yields the reply text in chunks as the model produces it."""
+        with self._semaphore:
+            yield from self._stream(system_prompt, user_prompt, schema)
+        _answering_model.set(self.model)
+
+    async def agenerate_text(self, system_prompt, user_prompt, schema=None):
+        async with self._get_async_semaphore():
+            output = await self._acomplete(system_prompt, user_prompt, schema)
+        _answering_model.set(self.model)
+        return output
+
+    def generate(self, system_prompt, user_prompt, schema: Type[BaseModel]):
+        """Returns the reply parsed into schema, raises ValueError on non-JSON replies."""
+        return parse_response(self.generate_text(system_prompt, user_prompt, schema), schema)
+
+    async def agenerate(self, system_prompt, user_prompt, schema: Type[BaseModel]):
+        output = await self.agenerate_text(system_prompt, user_prompt, schema)
+        return parse_response(output, schema)
+
+
+def parse_response(output, schema):
+    json_response = json_load(output)
+    if json_response is None:
+        raise ValueError("LLM reply contains no JSON")
+    return schema(**json_response)
+
+
+class GeminiProvider(LLMProvider):
+    name = "gemini"
+    model = GEMINI_MODEL
+
+    def _get_request(self, system_prompt, user_prompt):
+        contents = [
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_text(text=user_prompt),
+                ],
+            ),
+        ]
+        generate_content_config = types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            thinking_config=types.ThinkingConfig(
+                thinking_budget=0,
+            ),
+            response_mime_type="application/json",
+        )
+        return {"model": self.model, "contents": contents, "config": generate_content_config}
+
+    def _on_error(self, rate_limiter, e):
+        """Returns True when the call should be retried."""
+        logger.error(f"Gemini API error: {e}")
+        if is_rate_limit_error(e):
+            # Pause every worker, not just this one, then try again indefinitely
+            wait_time = 60  # Wait 1 minute before trying again
+            logger.warning(
+                f"Rate limit error encountered, pausing Gemini calls for {wait_time} seconds..."
+            )
+            rate_limiter.pause(wait_time)
+            return True
+        return False
+
+    def _complete(self, system_prompt, user_prompt, schema=None):
+        """Generate content with Gemini API with rate limiting - waits indefinitely until successful"""
+        rate_limiter = get_rate_limiter(self.name, self.model)
+        estimated_tokens = estimate_tokens(system_prompt, user_prompt)
+
+        while True:
+            try:
+                # Rate limiting - wait until the cluster-wide budget allows this call
+                rate_limiter.wait(estimated_tokens)
+                client = get_llm_sdk_client(self.name)
+                with track_llm_call(self.name):
+                    response = client.models.generate_content(
+                        **self._get_request(system_prompt, user_prompt)
+                    )
+            except Exception as e:
+                if self._on_error(rate_limiter, e):
+                    continue  # Keep trying indefinitely
+                raise
+
+            if response.usage_metadata is not None:
+                rate_limiter.reconcile(
+                    estimated_tokens, response.usage_metadata.total_token_count
+                )
+            return response.text
+
+    def _stream(self, system_prompt, user_prompt, schema=None):
+        rate_limiter = get_rate_limiter(self.name, self.model)
+        estimated_tokens = estimate_tokens(system_prompt, user_prompt)
+
+        while True:
+            try:
+                rate_limiter.wait(estimated_tokens)
+                client = get_llm_sdk_client(self.name)
+                stream = client.models.generate_content_stream(
+                    **self._get_request(system_prompt, user_prompt)
+                )
+                # The first chunk raises rate limit errors, retry until it
+                # arrives (call time is the time to first chunk when streaming)
+                with track_llm_call(self.name):
+                    first_chunk = next(stream, None)
+            except Exception as e:
+                if self._on_error(rate_limiter, e):
+                    continue
+                raise
+            break
+
+        usage = None
+        for chunk in chain([first_chunk] if first_chunk else [], stream):
+            usage = chunk.usage_metadata or usage
+            if chunk.text:
+                yield chunk.text
+
+        if usage is not None:
+            rate_limiter.reconcile(estimated_tokens, usage.total_token_count)
+
+    async def _acomplete(self, system_prompt, user_prompt, schema=None):
+        rate_limiter = get_rate_limiter(self.name, self.model)
+        estimated_tokens = estimate_tokens(system_prompt, user_prompt)
+
+        while True:
+            try:
+                await rate_limiter.async_wait(estimated_tokens)
+                client = get_async_llm_sdk_client(self.name)
+                with track_llm_call(self.name):
+                    response = await client.aio.models.generate_content(
+                        **self._get_request(system_prompt, user_prompt)
+                    )
+            except Exception as e:
+                if self._on_error(rate_limiter, e):
+                    continue
+                raise
+
+            if response.usage_metadata is not None:
+                rate_limiter.reconcile(
+                    estimated_tokens, response.usage_metadata.total_token_count
+                )
+            return response.text
+
+
+class GroqProvider(LLMProvider):
+    name = "groq"
+    model = GROQ_MODEL
+
+    def _get_request(self, system_prompt, user_prompt, stream=False):
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 0.1,  # Lower temperature for more consistent JSON output
+            "max_completion_tokens": 8000,
+            "top_p": 1,
+            "stream": stream,
+            "stop": None,
+        }
+
+    def _on_error(self, rate_limiter, e):
+        logger.error(f"Groq API error: {e}")
+        if is_rate_limit_error(e):
+            rate_limiter.pause(60)
+
+    def _complete(self, system_prompt, user_prompt, schema=None):
+        """Generate content with Groq API"""
+        rate_limiter = get_rate_limiter(self.name, self.model)
+        estimated_tokens = estimate_tokens(system_prompt, user_prompt)
+        rate_limiter.wait(estimated_tokens)
+
+        try:
+            client = get_llm_sdk_client(self.name)
+            with track_llm_call(self.name):
+                completion = client.chat.completions.create(
+                    **self._get_request(system_prompt, user_prompt)
+                )
+        except Exception as e:
+            self._on_error(rate_limiter, e)
+            raise
+
+        if completion.usage is not None:
+            rate_limiter.reconcile(estimated_tokens, completion.usage.total_tokens)
+        return completion.choices[0].message.content
+
+    def _stream(self, system_prompt, user_prompt, schema=None):
+        rate_limiter = get_rate_limiter(self.name, self.model)
+        estimated_tokens = estimate_tokens(system_prompt, user_prompt)
+        rate_limiter.wait(estimated_tokens)
+
+        try:
+            client = get_llm_sdk_client(self.name)
+            with track_llm_call(self.name):
+                stream = client.chat.completions.create(
+                    **self._get_request(system_prompt, user_prompt, stream=True)
+                )
+        except Exception as e:
+            self._on_error(rate_limiter, e)
+            raise
+
+        usage = None
+        for chunk in stream:
+            # Token usage comes with the last chunk
+            if chunk.x_groq is not None and chunk.x_groq.usage is not None:
+                usage = chunk.x_groq.usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+        if usage is not None:
+            rate_limiter.reconcile(estimated_tokens, usage.total_tokens)
+
+    async def _acomplete(self, system_prompt, user_prompt, schema=None):
+        rate_limiter = get_rate_limiter(self.name, self.model)
+        estimated_tokens = estimate_tokens(system_prompt, user_prompt)
+        await rate_limiter.async_wait(estimated_tokens)
+
+        try:
+            client = get_async_llm_sdk_client(self.name)
+            with track_llm_call(self.name):
+                completion = await client.chat.completions.create(
+                    **self._get_request(system_prompt, user_prompt)
+                )
+        except Exception as e:
+            self._on_error(rate_limiter, e)
+            raise
+
+        if completion.usage is not None:
+            rate_limiter.reconcile(estimated_tokens, completion.usage.total_tokens)
+        return completion.choices[0].message.content
+
+
+class StubProvider(LLMProvider):
+    """
+    Offline provider for tests and benchmarks.
+
+    Replies with placeholder JSON shaped like the requested schema after
+    LLM_STUB_LATENCY seconds, without any network or rate limiting.
+    """
+
+    name = "stub"
+    model = "stub"
+
+    def _reply(self, schema):
+        return json.dumps(stub_payload(schema) if schema is not None else {})
+
+    def _complete(self, system_prompt, user_prompt, schema=None):
+        time.sleep(settings.LLM_STUB_LATENCY)
+        return self._reply(schema)
+
+    async def _acomplete(self, system_prompt, user_prompt, schema=None):
+        await asyncio.sleep(settings.LLM_STUB_LATENCY)
+        return self._reply(schema)
+
+    def _stream(self, system_prompt, user_prompt, schema=None, chunks=10):
+        reply = self._reply(schema)
+        chunk_size = len(reply) // chunks + 1
+        for start in range(0, len(reply), chunk_size):
+            time.sleep(settings.LLM_STUB_LATENCY / chunks)
+            yield reply[start : start + chunk_size]
+
+
+def stub_payload(schema: Type[BaseModel]):
+    """Placeholder values for every field of schema (nested models and lists included)."""
+    return {
+        name: _stub_value(field.annotation, name)
+        for name, field in schema.model_fields.items()
+    }
+
+
+def _stub_value(annotation, name):
+    if get_origin(annotation) in (list, List):
+        return [_stub_value(get_args(annotation)[0], name)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return stub_payload(annotation)
+    return f"Stub {name}"
+
+
+class FailoverProvider(LLMProvider):
+    """
+    Tries each provider in order for every request, so one provider failing
+    (errors, rate limits, unparsable replies) only costs a retry of that
+    request on the next provider.
+
+    The model name is the primary provider's, the one cache lookups go to.
+    Replies from a fallback are reported by get_answering_model() so they're
+    cached under the fallback's model instead.
+    """
+
+    name = "failover"
+
+    def __init__(self, providers: List[LLMProvider]):
+        super().__init__()
+        self.providers = providers
+        self.model = providers[0].model
+
+    def _log_failover(self, provider, e):
+        logger.warning(f"LLM provider {provider.name} failed ({e}), trying the next one")
+
+    def generate_text(self, system_prompt, user_prompt, schema=None):
+        for provider in self.providers[:-1]:
+            try:
+                return provider.generate_text(system_prompt, user_prompt, schema)
+            except Exception as e:
+                self._log_failover(provider, e)
+        return self.providers[-1].generate_text(system_prompt, user_prompt, schema)
+
+    def stream_text(self, system_prompt, user_prompt, schema=None):
+        # Once chunks went out the reply can't be swapped for another provider's,
+        # so only failures before the first chunk fail over
+        for provider in self.providers[:-1]:
+            stream = provider.stream_text(system_prompt, user_prompt, schema)
+            try:
+                first_chunk = next(stream, "")
+            except Exception as e:
+                self._log_failover(provider, e)
+                continue
+            yield first_chunk
+            yield from stream
+            return
+        yield from self.providers[-1].stream_text(system_prompt, user_prompt, schema)
+
+    async def agenerate_text(self, system_prompt, user_prompt, schema=None):
+        for provider in self.providers[:-1]:
+            try:
+                return await provider.agenerate_text(system_prompt, user_prompt, schema)
+            except Exception as e:
+                self._log_failover(provider, e)
+        return await self.providers[-1].agenerate_text(system_prompt, user_prompt, schema)
+
+    def generate(self, system_prompt, user_prompt, schema):
+        for provider in self.providers[:-1]:
+            try:
+                return provider.generate(system_prompt, user_prompt, schema)
+            except Exception as e:
+                self._log_failover(provider, e)
+        return self.providers[-1].generate(system_prompt, user_prompt, schema)
+
+    async def agenerate(self, system_prompt, user_prompt, schema):
+        for provider in self.providers[:-1]:
+            try:
+                return await provider.agenerate(system_prompt, user_prompt, schema)
+            except Exception as e:
+                self._log_failover(provider, e)
+        return await self.providers[-1].agenerate(system_prompt, user_prompt, schema)
+
+
+PROVIDERS = {
+    "gemini": GeminiProvider,
+    "groq": GroqProvider,
+    "stub": StubProvider,
+}
+
+_providers = {}
+
+
+def get_provider(name) -> LLMProvider:
+    """Returns the shared instance of the named provider."""
+    if name not in _providers:
+        _providers[name] = PROVIDERS[name]()
+    return _providers[name]
+
+
+def get_llm_provider() -> Optional[LLMProvider]:
+    """
+    Returns the provider (chain) configured by LLM_PROVIDERS.
+
+    Without LLM_PROVIDERS, every provider that has an API key is used,
+    Groq first with Gemini as its fallback.
+    """
+    names = settings.LLM_PROVIDERS
+    if not names:
+        names = [
+            name
+            for name, api_key in (
+                ("groq", settings.GROQ_API_KEY),
+                ("gemini", settings.GEMINI_API_KEY),
+            )
+            if api_key
+        ]
+    if not names:
+        return None
+    if len(names) == 1:
+        return get_provider(names[0])
+
+    chain_name = ">".join(names)
+    if chain_name not in _providers:
+        _providers[chain_name] = FailoverProvider([get_provider(name) for name in names])
+    return _providers[chain_name]
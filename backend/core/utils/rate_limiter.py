@@ -0,0 +1,201 @@
+import asyncio
+import time
+import threading
+import logging
+import redis
+from django.conf import settings
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Rate limiter using token bucket algorithm for Gemini API (1000 requests/minute)"""
+
+    def __init__(self, max_requests=1000, time_window=60):
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.tokens = max_requests
+        self.last_refill = time.time()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Acquire a token, blocking if necessary"""
+        with self.lock:
+            now = time.time()
+            # Refill tokens based on elapsed time
+            elapsed = now - self.last_refill
+            tokens_to_add = elapsed * (self.max_requests / self.time_window)
+            self.tokens = min(self.max_requests, self.tokens + tokens_to_add)
+            self.last_refill = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            else:
+                # Calculate wait time for next token
+                wait_time = (1 - self.tokens) * (self.time_window / self.max_requests)
+                return wait_time
+
+
+# Atomically refills and charges a request bucket and a token bucket.
+# Returns "0" when both had room (and were charged), otherwise the seconds
+# to wait before trying again. A limit of 0 disables that bucket.
+# Time comes from the Redis server, so workers with skewed clocks never
+# refill the same interval twice.
+#   KEYS: requests bucket, tokens bucket, pause key
+#   ARGV: window, max requests, max tokens, token cost
+ACQUIRE_SCRIPT = """
+-- TIME is non-deterministic, replicate the writes instead of the script (Redis < 5)
+redis.replicate_commands()
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local window = tonumber(ARGV[1])
+local max_requests = tonumber(ARGV[2])
+local max_tokens = tonumber(ARGV[3])
+local cost = math.min(tonumber(ARGV[4]), max_tokens)
+
+local paused_ms = redis.call('PTTL', KEYS[3])
+if paused_ms > 0 then
+    return tostring(paused_ms / 1000)
+end
+
+local function refill(key, capacity)
+    if capacity <= 0 then
+        return nil
+    end
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    return math.min(capacity, tokens + math.max(0, now - ts) * capacity / window)
+end
+
+local requests = refill(KEYS[1], max_requests)
+local tokens = refill(KEYS[2], max_tokens)
+
+local wait = 0
+if requests and requests < 1 then
+    wait = math.max(wait, (1 - requests) * window / max_requests)
+end
+if tokens and tokens < cost then
+    wait = math.max(wait, (cost - tokens) * window / max_tokens)
+end
+if wait > 0 then
+    return tostring(wait)
+end
+
+if requests then
+    redis.call('HSET', KEYS[1], 'tokens', requests - 1, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(window * 2))
+end
+if tokens then
+    redis.call('HSET', KEYS[2], 'tokens', tokens - cost, 'ts', now)
+    redis.call('EXPIRE', KEYS[2], math.ceil(window * 2))
+end
+return '0'
+"""
+
+
+class DistributedRateLimiter:
+    """
+    Token bucket shared by every worker through Redis, limiting both
+    requests and LLM tokens per time window for one provider/model.
+
+    Same acquire() contract as RateLimiter (True, or seconds to wait). Falls
+    back to a per-process RateLimiter when Redis is unreachable.
+    """
+
+    def __init__(self, name, max_requests, max_tokens=0, time_window=60):
+        self.name = name
+        self.max_requests = max_requests
+        self.max_tokens = max_tokens
+        self.time_window = time_window
+        self.requests_key = f"ratelimit:{name}:requests"
+        self.tokens_key = f"ratelimit:{name}:tokens"
+        self.pause_key = f"ratelimit:{name}:paused_until"
+        self.fallback = RateLimiter(max_requests, time_window) if max_requests else None
+        self._script = None
+
+    def acquire(self, tokens=0):
+        """Charge one request and `tokens` LLM tokens, returns True or the seconds to wait."""
+        try:
+            if self._script is None:
+                self._script = get_redis().register_script(ACQUIRE_SCRIPT)
+            wait_time = float(
+                self._script(
+                    keys=[self.requests_key, self.tokens_key, self.pause_key],
+                    args=[
+                        self.time_window,
+                        self.max_requests,
+                        self.max_tokens,
+                        tokens,
+                    ],
+                )
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Distributed rate limiter unavailable, using local limiter: {e}")
+            return self.fallback.acquire() if self.fallback else True
+        return True if wait_time <= 0 else wait_time
+
+    def wait(self, tokens=0):
+        """Block until a request costing `tokens` LLM tokens may be sent."""
+        while True:
+            result = self.acquire(tokens)
+            if result is True:
+                return
+            logger.info(f"Rate limit reached for {self.name}, waiting {result:.2f} seconds...")
+            time.sleep(result)
+
+    async def async_wait(self, tokens=0):
+        """wait() for coroutines, sleeps without blocking the event loop."""
+        while True:
+            result = self.acquire(tokens)
+            if result is True:
+                return
+            logger.info(f"Rate limit reached for {self.name}, waiting {result:.2f} seconds...")
+            await asyncio.sleep(result)
+
+    def reconcile(self, estimated_tokens, actual_tokens):
+        """Give back (or charge) the difference between the estimated and actual token usage."""
+        if not self.max_tokens or not actual_tokens:
+            return
+        try:
+            client = get_redis()
+            if client.exists(self.tokens_key):
+                client.hincrbyfloat(self.tokens_key, "tokens", estimated_tokens - actual_tokens)
+        except redis.RedisError as e:
+            logger.warning(f"Could not reconcile token usage for {self.name}: {e}")
+
+    def pause(self, seconds):
+        """Stop every worker from sending requests for `seconds`, e.g. after a 429."""
+        try:
+            # acquire reads the key's TTL, so the pause is timed by Redis too
+            get_redis().set(self.pause_key, seconds, px=int(seconds * 1000))
+        except redis.RedisError as e:
+            logger.warning(f"Could not pause rate limiter {self.name}: {e}")
+
+
+_limiters = {}
+
+
+def get_rate_limiter(provider, model):
+    """
+    Returns the shared limiter for a provider/model.
+
+    Limits come from LLM_RATE_LIMITS, a "provider:model" entry takes
+    precedence over the "provider" entry.
+    """
+    name = f"{provider}:{model}"
+    if name not in _limiters:
+        limits = settings.LLM_RATE_LIMITS.get(name) or settings.LLM_RATE_LIMITS.get(provider, {})
+        _limiters[name] = DistributedRateLimiter(
+            name,
+            max_requests=limits.get("rpm", 0),
+            max_tokens=limits.get("tpm", 0),
+        )
+    return _limiters[name]
+
+
+def estimate_tokens(*texts):
+    """Rough token count of the prompt plus the expected completion size."""
+    return sum(len(text) for text in texts) // 4 + settings.LLM_COMPLETION_TOKENS_ESTIMATE
@@ -0,0 +1,25 @@
+from typing import Optional
+import logging
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """
+    Returns a lazily created, process-wide Redis client for REDIS_URL.
+
+    The underlying connection pool resets itself after a fork, so the client
+    is safe to share across Celery prefork workers.
+    """
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
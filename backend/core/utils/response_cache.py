@@ -0,0 +1,158 @@
+from functools import wraps
+from typing import Iterable, List, Mapping, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+RESPONSE_KEY_PREFIX = "response"
+# Pagination links of list payloads, see strip_links
+LINK_FIELDS = ("next", "previous")
+TAG_KEY_PREFIX = "response:tag"
+
+# Invalidation tags, bumped by core.signals when the underlying rows change
+PRESS_RELEASES = "press_releases"
+MINISTRIES = "ministries"
+CATEGORIES = "categories"
+AUDIENCE_TYPES = "audience_types"
+
+
+def canonical_query_params(
+    query_params,
+    allowed: Optional[Iterable[str]] = None,
+    defaults: Optional[Mapping[str, str]] = None,
+) -> str:
+    """
+    Normalizes a QueryDict so equivalent requests share a cache entry.
+
+    Parameters not in allowed (cache busters, tracking params) and blank
+    values are dropped, missing parameters take their default, and keys and
+    repeated values are sorted. allowed=None keeps every parameter.
+    """
+    params = {}
+    for name in query_params.keys() if allowed is None else allowed:
+        values = sorted(v.strip() for v in query_params.getlist(name) if v.strip())
+        if not values and defaults and name in defaults:
+            values = [str(defaults[name])]
+        if values:
+            params[name] = values
+    return urlencode(sorted(params.items()), doseq=True)
+
+
+def _tag_key(tag: str) -> str:
+    return f"{TAG_KEY_PREFIX}:{tag}"
+
+
+def get_tag_versions(tags: Iterable[str]) -> List[int]:
+    """Current version of each tag, read with a single get_many."""
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seeded from the clock so a lost counter never reuses an old version
+            cache.add(key, time.time_ns() // 1000, timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate_tags(*tags: str) -> None:
+    """Makes every cached response depending on the tags unreachable, they expire on their own."""
+    for tag in tags:
+        try:
+            cache.incr(_tag_key(tag))
+        except ValueError:
+            get_tag_versions([tag])
+
+
+def response_cache_key(namespace: str, canonical_params: str, tags: Iterable[str]) -> str:
+    versions = ".".join(str(v) for v in get_tag_versions(tags))
+    digest = hashlib.sha1(canonical_params.encode("utf-8")).hexdigest()
+    return f"{RESPONSE_KEY_PREFIX}:{namespace}:{versions}:{digest}"
+
+
+def get_or_set_response(cache_key: str, build, timeout: Optional[int] = None) -> Response:
+    """Returns the cached response data for cache_key, or builds and caches a 200 response."""
+    data = cache.get(cache_key)
+    if data is not None:
+        return Response(data)
+
+    response = build()
+    if response.status_code == status.HTTP_200_OK:
+        cache.set(
+            cache_key,
+            response.data,
+            settings.RESPONSE_CACHE_TIMEOUT if timeout is None else timeout,
+        )
+    return response
+
+
+def strip_links(data, request):
+    """
+    Replaces the pagination links of a list payload by what they change in
+    request's query string, so a cached payload carries no host or query
+    parameters of the request that filled the cache. See restore_links.
+    """
+    if not isinstance(data, dict):
+        return data
+    data = dict(data)
+    current = {name: query_values for name, query_values in request.query_params.lists()}
+    for field in LINK_FIELDS:
+        link = data.get(field)
+        if link is None:
+            continue
+        params = parse_qs(urlsplit(link).query, keep_blank_values=True)
+        data[field] = {
+            "set": {
+                name: values[-1]
+                for name, values in params.items()
+                if current.get(name) != values
+            },
+            "remove": [name for name in current if name not in params],
+        }
+    return data
+
+
+def restore_links(data, request):
+    """Rebuilds the links stripped by strip_links on request's own URL."""
+    if not isinstance(data, dict):
+        return data
+    data = dict(data)
+    for field in LINK_FIELDS:
+        changes = data.get(field)
+        if changes is None:
+            continue
+        url = request.build_absolute_uri()
+        for name in changes["remove"]:
+            url = remove_query_param(url, name)
+        for name, value in changes["set"].items():
+            url = replace_query_param(url, name, value)
+        data[field] = url
+    return data
+
+
+def cache_response(tags: Iterable[str], timeout: Optional[int] = None):
+    """
+    Caches a DRF function view until one of its tags is invalidated. Goes
+    below @api_view, the view must return a Response.
+    """
+    tags = tuple(tags)
+
+    def decorator(view):
+        namespace = f"{view.__module__}.{view.__name__}"
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            canonical = canonical_query_params(request.query_params)
+            return get_or_set_response(
+                response_cache_key(namespace, canonical, tags),
+                lambda: view(request, *args, **kwargs),
+                timeout,
+            )
+
+        return wrapper
+
+    return decorator
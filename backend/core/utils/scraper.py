@@ -1,7 +1,11 @@
 import re
+import hashlib
+import redis
 import requests
-from bs4 import BeautifulSoup
-from .http_client import get_retry_session
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from django.conf import settings
+from .http_client import get_retry_session, fetch_many
+from .redis_client import get_redis
 from .secrets import get_pib_secrets, get_payload
 from ..constants.response_models import (
     PressReleaseMetadata,
@@ -17,8 +21,118 @@ logger = logging.getLogger(__name__)
 
 session = get_retry_session()
 
+# Redis hashes holding the previous Allrel.aspx poll validators and poll counters
+LISTING_STATE_KEY = "pib:listing:state"
+LISTING_STATS_KEY = "pib:listing:stats"
 
-def get_press_release_metadata():
+
+def _get_listing_state():
+    """Returns the validators (etag, last_modified, body_hash) saved by the previous poll."""
+    try:
+        state = get_redis().hgetall(LISTING_STATE_KEY)
+    except redis.RedisError as e:
+        logger.warning(f"Could not load listing state: {e}")
+        return {}
+    return {k.decode(): v.decode() for k, v in state.items()}
+
+
+def _listing_state(response, body_hash):
+    state = {"body_hash": body_hash}
+    if response.headers.get("ETag"):
+        state["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        state["last_modified"] = response.headers["Last-Modified"]
+    return state
+
+
+def save_listing_state(state):
+    """
+    Remembers the validators of a processed listing, the next poll skips it
+    if it is unchanged. Only call it once every listed release is stored, a
+    release that failed would otherwise not be retried until the listing changes.
+    """
+    if not state:
+        return
+    try:
+        pipe = get_redis().pipeline()
+        pipe.delete(LISTING_STATE_KEY)
+        pipe.hset(LISTING_STATE_KEY, mapping=state)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Could not save listing state: {e}")
+
+
+def _record_listing_poll(skip_reason=None):
+    """Count polls, and polls skipped because the listing was unchanged."""
+    try:
+        pipe = get_redis().pipeline()
+        pipe.hincrby(LISTING_STATS_KEY, "polls", 1)
+        if skip_reason:
+            pipe.hincrby(LISTING_STATS_KEY, "skipped", 1)
+            pipe.hincrby(LISTING_STATS_KEY, f"skipped_{skip_reason}", 1)
+            pipe.hset(LISTING_STATS_KEY, "last_skipped_at", timezone.now().isoformat())
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Could not record listing poll: {e}")
+
+
+class _AnyOfStrainer(SoupStrainer):
+    """SoupStrainer that keeps a top-level tag if any of the given strainers allows it."""
+
+    def __init__(self, *strainers):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+    def allow_string_creation(self, string):
+        return False
+
+
+# Only the subtrees we actually read are built when SCRAPER_PARSE_ONLY is on
+LISTING_STRAINER = SoupStrainer("div", class_="content-area")
+CONTENT_STRAINER = _AnyOfStrainer(
+    SoupStrainer("div", class_="innner-page-main-about-us-content-right-part"),
+    SoupStrainer("div", id="PrDateTime"),
+)
+
+
+def make_soup(markup, strainer=None, parser=None, strained=None):
+    """
+    Parses markup with the configured backend (SCRAPER_HTML_PARSER), building
+    only the subtrees matched by strainer when strained (SCRAPER_PARSE_ONLY).
+
+    Falls back to the stdlib "html.parser" if the configured parser isn't installed.
+    """
+    parser = parser or settings.SCRAPER_HTML_PARSER
+    if strained is None:
+        strained = settings.SCRAPER_PARSE_ONLY
+    parse_only = strainer if strained else None
+
+    try:
+        return BeautifulSoup(markup, parser, parse_only=parse_only)
+    except FeatureNotFound:
+        logger.warning(f"HTML parser '{parser}' not available, using html.parser")
+        return BeautifulSoup(markup, "html.parser", parse_only=parse_only)
+
+
+def get_listing_poll_stats():
+    """Returns the poll/skip counters recorded by get_press_release_metadata."""
+    stats = get_redis().hgetall(LISTING_STATS_KEY)
+    return {k.decode(): v.decode() for k, v in stats.items()}
+
+
+def get_press_release_metadata(force=False):
+    """
+    Scrapes the Allrel.aspx listing.
+
+    The ETag, Last-Modified and body hash of the previous processed poll are
+    remembered, when the listing is unchanged the page is not parsed and an
+    empty list with `unchanged=True` is returned. Pass force=True to always
+    parse. The validators of this poll are returned in `listing_state`, the
+    caller saves them with save_listing_state once the releases are processed.
+    """
     day, month, year = get_today_date()
     try:
         cookies, headers, payload = get_pib_secrets()
@@ -26,6 +140,13 @@ def get_press_release_metadata():
         logger.error(f"Error getting PIB secrets: {e}")
         return PressReleaseMetadataList()
 
+    previous_state = {} if force else _get_listing_state()
+    request_headers = dict(headers)
+    if previous_state.get("etag"):
+        request_headers["If-None-Match"] = previous_state["etag"]
+    if previous_state.get("last_modified"):
+        request_headers["If-Modified-Since"] = previous_state["last_modified"]
+
     # response = session.post(
     #     "https://www.pib.gov.in/Allrel.aspx",
     #     data=get_payload(day, month, year),
@@ -34,13 +155,36 @@ def get_press_release_metadata():
     # )
     response = session.get(
         "https://www.pib.gov.in/Allrel.aspx",
-        headers=headers,
+        headers=request_headers,
         cookies=cookies,
     )
 
+    if response.status_code == 304:
+        logger.info("Allrel.aspx not modified since last poll, skipping")
+        _record_listing_poll("not_modified")
+        return PressReleaseMetadataList(unchanged=True)
+
+    body_hash = hashlib.sha256(response.content).hexdigest()
+    if previous_state.get("body_hash") == body_hash:
+        logger.info("Allrel.aspx content unchanged since last poll, skipping")
+        _record_listing_poll("same_hash")
+        return PressReleaseMetadataList(unchanged=True)
+
+    press_releases_metadata = parse_press_release_listing(response.text)
+    # return only 1 press release metadata
+    # press_releases_metadata = press_releases_metadata[:1]
+    _record_listing_poll()
+    return PressReleaseMetadataList(
+        press_releases=press_releases_metadata,
+        listing_state=_listing_state(response, body_hash),
+    )
+
+
+def parse_press_release_listing(html, parser=None, strained=None):
+    """Extracts the press release metadata entries from an Allrel.aspx page."""
+    soup = make_soup(html, LISTING_STRAINER, parser=parser, strained=strained)
     press_releases_metadata = []
 
-    soup = BeautifulSoup(response.text, "html.parser")
     content_area = soup.find("div", {"class": "content-area"})
     all_uls = content_area.find_all("ul", recursive=False)
 
@@ -63,9 +207,7 @@ def get_press_release_metadata():
             press_releases_metadata.append(
                 PressReleaseMetadata(ministry=ministry, title=title, url=full_url)
             )
-    # return only 1 press release metadata
-    # press_releases_metadata = press_releases_metadata[:1]
-    return PressReleaseMetadataList(press_releases=press_releases_metadata)
+    return press_releases_metadata
 
 
 def get_press_release_content(url):
@@ -73,10 +215,28 @@ def get_press_release_content(url):
         pr_response = session.get(url, timeout=10)
         pr_response.raise_for_status()
     except requests.RequestException as e:
-        print(f"Failed to fetch {url}: {e}")
+        logger.error(f"Failed to fetch {url}: {e}")
         return PressReleaseContent()
 
-    pr_soup = BeautifulSoup(pr_response.text, "html.parser")
+    return parse_press_release_content(pr_response.text)
+
+
+def get_press_release_contents(urls):
+    """
+    Fetches many press release pages concurrently (see fetch_many) and parses them.
+
+    Returns a dict of url -> PressReleaseContent, empty for pages that failed.
+    """
+    pages = fetch_many(urls)
+    return {
+        url: parse_press_release_content(html) if html else PressReleaseContent()
+        for url, html in pages.items()
+    }
+
+
+def parse_press_release_content(html, parser=None, strained=None):
+    """Extracts the content, publish date and PIB HQ from a press release page."""
+    pr_soup = make_soup(html, CONTENT_STRAINER, parser=parser, strained=strained)
     content = pr_soup.find("div", class_="innner-page-main-about-us-content-right-part")
     date_div = pr_soup.find("div", id="PrDateTime")
 
@@ -134,7 +294,7 @@ def get_press_release_content(url):
 
     if content:
         return PressReleaseContent(
-            content=BeautifulSoup(str(content), "html.parser").prettify(),
+            content=content.prettify(),
             date_published=date_published,
             pib_hq=pib_hq,
         )
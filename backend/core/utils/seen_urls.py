@@ -0,0 +1,54 @@
+from typing import Iterable, Set
+import logging
+import time
+import redis
+from django.conf import settings
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of press release URLs known to be stored in Postgres,
+# scored by the time they were last confirmed
+SEEN_URLS_KEY = "pib:seen_urls"
+
+
+def filter_seen_urls(urls: Iterable[str]) -> Set[str]:
+    """
+    Returns the subset of urls recorded in the seen-URL index within the
+    SEEN_URL_TTL window.
+
+    Only URLs confirmed to exist in the database are ever added to the index,
+    so a hit can be skipped safely. Misses (and any Redis failure) fall
+    through to the database, which stays the source of truth.
+    """
+    urls = list(urls)
+    if not urls:
+        return set()
+
+    cutoff = time.time() - settings.SEEN_URL_TTL
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for url in urls:
+            pipe.zscore(SEEN_URLS_KEY, url)
+        scores = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Seen-URL index unavailable, falling back to DB: {e}")
+        return set()
+
+    return {url for url, score in zip(urls, scores) if score is not None and score >= cutoff}
+
+
+def mark_urls_seen(urls: Iterable[str]) -> None:
+    """Record urls as stored and evict entries older than SEEN_URL_TTL."""
+    now = time.time()
+    mapping = {url: now for url in urls}
+    if not mapping:
+        return
+
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.zadd(SEEN_URLS_KEY, mapping)
+        pipe.zremrangebyscore(SEEN_URLS_KEY, "-inf", now - settings.SEEN_URL_TTL)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Failed to update seen-URL index: {e}")
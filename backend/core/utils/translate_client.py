@@ -1,10 +1,64 @@
-from typing import Optional, Any, Callable
+from typing import Optional, Any, List
+import re
+import threading
 import tenacity
 import httpcore
 
 setattr(httpcore, "SyncHTTPTransport", Any)
 from googletrans import Translator
-import asyncio
+from .http_client import get_event_loop, run_sync
+
+# Segments are packed into one request up to this many characters
+MAX_PACKED_CHARS = 4500
+# Line placed between packed segments, Google Translate leaves it untouched
+SEGMENT_SEPARATOR = "\n\n||||\n\n"
+SEGMENT_SEPARATOR_RE = re.compile(r"\s*\|\|\|\|\s*")
+
+_local = threading.local()
+
+
+def get_translator() -> Translator:
+    """Returns a Translator bound to the current thread's event loop, reused across calls."""
+    loop = get_event_loop()
+    if getattr(_local, "loop", None) is not loop:
+        _local.translator = Translator()
+        _local.loop = loop
+    return _local.translator
+
+
+def _pack_segments(texts: List[str]) -> List[List[int]]:
+    """Groups text indexes into packs of at most MAX_PACKED_CHARS characters."""
+    packs, current, size = [], [], 0
+    for i, text in enumerate(texts):
+        if current and size + len(text) + len(SEGMENT_SEPARATOR) > MAX_PACKED_CHARS:
+            packs.append(current)
+            current, size = [], 0
+        current.append(i)
+        size += len(text) + len(SEGMENT_SEPARATOR)
+    if current:
+        packs.append(current)
+    return packs
+
+
+async def _translate_packed(texts: List[str], target_language: str) -> List[str]:
+    translator = get_translator()
+    packs = _pack_segments(texts)
+    results = await translator.translate(
+        [SEGMENT_SEPARATOR.join(texts[i] for i in pack) for pack in packs],
+        dest=target_language,
+    )
+
+    translated = [None] * len(texts)
+    for pack, result in zip(packs, results):
+        parts = SEGMENT_SEPARATOR_RE.split(result.text.strip())
+        if len(parts) != len(pack):
+            # The separator got mangled, translate this pack one segment at a time
+            singles = await translator.translate([texts[i] for i in pack], dest=target_language)
+            parts = [single.text for single in singles]
+        for i, part in zip(pack, parts):
+            translated[i] = part
+    return translated
+
 
 @tenacity.retry(
     stop=tenacity.stop_after_attempt(3),
@@ -14,6 +68,30 @@ import asyncio
         f"Retry attempt {retry_state.attempt_number} for translation failed, sleeping..."
     ),
 )
+def translate_many(texts: List[str], target_language: str) -> List[str]:
+    """
+    Translates a batch of texts to target language, packing several segments
+    into each Google Translate request.
+
+    One Translator and one event loop are reused per worker thread. Empty and
+    duplicate texts are not sent.
+
+    Args:
+        texts: Texts to translate
+        target_language: Target language code (e.g. 'hi' for Hindi)
+
+    Returns:
+        Translated texts, in the same order as texts
+    """
+    unique_texts = list(dict.fromkeys(t for t in texts if t and t.strip()))
+    if not unique_texts:
+        return list(texts)
+
+    translated = run_sync(_translate_packed(unique_texts, target_language))
+    lookup = dict(zip(unique_texts, translated))
+    return [lookup.get(text, text) for text in texts]
+
+
 def translate_text(text: str, target_language: str) -> Optional[str]:
     """
     Translates text to target language using Google Translate with retry handling
@@ -25,7 +103,4 @@ def translate_text(text: str, target_language: str) -> Optional[str]:
     Returns:
         Translated text if successful, None if translation fails after retries
     """
-    translator = Translator()
-    # Run the async translation synchronously
-    result = asyncio.run(translator.translate(text, dest=target_language))
-    return result.text
+    return translate_many([text], target_language)[0]
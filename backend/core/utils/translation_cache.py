@@ -0,0 +1,80 @@
+from typing import Dict, Iterable
+import hashlib
+import logging
+import re
+import redis
+from django.conf import settings
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_KEY_PREFIX = "translation"
+TRANSLATION_STATS_KEY = "translation:stats"
+
+
+def normalize_text(text: str) -> str:
+    """Collapses whitespace so formatting-only differences share a cache entry."""
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def translation_cache_key(text: str, target_language: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{TRANSLATION_KEY_PREFIX}:{target_language}:{digest}"
+
+
+def get_cached_translations(texts: Iterable[str], target_language: str) -> Dict[str, str]:
+    """
+    Looks texts up in the translation cache with a single MGET.
+
+    Returns a dict of text -> cached translation for the hits only, and
+    records hits/misses for get_translation_cache_stats.
+    """
+    texts = list(dict.fromkeys(texts))
+    if not texts:
+        return {}
+
+    try:
+        client = get_redis()
+        values = client.mget([translation_cache_key(t, target_language) for t in texts])
+        hits = {t: v.decode("utf-8") for t, v in zip(texts, values) if v is not None}
+
+        pipe = client.pipeline(transaction=False)
+        pipe.hincrby(TRANSLATION_STATS_KEY, "hits", len(hits))
+        pipe.hincrby(TRANSLATION_STATS_KEY, "misses", len(texts) - len(hits))
+        pipe.execute()
+        return hits
+    except redis.RedisError as e:
+        logger.warning(f"Translation cache unavailable: {e}")
+        return {}
+
+
+def cache_translations(translations: Dict[str, str], target_language: str) -> None:
+    """Stores text -> translation pairs for TRANSLATION_CACHE_TTL seconds."""
+    if not translations:
+        return
+
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for text, translated in translations.items():
+            if translated:
+                pipe.set(
+                    translation_cache_key(text, target_language),
+                    translated,
+                    ex=settings.TRANSLATION_CACHE_TTL,
+                )
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Failed to store translations in cache: {e}")
+
+
+def get_translation_cache_stats() -> Dict[str, float]:
+    """Returns the cache hit/miss counters and hit rate."""
+    stats = get_redis().hgetall(TRANSLATION_STATS_KEY)
+    hits = int(stats.get(b"hits", 0))
+    misses = int(stats.get(b"misses", 0))
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
@@ -28,12 +28,52 @@ from drf_spectacular.utils import (
 )
 from drf_spectacular.types import OpenApiTypes
 from .constants.choices import LANGUAGE_CHOICES
-from .pagination import CustomPageNumberPagination
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
+from .pagination import PressReleasePagination
 from django.db.models import Subquery, OuterRef
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.db import models
+from django.conf import settings
+from .utils.response_cache import (
+    AUDIENCE_TYPES,
+    CATEGORIES,
+    MINISTRIES,
+    PRESS_RELEASES,
+    cache_response,
+    canonical_query_params,
+    get_or_set_response,
+    response_cache_key,
+    restore_links,
+    strip_links,
+)
+
+
+class CachedListMixin:
+    """
+    Caches list responses until one of cache_tags is invalidated by
+    core.signals, keyed on the canonical query string. Pagination links are
+    rebuilt on every request's own URL.
+    """
+
+    cache_tags = ()
+    cache_timeout = None
+
+    def get_cache_params(self, request):
+        return canonical_query_params(request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        cache_key = response_cache_key(
+            type(self).__name__, self.get_cache_params(request), self.cache_tags
+        )
+
+        def build():
+            response = super(CachedListMixin, self).list(request, *args, **kwargs)
+            # Links are cached relative to the request, see strip_links
+            response.data = strip_links(response.data, request)
+            return response
+
+        response = get_or_set_response(cache_key, build, self.cache_timeout)
+        response.data = restore_links(response.data, request)
+        return response
 
 
 @extend_schema(
@@ -85,8 +125,8 @@ def health_check(request):
         )
     ],
 )
-@cache_page(timeout=60 * 15)
 @api_view(["GET"])
+@cache_response(tags=[PRESS_RELEASES])
 def unique_pib_hq(request):
     # Get unique PIB HQ values, excluding null/empty values and ordering alphabetically
     unique_values = (
@@ -203,6 +243,12 @@ def all_languages(request):
                 location=OpenApiParameter.QUERY,
                 description="Page number for pagination",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Keyset pagination for infinite scroll: pass an empty cursor for the first page, then follow the next links. Pages are not counted.",
+            ),
             OpenApiParameter(
                 name="language",
                 type=OpenApiTypes.STR,
@@ -212,14 +258,61 @@ def all_languages(request):
         ],
     )
 )
-class PressReleaseList(generics.ListAPIView):
+class PressReleaseList(CachedListMixin, generics.ListAPIView):
     serializer_class = PressReleaseSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_class = PressReleaseFilter
     ordering = ["-date_published"]
     ordering_fields = ["date_published"]
     search_fields = ["title", "original_text"]
-    pagination_class = CustomPageNumberPagination
+    pagination_class = PressReleasePagination
+
+    cache_tags = (PRESS_RELEASES, MINISTRIES, CATEGORIES, AUDIENCE_TYPES)
+    cache_timeout = settings.PRESS_RELEASE_LIST_CACHE_TIMEOUT
+
+    def get_filter_params(self):
+        """Query params that narrow down the listed rows."""
+        return [*self.filterset_class.base_filters, "search"]
+
+    def get_cache_params(self, request):
+        """Only the params the list reads, so equivalent query strings share a page."""
+        paginator = self.paginator
+        allowed = [
+            *self.get_filter_params(),
+            "language",
+            paginator.page_size_query_param,
+        ]
+        defaults = {
+            "language": "en",
+            paginator.page_size_query_param: paginator.page_size,
+        }
+        if paginator.uses_cursor(request):
+            # The first keyset page has an empty cursor, keep it apart from page 1
+            mode = "cursor"
+            allowed.append(paginator.cursor_query_param)
+        else:
+            mode = "page"
+            allowed.append(paginator.page_query_param)
+            defaults[paginator.page_query_param] = 1
+        return f"{mode}:" + canonical_query_params(request.query_params, allowed, defaults)
+
+    def get_count_queryset(self):
+        """The listed rows without annotations, prefetches or ordering."""
+        return PressRelease.objects.filter(active=True).order_by()
+
+    def paginate_queryset(self, queryset):
+        # Count on the stripped queryset, filtered exactly like the page, so
+        # the count skips the ArrayAgg GROUP BY and the translation subqueries
+        filtered = bool(
+            canonical_query_params(self.request.query_params, self.get_filter_params())
+        )
+        count_queryset = self.filter_queryset(self.get_count_queryset())
+        if filtered:
+            # Filters over the m2m fields (audience_type_name, category_name)
+            # join one row per matching link, count every release once
+            count_queryset = count_queryset.values("pk").distinct()
+        self.paginator.set_count_queryset(count_queryset, filtered=filtered)
+        return super().paginate_queryset(queryset)
 
     def get_queryset(self):
         # Get requested language
@@ -362,13 +455,16 @@ class PressReleaseDetail(generics.RetrieveAPIView):
     )
 )
 class TranslatedTextList(generics.ListAPIView):
-    queryset = TranslatedText.objects.select_related('press_release').all().order_by("-created_at")
+    # Each release's segments in reading order (streamed points are saved in
+    # any order), the unique_translated_text_segment index serves this order
+    queryset = TranslatedText.objects.select_related('press_release').all().order_by(
+        "press_release", "language", "text_type", "ordinal"
+    )
     serializer_class = TranslatedTextSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ["press_release", "language", "text_type"]
 
 
-@method_decorator(cache_page(60 * 5), name="get")
 @extend_schema_view(
     get=extend_schema(
         tags=["Metadata"],
@@ -384,14 +480,14 @@ class TranslatedTextList(generics.ListAPIView):
         ],
     )
 )
-class MinistryList(generics.ListAPIView):
+class MinistryList(CachedListMixin, generics.ListAPIView):
+    cache_tags = (PRESS_RELEASES, MINISTRIES)
     queryset = Ministry.objects.all().order_by("name")
     serializer_class = MinistrySerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = MinistryFilter
 
 
-@method_decorator(cache_page(60 * 5), name="get")
 @extend_schema_view(
     get=extend_schema(
         tags=["Metadata"],
@@ -407,14 +503,14 @@ class MinistryList(generics.ListAPIView):
         ],
     )
 )
-class AudienceTypeList(generics.ListAPIView):
+class AudienceTypeList(CachedListMixin, generics.ListAPIView):
+    cache_tags = (AUDIENCE_TYPES,)
     queryset = AudienceType.objects.all().order_by("name")
     serializer_class = AudienceTypeSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = AudienceTypeFilter
 
 
-@method_decorator(cache_page(60 * 5), name="get")
 @extend_schema_view(
     get=extend_schema(
         tags=["Metadata"],
@@ -430,7 +526,8 @@ class AudienceTypeList(generics.ListAPIView):
         ],
     )
 )
-class CategoryList(generics.ListAPIView):
+class CategoryList(CachedListMixin, generics.ListAPIView):
+    cache_tags = (CATEGORIES,)
     queryset = Category.objects.all().order_by("name")
     serializer_class = CategorySerializer
     filter_backends = [DjangoFilterBackend]
@@ -458,8 +555,8 @@ class CategoryList(generics.ListAPIView):
         )
     ],
 )
-@cache_page(timeout=60 * 15)
 @api_view(["GET"])
+@cache_response(tags=[PRESS_RELEASES, MINISTRIES])
 def total_count(request):
     press_releases = PressRelease.objects.filter(active=True).count()
     ministries = Ministry.objects.count()